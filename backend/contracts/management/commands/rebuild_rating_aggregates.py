@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from contracts.ratings import rebuild_rating_aggregates
+
+
+class Command(BaseCommand):
+    help = 'Regenerate per-user rating aggregates and rating_avg from verified platform reviews'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_rating_aggregates(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt rating aggregates for {written} user(s).'))
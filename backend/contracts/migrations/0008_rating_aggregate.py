@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_aggregates(apps, schema_editor):
+    from contracts.ratings import rebuild_rating_aggregates
+
+    rebuild_rating_aggregates(
+        apps.get_model('contracts', 'Review'),
+        apps.get_model('contracts', 'RatingAggregate'),
+        apps.get_model('users', 'User'),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_notifications_enabled'),
+        ('contracts', '0007_alter_reviewresponse_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RatingAggregate',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_aggregate', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('stars_1', models.PositiveIntegerField(default=0)),
+                ('stars_2', models.PositiveIntegerField(default=0)),
+                ('stars_3', models.PositiveIntegerField(default=0)),
+                ('stars_4', models.PositiveIntegerField(default=0)),
+                ('stars_5', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_aggregates, migrations.RunPython.noop),
+    ]
@@ -2,11 +2,14 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db.models import Avg
+from talentlink.tracking import FieldTrackerMixin
 
 User = get_user_model()
 
 
-class Contract(models.Model):
+class Contract(FieldTrackerMixin, models.Model):
+    tracked_fields = ('status', 'client_signed', 'freelancer_signed')
+
     STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('active', 'Active'),
@@ -135,7 +138,10 @@ class Contract(models.Model):
 # ============================================================
 # REVIEW MODEL (Enhanced with External Reviews)
 # ============================================================
-class Review(models.Model):
+class Review(FieldTrackerMixin, models.Model):
+    # Fields that decide whether/how a review counts toward RatingAggregate
+    tracked_fields = ('reviewee', 'rating', 'review_type', 'is_verified')
+
     REVIEW_TYPE_CHOICES = (
         ('platform', 'Platform Review'),   # Review from completed contract
         ('external', 'External Review'),   # Review from outside platform
@@ -236,30 +242,41 @@ class Review(models.Model):
     def __str__(self):
         reviewer_name = self.reviewer_name or (self.reviewer.get_full_name() if self.reviewer else 'Anonymous')
         return f"Review for {self.reviewee.get_full_name()} by {reviewer_name}"
-    def update_reviewee_rating(self):
-        """
-        Recalculate and store the main rating for the reviewee
-        based ONLY on verified platform reviews.
-        """
-        if not self.reviewee_id:
-            return
 
-        from django.db.models import Avg  # local import to avoid circulars
 
-        qs = Review.objects.filter(
-            reviewee_id=self.reviewee_id,
-            review_type='platform',
-            is_verified=True,
-        )
+class RatingAggregate(models.Model):
+    """
+    Verified platform-review totals per reviewee, kept by contracts/ratings.py.
+    User.rating_avg is derived from these.
+    """
+    user = models.OneToOneField(
+        User,
+        primary_key=True,
+        related_name='rating_aggregate',
+        on_delete=models.CASCADE
+    )
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
 
-        agg = qs.aggregate(avg_rating=Avg('rating'))
-        avg_rating = agg['avg_rating'] or 0.0
+    # Histogram: number of reviews per star
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
 
-        # If your User model has a rating_avg field, keep it in sync
-        reviewee = self.reviewee
-        if hasattr(reviewee, 'rating_avg'):
-            reviewee.rating_avg = avg_rating
-            reviewee.save(update_fields=['rating_avg'])
+    def __str__(self):
+        return f"{self.user} - {self.average} ({self.rating_count} reviews)"
+
+    @property
+    def average(self):
+        if not self.rating_count:
+            return 0.0
+        return round(self.rating_sum / self.rating_count, 2)
+
+    @property
+    def distribution(self):
+        return {str(star): getattr(self, f'stars_{star}') for star in range(5, 0, -1)}
 
 
 class ReviewResponse(models.Model):
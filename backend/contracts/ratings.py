@@ -0,0 +1,174 @@
+# backend/contracts/ratings.py
+"""
+RatingAggregate bookkeeping.
+
+Only verified platform reviews count. When a review starts or stops
+counting, or its rating or reviewee changes, the affected aggregates move
+by F() deltas (sum, count and one histogram bucket), so concurrent writes
+never overwrite each other. User.rating_avg is then set from the
+aggregate row, with no aggregate over reviews. ``rebuild_rating_aggregates``
+regenerates everything from one grouped query.
+
+``get_review_stats`` serves the review-stats endpoint: one query for any
+number of users, cached per user until one of their reviews changes.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Greatest
+
+from .models import RatingAggregate, Review
+
+STARS = range(1, 6)
+STATS_CACHE_KEY = 'reviewstats:{}'
+
+
+def counted_rating(reviewee_id, rating, review_type, is_verified):
+    """``(reviewee_id, rating)`` if such a review counts toward ratings, else None."""
+    if reviewee_id and is_verified and review_type == 'platform' and rating in STARS:
+        return reviewee_id, rating
+    return None
+
+
+def _current(review):
+    return counted_rating(review.reviewee_id, review.rating, review.review_type, review.is_verified)
+
+
+def _previous(review):
+    if review._state.adding:
+        return None
+    return counted_rating(*(review.previous(name) for name in Review.tracked_fields))
+
+
+def _deltas(rating, delta):
+    return {
+        field: Greatest(F(field) + change, Value(0))
+        for field, change in (
+            ('rating_sum', rating * delta),
+            ('rating_count', delta),
+            (f'stars_{rating}', delta),
+        )
+    }
+
+
+def adjust_rating(user_id, rating, delta):
+    """Add (delta=1) or remove (delta=-1) one ``rating``-star review for ``user_id``."""
+    aggregates = RatingAggregate.objects.filter(pk=user_id)
+    if not aggregates.update(**_deltas(rating, delta)) and delta > 0:
+        try:
+            with transaction.atomic():
+                RatingAggregate.objects.create(
+                    user_id=user_id, rating_sum=rating, rating_count=1, **{f'stars_{rating}': 1}
+                )
+        except IntegrityError:
+            # Created concurrently by another review
+            aggregates.update(**_deltas(rating, delta))
+    sync_rating_avg(user_id)
+
+
+def sync_rating_avg(user_id):
+    aggregate = RatingAggregate.objects.filter(pk=user_id).only('rating_sum', 'rating_count').first()
+    get_user_model().objects.filter(pk=user_id).update(
+        rating_avg=aggregate.average if aggregate else 0.0
+    )
+
+
+def record_review_change(review, deleted=False):
+    """Apply a saved or deleted review to the aggregates it affects."""
+    before = _previous(review)
+    after = None if deleted else _current(review)
+    if before == after:
+        return
+    with transaction.atomic():
+        if before:
+            adjust_rating(*before, -1)
+        if after:
+            adjust_rating(*after, 1)
+
+
+def _stats(row):
+    count = row['rating_aggregate__rating_count'] or 0
+    total = row['rating_aggregate__rating_sum'] or 0
+    return {
+        'total_reviews': count,
+        'average_rating': round(total / count, 2) if count else 0.0,
+        'rating_distribution': {
+            str(star): row[f'rating_aggregate__stars_{star}'] or 0 for star in reversed(STARS)
+        },
+        'platform_reviews': count,
+        'external_reviews': row['external_reviews'],
+    }
+
+
+def get_review_stats(user_ids):
+    """``{user_id: stats}`` for the users in ``user_ids`` that exist."""
+    keys = {user_id: STATS_CACHE_KEY.format(user_id) for user_id in user_ids}
+    cached = cache.get_many(keys.values())
+    stats = {user_id: cached[key] for user_id, key in keys.items() if key in cached}
+
+    missing = [user_id for user_id in keys if user_id not in stats]
+    if missing:
+        rows = (
+            get_user_model().objects.filter(pk__in=missing)
+            .order_by()
+            .values(
+                'pk', 'rating_aggregate__rating_sum', 'rating_aggregate__rating_count',
+                *(f'rating_aggregate__stars_{star}' for star in STARS),
+            )
+            .annotate(external_reviews=Count(
+                'reviews_received',
+                filter=Q(reviews_received__is_verified=True, reviews_received__review_type='external'),
+            ))
+        )
+        fresh = {row['pk']: _stats(row) for row in rows}
+        cache.set_many(
+            {keys[user_id]: value for user_id, value in fresh.items()},
+            settings.REVIEW_STATS_CACHE_SECONDS,
+        )
+        stats.update(fresh)
+    return stats
+
+
+def invalidate_review_stats(*user_ids):
+    cache.delete_many([STATS_CACHE_KEY.format(user_id) for user_id in user_ids if user_id])
+
+
+def rebuild_rating_aggregates(review_model=Review, aggregate_model=RatingAggregate, user_model=None,
+                              using='default', batch_size=1000):
+    """
+    Regenerate every aggregate and User.rating_avg from reviews. Takes
+    models so migrations can pass historical ones. Returns the number of
+    aggregates written.
+    """
+    user_model = user_model or get_user_model()
+    counted = (
+        review_model.objects.using(using)
+        .filter(is_verified=True, review_type='platform', rating__in=STARS)
+        .order_by()
+        .values_list('reviewee_id', 'rating')
+        .annotate(n=Count('pk'))
+    )
+    aggregates = {}
+    for user_id, rating, n in counted:
+        aggregate = aggregates.setdefault(user_id, aggregate_model(user_id=user_id))
+        aggregate.rating_sum += rating * n
+        aggregate.rating_count += n
+        setattr(aggregate, f'stars_{rating}', n)
+
+    def average(aggregate):
+        # Historical models have no properties
+        return round(aggregate.rating_sum / aggregate.rating_count, 2)
+
+    averages = {user_id: average(aggregate) for user_id, aggregate in aggregates.items()}
+    stale = [
+        user_model(pk=user_id, rating_avg=averages.get(user_id, 0.0))
+        for user_id, rating_avg in user_model.objects.using(using).values_list('pk', 'rating_avg').iterator()
+        if rating_avg != averages.get(user_id, 0.0)
+    ]
+    with transaction.atomic(using=using):
+        aggregate_model.objects.using(using).all().delete()
+        aggregate_model.objects.using(using).bulk_create(aggregates.values(), batch_size=batch_size)
+        user_model.objects.using(using).bulk_update(stale, ['rating_avg'], batch_size=batch_size)
+    return len(aggregates)
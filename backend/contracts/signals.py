@@ -1,35 +1,29 @@
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.db.models import Avg
+
 from .models import Review
+from .ratings import invalidate_review_stats, record_review_change
+
+
+def _invalidate_stats(review):
+    # Both reviewees if the review moved; after commit so no stale re-fill
+    user_ids = {review.reviewee_id, review.previous('reviewee')}
+    transaction.on_commit(lambda: invalidate_review_stats(*user_ids))
+
 
 @receiver(post_save, sender=Review)
-@receiver(post_delete, sender=Review)
-def update_user_rating(sender, instance, **kwargs):
+def update_rating_on_save(sender, instance, **kwargs):
     """
-    Automatically recalculate user's average rating 
-    whenever a review is created, updated, or deleted.
-    
-    Only PLATFORM reviews (from completed contracts) count toward ratings.
-    External testimonials are shown separately but don't affect the main rating.
+    Keep the reviewee's RatingAggregate (and rating_avg) in step on create,
+    edit and verification. Only verified PLATFORM reviews count; external
+    testimonials are shown separately but don't affect the main rating.
     """
-    reviewee = instance.reviewee
-    if not reviewee:
-        return
-    
-    # Calculate average rating from ONLY verified platform reviews
-    avg_rating = Review.objects.filter(
-        reviewee=reviewee,
-        is_verified=True,
-        review_type='platform'  # ← Only contract-based reviews count
-    ).aggregate(Avg('rating'))['rating__avg']
-    
-    # Set to 0.0 if no reviews exist yet
-    if avg_rating is None:
-        avg_rating = 0.0
-    
-    # Update the user's rating_avg field
-    reviewee.rating_avg = round(avg_rating, 2)
-    reviewee.save(update_fields=['rating_avg'])
-    
-    print(f"[Rating Updated] {reviewee.email}: {reviewee.rating_avg} ⭐ (Platform reviews only)")
\ No newline at end of file
+    _invalidate_stats(instance)
+    record_review_change(instance)
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_delete(sender, instance, **kwargs):
+    _invalidate_stats(instance)
+    record_review_change(instance, deleted=True)
@@ -1,3 +1,108 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from talentlink.testing import TestCase
+from .models import RatingAggregate, Review
+from .ratings import rebuild_rating_aggregates
+
+User = get_user_model()
+
+
+class RatingAggregateTests(TestCase):
+    def setUp(self):
+        self.reviewer = User.objects.create_user(
+            email='rater@example.com', username='rater', password='pass123', role='client'
+        )
+        self.freelancer = User.objects.create_user(
+            email='rated@example.com', username='rated', password='pass123', role='freelancer'
+        )
+
+    def _review(self, rating, **kwargs):
+        kwargs.setdefault('is_verified', True)
+        return Review.objects.create(reviewer=self.reviewer, reviewee=self.freelancer, rating=rating, **kwargs)
+
+    def _state(self):
+        self.freelancer.refresh_from_db()
+        aggregate = RatingAggregate.objects.get(pk=self.freelancer.pk)
+        return self.freelancer.rating_avg, aggregate.rating_count, aggregate.distribution
+
+    def test_aggregates_follow_review_changes(self):
+        five = self._review(5)
+        three = self._review(3)
+        self._review(1, review_type='external')
+        unverified = self._review(4, is_verified=False)
+        self.assertEqual(self._state(), (4.0, 2, {'5': 1, '4': 0, '3': 1, '2': 0, '1': 0}))
+
+        unverified.is_verified = True
+        unverified.save()
+        three.rating = 2
+        three.save()
+        self.assertEqual(self._state(), (3.67, 3, {'5': 1, '4': 1, '3': 0, '2': 1, '1': 0}))
+
+        five.delete()
+        self.assertEqual(self._state(), (3.0, 2, {'5': 0, '4': 1, '3': 0, '2': 1, '1': 0}))
+
+        # Saving without touching rating fields writes nothing
+        review = Review.objects.get(pk=three.pk)
+        with self.assertNumQueries(1):
+            review.save(update_fields=['comment'])
+
+    def test_rebuild_matches_incremental_updates(self):
+        self._review(5)
+        self._review(2).delete()
+        self._review(4)
+        incremental = self._state()
+
+        RatingAggregate.objects.all().delete()
+        User.objects.filter(pk=self.freelancer.pk).update(rating_avg=1.0)
+        self.assertEqual(rebuild_rating_aggregates(), 1)
+        self.assertEqual(self._state(), incremental)
+
+
+class ReviewStatsTests(TestCase):
+    def setUp(self):
+        self.reviewer = User.objects.create_user(
+            email='stats-rater@example.com', username='statsrater', password='pass123', role='client'
+        )
+        self.users = [
+            User.objects.create_user(email=f'stats{i}@example.com', username=f'stats{i}', password='pass123')
+            for i in range(2)
+        ]
+        self.api = APIClient()
+
+    def _review(self, reviewee, rating, review_type='platform'):
+        return Review.objects.create(
+            reviewer=self.reviewer, reviewee=reviewee, rating=rating, review_type=review_type, is_verified=True
+        )
+
+    def _stats(self, user):
+        return self.api.get('/api/review-stats/for_user/', {'user_id': user.id})
+
+    def test_stats_are_one_query_and_cached_until_a_review_changes(self):
+        self._review(self.users[0], 5)
+        self._review(self.users[0], 4)
+        self._review(self.users[0], 2, review_type='external')
+
+        with self.assertNumQueries(1):
+            response = self._stats(self.users[0])
+        self.assertEqual(response.data['average_rating'], 4.5)
+        self.assertEqual(response.data['rating_distribution'], {'5': 1, '4': 1, '3': 0, '2': 0, '1': 0})
+        self.assertEqual(response.data['external_reviews'], 1)
+        with self.assertNumQueries(0):
+            self._stats(self.users[0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._review(self.users[0], 3)
+        self.assertEqual(self._stats(self.users[0]).data['total_reviews'], 3)
+
+    def test_batch_of_user_ids(self):
+        self._review(self.users[1], 3)
+        ids = f'{self.users[0].id},{self.users[1].id},999999'
+        with self.assertNumQueries(1):
+            response = self.api.get('/api/review-stats/for_user/', {'user_ids': ids})
+        self.assertEqual(set(response.data), {str(self.users[0].id), str(self.users[1].id)})
+        self.assertEqual(response.data[str(self.users[1].id)]['average_rating'], 3.0)
+        self.assertEqual(response.data[str(self.users[0].id)]['total_reviews'], 0)
+
+        self.assertEqual(self.api.get('/api/review-stats/for_user/', {'user_ids': 'a,b'}).status_code, 400)
+        self.assertEqual(self._stats(User(id=999999)).status_code, 404)
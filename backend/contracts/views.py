@@ -1,4 +1,4 @@
-from django.db.models import Q, Avg
+from django.db.models import Q, Count, Max
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -7,6 +7,7 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework import filters
 from rest_framework.exceptions import PermissionDenied, ValidationError  # ✅ NEW
 from .models import Contract, Review, ReviewResponse
+from .ratings import get_review_stats
 from .serializers import (
     ContractSerializer, 
     ReviewSerializer, 
@@ -14,16 +15,20 @@ from .serializers import (
     ExternalReviewCreateSerializer,
     ReviewResponseSerializer
 )
-from notifications.models import Notification
+from notifications.dispatch import notify
+from talentlink.conditional import ConditionalGetMixin
+from talentlink.querytrace import QueryTraceMixin
 
 
-class ContractViewSet(viewsets.ModelViewSet):
+class ContractViewSet(QueryTraceMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Contracts between clients and freelancers.
     Supports signing, activating, and completing contracts.
     """
     serializer_class = ContractSerializer
     permission_classes = [IsAuthenticated]
+    # Reviews change without moving the contract's updated_at (ETag only)
+    conditional_last_modified = False
 
     def get_queryset(self):
         user = self.request.user
@@ -37,9 +42,18 @@ class ContractViewSet(viewsets.ModelViewSet):
             'reviews', 'reviews__reviewer'
         ).order_by('-created_at')
 
-        print(f"[Contracts] User: {user.email}, Count: {queryset.count()}")
+        self.query_trace.stage('contracts', queryset, user_id=user.id)
+        self.query_trace.finish(queryset)
         return queryset
 
+    def get_conditional_aggregates(self):
+        # has_*_reviewed / *_can_review read the contract's reviews
+        return {
+            **super().get_conditional_aggregates(),
+            'reviews_modified': Max('reviews__updated_at'),
+            'reviews': Count('reviews', distinct=True),
+        }
+
     # ✅ NEW: centralised edit permission checks
     def _check_edit_permissions(self, request, contract):
         """
@@ -95,7 +109,7 @@ class ContractViewSet(viewsets.ModelViewSet):
 
         # Notify other party
         other_party = contract.freelancer if user == contract.client else contract.client
-        Notification.objects.create(
+        notify(
             user=other_party,
             type='CONTRACT',
             title='Contract Signed',
@@ -104,13 +118,13 @@ class ContractViewSet(viewsets.ModelViewSet):
         )
 
         if contract.status == 'active':
-            Notification.objects.create(
+            notify(
                 user=contract.client,
                 type='CONTRACT',
                 title='Contract Active',
                 message=f'Contract "{contract}" is now active!'
             )
-            Notification.objects.create(
+            notify(
                 user=contract.freelancer,
                 type='CONTRACT',
                 title='Contract Active',
@@ -156,7 +170,7 @@ class ContractViewSet(viewsets.ModelViewSet):
             job.save()
 
         # Notify freelancer
-        Notification.objects.create(
+        notify(
             user=contract.freelancer,
             type='CONTRACT',
             title='Contract Completed',
@@ -216,15 +230,13 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
         # Send notification for platform reviews
         if review.review_type == 'platform' and review.reviewee:
-            Notification.objects.create(
+            notify(
                 user=review.reviewee,
                 type='REVIEW',
                 title='New Review Received',
                 message=f'You received a {review.rating}-star review from {review.reviewer.get_full_name() or review.reviewer.username}.',
                 metadata={'review_id': review.id}
             )
-            # ✅ Recalculate the reviewee's main rating from platform reviews
-            review.update_reviewee_rating()
         
         # For external reviews, send verification email
         elif review.review_type == 'external':
@@ -332,11 +344,8 @@ class ReviewViewSet(viewsets.ModelViewSet):
         review.verified_at = timezone.now()
         review.save()
 
-        # Update reviewee's rating
-        review.update_reviewee_rating()
-
         # Notify reviewee
-        Notification.objects.create(
+        notify(
             user=review.reviewee,
             type='REVIEW',
             title='External Review Verified',
@@ -353,66 +362,49 @@ class ReviewViewSet(viewsets.ModelViewSet):
 # ============================================================
 # REVIEW STATISTICS
 # ============================================================
+# Max users per batched review-stats request
+STATS_BATCH_LIMIT = 100
+
+
 class ReviewStatsView(viewsets.ViewSet):
-    """Get review statistics for a user"""
+    """
+    Get review statistics for a user. Served from the stored rating
+    aggregates (contracts/ratings.py) in one query, cached per user.
+    """
     permission_classes = [AllowAny]
 
     @action(detail=False, methods=['get'])
     def for_user(self, request):
-        """Get review stats for a specific user"""
+        """
+        Get review stats for a specific user (?user_id=), or for a batch
+        (?user_ids=1,2,3 -> {"1": {...}, ...}; unknown ids are left out).
+        """
+        raw_ids = request.query_params.get('user_ids')
+        if raw_ids is not None:
+            try:
+                user_ids = {int(value) for value in raw_ids.split(',') if value.strip()}
+            except ValueError:
+                raise ValidationError({'user_ids': 'Expected a comma-separated list of ids.'})
+            if len(user_ids) > STATS_BATCH_LIMIT:
+                raise ValidationError({'user_ids': f'At most {STATS_BATCH_LIMIT} ids per request.'})
+            stats = get_review_stats(user_ids)
+            return Response({str(user_id): value for user_id, value in stats.items()})
+
         user_id = request.query_params.get('user_id')
         if not user_id:
             return Response(
                 {'detail': 'user_id parameter is required.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-
         try:
-            from django.contrib.auth import get_user_model
-            User = get_user_model()
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+            user_id = int(user_id)
+        except ValueError:
+            raise ValidationError({'user_id': 'Expected an integer id.'})
+
+        stats = get_review_stats([user_id]).get(user_id)
+        if stats is None:
             return Response(
                 {'detail': 'User not found.'},
                 status=status.HTTP_404_NOT_FOUND
             )
-
-        # ✅ Only platform reviews contribute to main rating & distribution
-        platform_reviews = Review.objects.filter(
-            reviewee=user,
-            is_verified=True,
-            review_type='platform',
-        )
-
-        # ✅ Count external reviews separately (they're testimonials / marketing only)
-        external_reviews = Review.objects.filter(
-            reviewee=user,
-            is_verified=True,
-            review_type='external',
-        )
-
-        # ✅ Compute average directly from platform reviews
-        avg_data = platform_reviews.aggregate(avg_rating=Avg('rating'))
-        average_rating = avg_data['avg_rating'] or 0.0
-
-        # Optional: keep user.rating_avg in sync if the field exists
-        if hasattr(user, 'rating_avg'):
-            if user.rating_avg != average_rating:
-                user.rating_avg = average_rating
-                user.save(update_fields=['rating_avg'])
-
-        stats = {
-            'total_reviews': platform_reviews.count(),
-            'average_rating': average_rating,
-            'rating_distribution': {
-                '5': platform_reviews.filter(rating=5).count(),
-                '4': platform_reviews.filter(rating=4).count(),
-                '3': platform_reviews.filter(rating=3).count(),
-                '2': platform_reviews.filter(rating=2).count(),
-                '1': platform_reviews.filter(rating=1).count(),
-            },
-            'platform_reviews': platform_reviews.count(),
-            'external_reviews': external_reviews.count(),
-        }
-
         return Response(stats)
@@ -0,0 +1,25 @@
+# backend/jobs/filters.py
+"""
+Browse filters for jobs (see talentlink/filters.py).
+"""
+from talentlink.filters import (
+    ContainsFilter,
+    ExactFilter,
+    FilterSet,
+    ListFilter,
+    NumberFilter,
+    PostedWithinFilter,
+    TextSearchFilter,
+)
+
+
+class JobFilterSet(FilterSet):
+    status = ExactFilter()
+    job_type = ListFilter()
+    experience_level = ListFilter()
+    posted_time = PostedWithinFilter()
+    hourly_min = NumberFilter(lookup='hourly_min__gte')
+    hourly_max = NumberFilter(lookup='hourly_max__lte')
+    location = ContainsFilter()
+    location_type = ListFilter()
+    search = TextSearchFilter(fields=('title', 'description'))
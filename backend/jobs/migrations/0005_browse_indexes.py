@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_alter_job_fixed_amount_alter_job_hourly_max_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('visibility', 'public')), fields=['-created_at', '-id'], name='job_public_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('visibility', 'public')), fields=['status', '-created_at'], name='job_public_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['client', '-created_at'], name='job_client_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['client', 'status'], name='job_client_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['freelancer', '-created_at'], name='jobapp_freelancer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-created_at'], name='jobapp_job_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
+from talentlink.tracking import FieldTrackerMixin
 
 User = get_user_model()
 
@@ -61,6 +62,20 @@ class Job(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Browse feed: public only, newest first (keyset on created_at, id)
+            models.Index(
+                fields=['-created_at', '-id'], name='job_public_feed_idx',
+                condition=models.Q(visibility='public'),
+            ),
+            models.Index(
+                fields=['status', '-created_at'], name='job_public_status_idx',
+                condition=models.Q(visibility='public'),
+            ),
+            # Client dashboard (my_jobs) and profile counters
+            models.Index(fields=['client', '-created_at'], name='job_client_created_idx'),
+            models.Index(fields=['client', 'status'], name='job_client_status_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -77,7 +92,9 @@ class JobAttachment(models.Model):
         return f"{self.job_id} - {self.original_name}"
 
 
-class JobApplication(models.Model):
+class JobApplication(FieldTrackerMixin, models.Model):
+    tracked_fields = ('status',)
+
     STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('accepted', 'Accepted'),
@@ -102,6 +119,10 @@ class JobApplication(models.Model):
     class Meta:
         unique_together = ('job', 'freelancer')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['freelancer', '-created_at'], name='jobapp_freelancer_idx'),
+            models.Index(fields=['job', '-created_at'], name='jobapp_job_idx'),
+        ]
 
     def __str__(self):
         return f"Application by {self.freelancer} for {self.job}"
@@ -110,11 +131,9 @@ class JobApplication(models.Model):
         """
         When an application transitions to accepted, mark the job as in_progress.
         """
-        if self.pk and self.status == 'accepted':
-            old_status = JobApplication.objects.get(pk=self.pk).status
-            if old_status != 'accepted':
-                self.job.status = 'in_progress'
-                self.job.save()
+        if self.pk and self.status == 'accepted' and self.previous('status') != 'accepted':
+            self.job.status = 'in_progress'
+            self.job.save()
         super().save(*args, **kwargs)
 
 
@@ -2,6 +2,7 @@
 from rest_framework import serializers
 from .models import Job, JobAttachment
 from .models import JobApplication, JobApplicationAttachment
+from talentlink.fieldsets import SparseFieldsetSerializerMixin
 
 
 class JobAttachmentSerializer(serializers.ModelSerializer):
@@ -19,7 +20,7 @@ class JobAttachmentSerializer(serializers.ModelSerializer):
         return request.build_absolute_uri(url) if request else url
 
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Accept file uploads under 'attachments' key (max 2).
     """
@@ -122,7 +123,7 @@ class JobApplicationAttachmentSerializer(serializers.ModelSerializer):
         return request.build_absolute_uri(url) if request else url
 
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobApplicationSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     freelancer_name = serializers.CharField(source='freelancer.get_full_name', read_only=True)
     job_title = serializers.CharField(source='job.title', read_only=True)
     job_id = serializers.IntegerField(source='job.id', read_only=True)
@@ -2,8 +2,9 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 
-from .models import Job
+from .models import Job, JobAttachment
 from users.models import ClientProfile
+from talentlink.cache import bump_generation
 
 User = get_user_model()
 
@@ -43,3 +44,14 @@ def job_post_save(sender, instance, **kwargs):
 def job_post_delete(sender, instance, **kwargs):
     if instance.client_id:
         _recalculate_client_job_counts(instance.client)
+
+
+# ============================================================
+# RESPONSE CACHE INVALIDATION
+# ============================================================
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=JobAttachment)
+@receiver(post_delete, sender=JobAttachment)
+def job_response_cache_bump(sender, **kwargs):
+    bump_generation('jobs')
@@ -1,3 +1,52 @@
-from django.test import TestCase
+# backend/jobs/tests.py
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.http import QueryDict
+from django.utils import timezone
+
+from talentlink.testing import TestCase
+from .filters import JobFilterSet
+from .models import Job
+
+User = get_user_model()
+
+
+class JobFilterTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='jobs@example.com',
+            username='jobber',
+            password='pass123',
+            role='client'
+        )
+
+    def _job(self, title, **kwargs):
+        return Job.objects.create(client=self.client_user, title=title, description='Something', **kwargs)
+
+    def test_filters_combine_into_one_query(self):
+        match = self._job('Django dev', hourly_min=30, hourly_max=50, location_type='remote')
+        self._job('Django dev cheap', hourly_min=5, hourly_max=10, location_type='remote')
+        old = self._job('Django dev old', hourly_min=30, hourly_max=50, location_type='remote')
+        Job.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=3))
+
+        response = self.client.get('/api/jobs/', {
+            'search': 'django',
+            'hourly_min': '20',
+            'location_type': 'remote,hybrid',
+            'posted_time': '24h',
+        })
+        self.assertEqual([j['id'] for j in response.data['results']], [match.id])
+
+    def test_invalid_numbers_are_rejected(self):
+        response = self.client.get('/api/jobs/', {'hourly_min': 'abc'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('hourly_min', response.data)
+
+        response = self.client.get('/api/projects/', {'job_type': 'hourly', 'hourly_max': '-5'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_parse_is_cached_per_normalized_params(self):
+        first = JobFilterSet.parse(QueryDict('job_type=hourly&page=2&status=open'))
+        second = JobFilterSet.parse(QueryDict('status=open&job_type=hourly&page=3'))
+        self.assertIs(first, second)
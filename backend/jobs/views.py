@@ -3,18 +3,33 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.db.models import Q
-from datetime import datetime, timedelta
 
 from .models import Job, JobApplication, JobApplicationAttachment
+from .filters import JobFilterSet
 from .serializers import JobSerializer, JobApplicationSerializer
+from talentlink.cache import ResponseCacheMixin
+from talentlink.conditional import ConditionalGetMixin
+from talentlink.fieldsets import SparseFieldsetMixin
+from talentlink.pagination import FeedPagination
+from talentlink.querytrace import QueryTraceMixin
 
 
 # ============================================================
 # JOB VIEWSET
 # ============================================================
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(QueryTraceMixin, ResponseCacheMixin, ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = JobSerializer
+    pagination_class = FeedPagination
+    response_cache_namespace = 'jobs'
+    # proposal counts and skills change without moving updated_at (ETag only)
+    conditional_last_modified = False
+
+    # ?fields= / ?omit= (talentlink/fieldsets.py)
+    sparse_relations = {
+        'client_name': {'select': ['client'], 'only': ['client', 'client__first_name', 'client__last_name']},
+        'file_attachments': {'prefetch': ['attachments'], 'only': []},
+    }
+    sparse_required_columns = ('created_at',)
     permission_classes = [AllowAny]
     parser_classes = (MultiPartParser, FormParser, JSONParser)
     queryset = Job.objects.all().select_related('client').prefetch_related('attachments')
@@ -30,6 +45,7 @@ class JobViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         params = self.request.query_params
+        trace = self.query_trace
         
         # FIX: Check if this is a "my_jobs" request from dashboard
         my_jobs = params.get('my_jobs', '').lower() == 'true'
@@ -37,57 +53,18 @@ class JobViewSet(viewsets.ModelViewSet):
         if my_jobs and self.request.user and self.request.user.is_authenticated:
             # Return ALL jobs for this client (no visibility or status filter)
             qs = Job.objects.filter(client=self.request.user)
-            print(f"\n✅ MY_JOBS MODE: Returning {qs.count()} jobs for user {self.request.user.id}")
+            trace.stage('my_jobs', qs, user_id=self.request.user.id)
+            trace.finish(qs)
             return qs
         
-        # Normal public listing
+        # Normal public listing; params parsed and validated by JobFilterSet
         qs = Job.objects.filter(visibility='public')
+        compiled = JobFilterSet.compile(params)
+        if compiled:
+            qs = qs.filter(compiled.q)
 
-        # Filters
-        status_param = params.get('status', '').strip()
-        if status_param:
-            qs = qs.filter(status=status_param)
-
-        job_types = params.get('job_type', '').strip()
-        if job_types:
-            job_type_list = [j.strip() for j in job_types.split(',') if j.strip()]
-            qs = qs.filter(job_type__in=job_type_list)
-
-        experience = params.get('experience_level', '').strip()
-        if experience:
-            exp_list = [e.strip() for e in experience.split(',') if e.strip()]
-            qs = qs.filter(experience_level__in=exp_list)
-
-        posted_time = params.get('posted_time', '').strip()
-        if posted_time:
-            now = datetime.now()
-            if posted_time == '24h':
-                qs = qs.filter(created_at__gte=now - timedelta(hours=24))
-            elif posted_time == 'week':
-                qs = qs.filter(created_at__gte=now - timedelta(days=7))
-            elif posted_time == 'month':
-                qs = qs.filter(created_at__gte=now - timedelta(days=30))
-
-        min_rate = params.get('hourly_min', '').strip()
-        max_rate = params.get('hourly_max', '').strip()
-        if min_rate:
-            qs = qs.filter(hourly_min__gte=float(min_rate))
-        if max_rate:
-            qs = qs.filter(hourly_max__lte=float(max_rate))
-
-        location = params.get('location', '').strip()
-        if location:
-            qs = qs.filter(location__icontains=location)
-
-        location_type = params.get('location_type', '').strip()
-        if location_type:
-            loc_list = [l.strip() for l in location_type.split(',') if l.strip()]
-            qs = qs.filter(location_type__in=loc_list)
-
-        search = params.get('search', '').strip()
-        if search:
-            qs = qs.filter(Q(title__icontains=search) | Q(description__icontains=search)).distinct()
-
+        trace.stage('filtered', qs, params=dict(params))
+        trace.finish(qs)
         return qs
 
     def destroy(self, request, *args, **kwargs):
@@ -100,8 +77,30 @@ class JobViewSet(viewsets.ModelViewSet):
 # ============================================================
 # JOB APPLICATION VIEWSET
 # ============================================================
-class JobApplicationViewSet(viewsets.ModelViewSet):
+class JobApplicationViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = JobApplicationSerializer
+    sparse_relations = {
+        'job_id': {'select': ['job'], 'only': ['job', 'job__id']},
+        'job_title': {'select': ['job'], 'only': ['job', 'job__title']},
+        'client_name': {
+            'select': ['job__client'],
+            'only': ['job', 'job__client', 'job__client__first_name', 'job__client__last_name'],
+        },
+        'freelancer': {
+            'select': ['freelancer', 'freelancer__freelancer_profile'],
+            'prefetch': [
+                'freelancer__freelancer_profile__skills',
+                'freelancer__freelancer_profile__portfolio_files',
+            ],
+            'only': None,
+        },
+        'freelancer_id': {'select': ['freelancer'], 'only': ['freelancer', 'freelancer__id']},
+        'freelancer_name': {
+            'select': ['freelancer'],
+            'only': ['freelancer', 'freelancer__first_name', 'freelancer__last_name'],
+        },
+        'file_attachments': {'prefetch': ['attachments'], 'only': []},
+    }
     permission_classes = [IsAuthenticated]
     parser_classes = (MultiPartParser, FormParser, JSONParser)
 
@@ -118,7 +117,7 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         if job_id:
             queryset = queryset.filter(job_id=job_id)
 
-        return queryset.select_related('job', 'freelancer').prefetch_related('attachments').order_by('-created_at')
+        return queryset.order_by('-created_at')
 
     def create(self, request, *args, **kwargs):
         job_id = request.data.get('job')
@@ -154,8 +153,8 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                 )
 
             try:
-                from notifications.models import Notification
-                Notification.objects.create(
+                from notifications.dispatch import notify
+                notify(
                     user=job.client,
                     type='job_application',
                     title='New Job Application',
@@ -218,8 +217,8 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
             )
 
             try:
-                from notifications.models import Notification
-                Notification.objects.create(
+                from notifications.dispatch import notify
+                notify(
                     user=application.freelancer,
                     type='contract',
                     title='Application Accepted ✅',
@@ -252,8 +251,8 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         application.save()
 
         try:
-            from notifications.models import Notification
-            Notification.objects.create(
+            from notifications.dispatch import notify
+            notify(
                 user=application.freelancer,
                 type='job_application',
                 title='Application Rejected',
@@ -1,7 +1,19 @@
 # backend/messaging/apps.py
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 class MessagingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'messaging'
-    verbose_name = 'Messaging System'
\ No newline at end of file
+    verbose_name = 'Messaging System'
+
+    def ready(self):
+        import messaging.signals  # noqa
+
+        post_migrate.connect(ensure_message_search_index, sender=self)
+
+
+def ensure_message_search_index(sender, using='default', **kwargs):
+    """Create the FTS table on databases built without migrations (pytest --nomigrations)."""
+    from .search import message_index
+    message_index.ensure_schema(using=using)
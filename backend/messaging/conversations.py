@@ -0,0 +1,80 @@
+# backend/messaging/conversations.py
+"""
+Two-party conversations keyed by their canonical pair.
+
+``Conversation(user_low, user_high)`` is unique, so finding a thread is one
+indexed lookup and concurrent first messages can't create duplicates: the
+loser of the race hits IntegrityError and reads the winner's row.
+``merge_duplicate_conversations`` folds conversations created before the key
+existed into one per pair.
+"""
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+
+from .models import Conversation, ConversationSummary, Message
+
+
+def canonical_pair(user_a, user_b):
+    ids = (getattr(user_a, 'pk', user_a), getattr(user_b, 'pk', user_b))
+    return min(ids), max(ids)
+
+
+def get_or_create_conversation(user_a, user_b):
+    low, high = canonical_pair(user_a, user_b)
+    try:
+        return Conversation.objects.get(user_low_id=low, user_high_id=high)
+    except Conversation.DoesNotExist:
+        pass
+    try:
+        with transaction.atomic():
+            conversation = Conversation.objects.create(user_low_id=low, user_high_id=high)
+            conversation.participants.add(low, high)
+            return conversation
+    except IntegrityError:
+        return Conversation.objects.get(user_low_id=low, user_high_id=high)
+
+
+def merge_duplicate_conversations(conversation_model=Conversation, message_model=Message,
+                                  summary_model=ConversationSummary, using='default',
+                                  batch_size=1000):
+    """
+    Give every two-party conversation its pair key, merging duplicates
+    into the keyed (else oldest) one: messages and inbox rows are moved
+    with one UPDATE per pair, then the extras are deleted in batches.
+    Takes models so migrations can pass historical ones. Returns
+    ``(keyed, merged)`` counts.
+    """
+    conversations = conversation_model.objects.using(using)
+    through = conversation_model.participants.through.objects.using(using)
+
+    participants = defaultdict(set)
+    for conversation_id, user_id in through.values_list('conversation_id', 'user_id').iterator():
+        participants[conversation_id].add(user_id)
+    keyed = dict(
+        ((low, high), pk) for pk, low, high in
+        conversations.filter(user_low__isnull=False).values_list('pk', 'user_low_id', 'user_high_id')
+    )
+
+    by_pair = defaultdict(list)
+    for conversation_id, users in participants.items():
+        if 1 <= len(users) <= 2:
+            by_pair[(min(users), max(users))].append(conversation_id)
+
+    to_key, duplicates = [], []
+    with transaction.atomic(using=using):
+        for pair, ids in by_pair.items():
+            keeper = keyed.get(pair, min(ids))
+            extras = [pk for pk in ids if pk != keeper]
+            if extras:
+                message_model.objects.using(using).filter(conversation_id__in=extras).update(conversation_id=keeper)
+                summary_model.objects.using(using).filter(conversation_id__in=extras).update(conversation_id=keeper)
+                duplicates += extras
+            if pair not in keyed:
+                to_key.append(conversation_model(pk=keeper, user_low_id=pair[0], user_high_id=pair[1]))
+
+        for start in range(0, len(duplicates), batch_size):
+            conversations.filter(pk__in=duplicates[start:start + batch_size]).delete()
+        conversations.bulk_update(to_key, ['user_low', 'user_high'], batch_size=batch_size)
+
+    return len(to_key), len(duplicates)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from messaging.conversations import merge_duplicate_conversations
+
+
+class Command(BaseCommand):
+    help = 'Set the canonical pair key on conversations and merge duplicates per pair'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        keyed, merged = merge_duplicate_conversations(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Keyed {keyed} conversation(s), merged {merged} duplicate(s).'
+        ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from messaging.summaries import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = 'Regenerate the inbox (ConversationSummary) table from messages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        written = rebuild_summaries(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} conversation summary row(s).'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from messaging.search import rebuild_message_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index used by message search'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        count = rebuild_message_index(using=options['database'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} message(s).'))
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:17
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_summaries(apps, schema_editor):
+    from messaging.summaries import rebuild_summaries
+
+    rebuild_summaries(
+        apps.get_model('messaging', 'Message'),
+        apps.get_model('messaging', 'ConversationSummary'),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('messaging', '0003_browse_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConversationSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_message_preview', models.CharField(blank=True, max_length=120)),
+                ('last_message_at', models.DateTimeField(blank=True, null=True)),
+                ('last_message_outgoing', models.BooleanField(default=False)),
+                ('unread_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('conversation', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='summaries', to='messaging.conversation')),
+                ('last_message', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='messaging.message')),
+                ('other_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversation_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-last_message_at'],
+                'indexes': [models.Index(fields=['user', '-last_message_at'], name='conversation_summary_inbox_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='conversationsummary',
+            constraint=models.UniqueConstraint(fields=('user', 'other_user'), name='conversation_summary_pair_uniq'),
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def key_and_merge_conversations(apps, schema_editor):
+    from messaging.conversations import merge_duplicate_conversations
+
+    merge_duplicate_conversations(
+        apps.get_model('messaging', 'Conversation'),
+        apps.get_model('messaging', 'Message'),
+        apps.get_model('messaging', 'ConversationSummary'),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('messaging', '0004_conversation_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='user_high',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='user_low',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(key_and_merge_conversations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Separate from 0005 so the backfill commits before the constraint is added
+    # (Postgres refuses ALTER TABLE with pending deferred FK checks)
+
+    dependencies = [
+        ('messaging', '0005_conversation_pair'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='conversation',
+            constraint=models.UniqueConstraint(fields=('user_low', 'user_high'), name='conversation_pair_uniq'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def build_search_index(apps, schema_editor):
+    from messaging.search import message_index
+
+    Message = apps.get_model('messaging', 'Message')
+    alias = schema_editor.connection.alias
+    message_index.rebuild(
+        Message.objects.using(alias).only('id', 'content', 'sender_id', 'recipient_id'),
+        using=alias,
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    from messaging.search import message_index
+
+    message_index.drop_schema(using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0006_conversation_pair_uniq'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_search_index, drop_search_index),
+    ]
@@ -6,11 +6,17 @@ User = get_user_model()
 class Conversation(models.Model):
     """Track conversations between two users"""
     participants = models.ManyToManyField(User, related_name='conversations')
+    # Canonical pair (lower user id first) for get-or-create; see messaging/conversations.py
+    user_low = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    user_high = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['-updated_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user_low', 'user_high'], name='conversation_pair_uniq'),
+        ]
     
     def __str__(self):
         users = self.participants.all()
@@ -29,6 +35,48 @@ class Message(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # (sender|recipient) inbox lookups and per-pair threads in time order
+            models.Index(fields=['sender', 'recipient', 'created_at'], name='message_pair_idx'),
+            models.Index(fields=['recipient', 'sender', 'created_at'], name='message_pair_rev_idx'),
+            models.Index(fields=['conversation', 'created_at'], name='message_conversation_idx'),
+            models.Index(
+                fields=['recipient'], name='message_unread_idx',
+                condition=models.Q(read=False),
+            ),
+        ]
 
     def __str__(self):
-        return f"Message from {self.sender} to {self.recipient}"
\ No newline at end of file
+        return f"Message from {self.sender} to {self.recipient}"
+
+class ConversationSummary(models.Model):
+    """
+    Inbox entry: one row per (user, other party), maintained by
+    messaging/summaries.py as messages are created, read and deleted.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='conversation_summaries')
+    other_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    conversation = models.ForeignKey(
+        Conversation, on_delete=models.SET_NULL, null=True, blank=True, related_name='summaries'
+    )
+    last_message = models.ForeignKey(
+        Message, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    last_message_preview = models.CharField(max_length=120, blank=True)
+    last_message_at = models.DateTimeField(null=True, blank=True)
+    # True when ``user`` sent the last message
+    last_message_outgoing = models.BooleanField(default=False)
+    unread_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-last_message_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'other_user'], name='conversation_summary_pair_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-last_message_at'], name='conversation_summary_inbox_idx'),
+        ]
+
+    def __str__(self):
+        return f"Inbox of {self.user} with {self.other_user}"
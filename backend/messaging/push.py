@@ -0,0 +1,21 @@
+# backend/messaging/push.py
+"""Push new messages to open SSE streams (talentlink/broker.py)."""
+from talentlink.broker import get_broker
+
+from .serializers import MessageSerializer
+
+
+def user_channel(user_id):
+    return f'messages:user:{user_id}'
+
+
+def message_event(data):
+    return data['id'], 'message', data
+
+
+def publish_message(message):
+    """Serialize once and send to both participants (the sender may have other tabs open)."""
+    data = MessageSerializer(message).data
+    broker = get_broker()
+    for user_id in {message.sender_id, message.recipient_id}:
+        broker.publish(user_channel(user_id), data)
@@ -0,0 +1,33 @@
+# backend/messaging/search.py
+from talentlink.search import SearchIndex
+
+from .models import Message
+
+
+class MessageSearchIndex(SearchIndex):
+    """
+    Full-text index over message content, scoped by participant so a
+    user's search is answered from the index without touching other
+    users' messages.
+    """
+    model = Message
+    table = 'messaging_message_search'
+    columns = ('content',)
+    weights = (1.0,)
+    fallback_lookups = ('content__icontains',)
+    scope_column = 'participants'
+
+    def get_values(self, instance):
+        return [instance.content]
+
+    def get_scope(self, instance):
+        return {instance.sender_id, instance.recipient_id}
+
+
+message_index = MessageSearchIndex()
+
+
+def rebuild_message_index(using='default', queryset=None):
+    if queryset is None:
+        queryset = Message.objects.using(using).all()
+    return message_index.rebuild(queryset.only('id', 'content', 'sender_id', 'recipient_id'), using=using)
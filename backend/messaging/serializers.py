@@ -1,5 +1,8 @@
+from django.utils.html import escape
 from rest_framework import serializers
-from .models import Message, Conversation
+
+from talentlink.search import render_highlight
+from .models import Message, Conversation, ConversationSummary
 
 class MessageSerializer(serializers.ModelSerializer):
     sender_name = serializers.CharField(source='sender.get_full_name', read_only=True)
@@ -17,6 +20,26 @@ class MessageSerializer(serializers.ModelSerializer):
             return obj.file_attachment.url
         return None
 
+class MessageSearchResultSerializer(serializers.ModelSerializer):
+    """Search hit: the message without its body, plus a highlighted excerpt."""
+    sender_name = serializers.CharField(source='sender.get_full_name', read_only=True)
+    recipient_name = serializers.CharField(source='recipient.get_full_name', read_only=True)
+    snippet = serializers.SerializerMethodField()
+
+    # Excerpt length when the full-text index is unavailable
+    FALLBACK_SNIPPET_CHARS = 120
+
+    class Meta:
+        model = Message
+        fields = ['id', 'conversation', 'sender', 'sender_name', 'recipient', 'recipient_name',
+                  'created_at', 'snippet']
+
+    def get_snippet(self, obj):
+        snippet = getattr(obj, 'search_snippet', None)
+        if snippet is None:
+            return escape(obj.content[:self.FALLBACK_SNIPPET_CHARS])
+        return render_highlight(snippet)
+
 class ConversationSerializer(serializers.ModelSerializer):
     participants = serializers.StringRelatedField(many=True)
     last_message = serializers.SerializerMethodField()
@@ -29,4 +52,33 @@ class ConversationSerializer(serializers.ModelSerializer):
         last_msg = obj.messages.last()
         if last_msg:
             return MessageSerializer(last_msg).data
-        return None
\ No newline at end of file
+        return None
+
+
+class ConversationSummarySerializer(serializers.ModelSerializer):
+    """Inbox row: the other party (as the chat list shows them) plus the last message."""
+    id = serializers.IntegerField(source='other_user.id', read_only=True)
+    username = serializers.CharField(source='other_user.username', read_only=True)
+    email = serializers.EmailField(source='other_user.email', read_only=True)
+    first_name = serializers.CharField(source='other_user.first_name', read_only=True)
+    last_name = serializers.CharField(source='other_user.last_name', read_only=True)
+    role = serializers.CharField(source='other_user.role', read_only=True)
+    avatar = serializers.ImageField(source='other_user.avatar', read_only=True)
+    last_message = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ConversationSummary
+        fields = [
+            'id', 'username', 'email', 'first_name', 'last_name', 'role', 'avatar',
+            'conversation_id', 'last_message', 'unread_count',
+        ]
+
+    def get_last_message(self, obj):
+        if obj.last_message_at is None:
+            return None
+        return {
+            'id': obj.last_message_id,
+            'preview': obj.last_message_preview,
+            'created_at': obj.last_message_at,
+            'outgoing': obj.last_message_outgoing,
+        }
@@ -0,0 +1,43 @@
+# backend/messaging/signals.py
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Message
+from .push import publish_message
+from .search import message_index
+from .summaries import record_message, refresh_pair
+
+
+@receiver(post_save, sender=Message)
+def push_new_message(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: publish_message(instance))
+
+
+@receiver(post_save, sender=Message)
+def update_conversation_summaries(sender, instance, created, **kwargs):
+    if created:
+        record_message(instance)
+
+
+@receiver(post_delete, sender=Message)
+def refresh_conversation_summaries(sender, instance, origin=None, **kwargs):
+    # Cascades from a user/conversation delete take their summaries with them
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if model is Message:
+        refresh_pair(instance.sender_id, instance.recipient_id)
+
+
+@receiver(post_save, sender=Message)
+def message_search_index_save(sender, instance, created, using, update_fields=None, **kwargs):
+    # read-receipt saves don't touch indexed text
+    if update_fields and 'content' not in update_fields:
+        return
+    message_index.update(instance, using=using)
+
+
+@receiver(post_delete, sender=Message)
+def message_search_index_delete(sender, instance, using, **kwargs):
+    message_index.remove([instance.pk], using=using)
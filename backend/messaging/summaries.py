@@ -0,0 +1,136 @@
+# backend/messaging/summaries.py
+"""
+ConversationSummary bookkeeping.
+
+Each message touches two rows: the sender's (outgoing) and the recipient's,
+whose unread_count goes up with an F() delta. Reading a thread resets the
+reader's count; deleting a message recomputes the pair. ``rebuild_summaries``
+regenerates the whole table from messages in a few grouped queries.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+
+from .models import ConversationSummary, Message
+
+PREVIEW_LENGTH = ConversationSummary._meta.get_field('last_message_preview').max_length
+
+
+def preview(content):
+    return (content or '')[:PREVIEW_LENGTH]
+
+
+def _last_message_fields(message, outgoing):
+    return {
+        'conversation_id': message.conversation_id,
+        'last_message_id': message.id,
+        'last_message_preview': preview(message.content),
+        'last_message_at': message.created_at,
+        'last_message_outgoing': outgoing,
+    }
+
+
+def _upsert(user_id, other_id, fields, unread=0):
+    rows = ConversationSummary.objects.filter(user_id=user_id, other_user_id=other_id)
+    updates = dict(fields, updated_at=timezone.now())
+    if unread:
+        updates['unread_count'] = F('unread_count') + unread
+    if rows.update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            ConversationSummary.objects.create(
+                user_id=user_id, other_user_id=other_id, unread_count=unread, **fields
+            )
+    except IntegrityError:
+        # Created concurrently by another message in the same pair
+        rows.update(**updates)
+
+
+def record_message(message):
+    """Point both participants' summaries at a newly created message."""
+    _upsert(message.sender_id, message.recipient_id, _last_message_fields(message, outgoing=True))
+    if message.recipient_id != message.sender_id:
+        _upsert(
+            message.recipient_id, message.sender_id,
+            _last_message_fields(message, outgoing=False),
+            unread=0 if message.read else 1,
+        )
+
+
+def mark_read(user_id, other_id):
+    ConversationSummary.objects.filter(user_id=user_id, other_user_id=other_id).update(unread_count=0)
+
+
+def refresh_pair(user_id, other_id):
+    """Recompute both summaries of a pair from its messages (e.g. after a delete)."""
+    pair = Message.objects.filter(
+        Q(sender_id=user_id, recipient_id=other_id) | Q(sender_id=other_id, recipient_id=user_id)
+    )
+    last = pair.order_by('-id').first()
+    if last is None:
+        ConversationSummary.objects.filter(
+            Q(user_id=user_id, other_user_id=other_id) | Q(user_id=other_id, other_user_id=user_id)
+        ).delete()
+        return
+
+    unread = dict(
+        pair.filter(read=False).order_by().values_list('recipient_id').annotate(n=Count('id'))
+    )
+    for owner, other in {(user_id, other_id), (other_id, user_id)}:
+        ConversationSummary.objects.update_or_create(
+            user_id=owner, other_user_id=other,
+            defaults={
+                **_last_message_fields(last, outgoing=last.sender_id == owner),
+                'unread_count': unread.get(owner, 0),
+            },
+        )
+
+
+def rebuild_summaries(message_model=Message, summary_model=ConversationSummary, using='default',
+                      batch_size=2000):
+    """
+    Regenerate every summary: last message per pair, unread per recipient
+    and sender, then one bulk_create. Takes models so migrations can pass
+    historical ones. Returns the number of rows written.
+    """
+    messages = message_model.objects.using(using).order_by()
+
+    last = {}
+    for sender_id, recipient_id, last_id in (
+        messages.values_list('sender_id', 'recipient_id').annotate(last_id=Max('id'))
+    ):
+        for key in ((sender_id, recipient_id), (recipient_id, sender_id)):
+            if last_id > last.get(key, 0):
+                last[key] = last_id
+
+    unread = {
+        (recipient_id, sender_id): n
+        for recipient_id, sender_id, n in (
+            messages.filter(read=False)
+            .values_list('recipient_id', 'sender_id')
+            .annotate(n=Count('id'))
+        )
+    }
+
+    ids = sorted(set(last.values()))
+    rows = {}
+    for start in range(0, len(ids), batch_size):
+        chunk = messages.filter(id__in=ids[start:start + batch_size]).only(
+            'id', 'conversation_id', 'sender_id', 'content', 'created_at'
+        )
+        rows.update((m.id, m) for m in chunk)
+
+    summaries = [
+        summary_model(
+            user_id=user_id,
+            other_user_id=other_id,
+            unread_count=unread.get((user_id, other_id), 0),
+            **_last_message_fields(rows[last_id], outgoing=rows[last_id].sender_id == user_id),
+        )
+        for (user_id, other_id), last_id in last.items()
+    ]
+    with transaction.atomic(using=using):
+        summary_model.objects.using(using).all().delete()
+        summary_model.objects.using(using).bulk_create(summaries, batch_size=batch_size)
+    return len(summaries)
@@ -1,3 +1,229 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from talentlink.sse import issue_ticket
+from talentlink.testing import TestCase
+from .conversations import get_or_create_conversation, merge_duplicate_conversations
+from .models import Conversation, ConversationSummary, Message
+from .search import message_index
+from .summaries import rebuild_summaries
+
+User = get_user_model()
+
+
+@override_settings(SSE_MAX_SECONDS=1, SSE_HEARTBEAT_SECONDS=1, SSE_WSGI_STREAMS=True)
+class MessageStreamTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='chat-client@example.com', username='chatclient', password='pass123', role='client'
+        )
+        self.freelancer = User.objects.create_user(
+            email='chat-freelancer@example.com', username='chatfreelancer', password='pass123', role='freelancer'
+        )
+
+    def _ticket(self):
+        return {'ticket': issue_ticket(self.freelancer)}
+
+    def _read(self, response):
+        return ''.join(chunk.decode() for chunk in response.streaming_content)
+
+    def test_requires_ticket(self):
+        response = self.client.get('/api/messages/stream/')
+        self.assertEqual(response.status_code, 401)
+        # JWTs in the query string are not accepted (they end up in logs)
+        token = str(AccessToken.for_user(self.freelancer))
+        response = self.client.get('/api/messages/stream/', {'token': token})
+        self.assertEqual(response.status_code, 401)
+
+    def test_ticket_works_once(self):
+        api = APIClient()
+        api.force_authenticate(self.freelancer)
+        ticket = api.post('/api/stream-ticket/').data['ticket']
+
+        response = self.client.get('/api/messages/stream/', {'ticket': ticket})
+        self.assertEqual(response.status_code, 200)
+        self._read(response)
+        again = self.client.get('/api/messages/stream/', {'ticket': ticket})
+        self.assertEqual(again.status_code, 401)
+
+    @override_settings(SSE_WSGI_STREAMS=False)
+    def test_refused_under_wsgi(self):
+        response = self.client.get('/api/messages/stream/', self._ticket())
+        self.assertEqual(response.status_code, 204)
+
+    def test_new_message_is_pushed(self):
+        response = self.client.get('/api/messages/stream/', self._ticket())
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        api = APIClient()
+        api.force_authenticate(self.client_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            created = api.post('/api/messages/', {'recipient': self.freelancer.id, 'content': 'Hello there'})
+
+        body = self._read(response)
+        self.assertIn(f"id: {created.data['id']}\nevent: message\n", body)
+        self.assertIn('Hello there', body)
+
+    def test_reconnect_replays_missed_messages(self):
+        first = Message.objects.create(sender=self.client_user, recipient=self.freelancer, content='One')
+        Message.objects.create(sender=self.client_user, recipient=self.freelancer, content='Two')
+
+        response = self.client.get(
+            '/api/messages/stream/', self._ticket(), HTTP_LAST_EVENT_ID=str(first.id)
+        )
+        body = self._read(response)
+        self.assertNotIn('"One"', body)
+        self.assertIn('"Two"', body)
+
+
+class ConversationSummaryTests(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(
+            email='alice@example.com', username='alice', password='pass123', role='client'
+        )
+        self.bob = User.objects.create_user(
+            email='bob@example.com', username='bob', password='pass123', role='freelancer'
+        )
+        self.carol = User.objects.create_user(
+            email='carol@example.com', username='carol', password='pass123', role='freelancer'
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.alice)
+
+    def _send(self, sender, recipient, content):
+        return Message.objects.create(sender=sender, recipient=recipient, content=content)
+
+    def _rows(self):
+        return sorted(ConversationSummary.objects.values_list(
+            'user_id', 'other_user_id', 'last_message_id', 'last_message_outgoing', 'unread_count'
+        ))
+
+    def test_inbox_is_ordered_by_recency_with_unread_counts(self):
+        self._send(self.bob, self.alice, 'Hi Alice')
+        self._send(self.bob, self.alice, 'Are you there?')
+        self._send(self.alice, self.carol, 'Hello Carol')
+
+        with self.assertNumQueries(1):
+            response = self.api.get('/api/messages/conversations/')
+        self.assertEqual([row['id'] for row in response.data], [self.carol.id, self.bob.id])
+        self.assertEqual(response.data[1]['unread_count'], 2)
+        self.assertEqual(response.data[1]['last_message']['preview'], 'Are you there?')
+        self.assertTrue(response.data[0]['last_message']['outgoing'])
+
+        self.api.get(f'/api/messages/with/{self.bob.id}/')
+        summary = ConversationSummary.objects.get(user=self.alice, other_user=self.bob)
+        self.assertEqual(summary.unread_count, 0)
+
+    def test_rebuild_matches_incremental_updates(self):
+        self._send(self.bob, self.alice, 'One')
+        self._send(self.alice, self.bob, 'Two')
+        latest = self._send(self.bob, self.alice, 'Three')
+        latest.delete()
+        self._send(self.carol, self.bob, 'Four')
+
+        incremental = self._rows()
+        rebuild_summaries()
+        self.assertEqual(self._rows(), incremental)
+
+
+class MessageHistoryWindowTests(TestCase):
+    def setUp(self):
+        self.me = User.objects.create_user(
+            email='window-me@example.com', username='windowme', password='pass123', role='client'
+        )
+        self.other = User.objects.create_user(
+            email='window-other@example.com', username='windowother', password='pass123', role='freelancer'
+        )
+        self.ids = [
+            Message.objects.create(sender=self.other, recipient=self.me, content=f'm{i}').id
+            for i in range(5)
+        ]
+        self.api = APIClient()
+        self.api.force_authenticate(self.me)
+        self.url = f'/api/messages/with/{self.other.id}/'
+
+    def test_after_id_returns_only_newer_messages(self):
+        response = self.api.get(self.url, {'after_id': self.ids[2]})
+        self.assertEqual([m['id'] for m in response.data], self.ids[3:])
+        self.assertEqual(response['X-Has-More'], 'false')
+
+    def test_before_id_pages_back(self):
+        response = self.api.get(self.url, {'before_id': self.ids[4], 'limit': 2})
+        self.assertEqual([m['id'] for m in response.data], self.ids[2:4])
+        self.assertEqual(response['X-Has-More'], 'true')
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.api.get(self.url, {'after_id': 'abc'})
+        self.assertEqual(response.status_code, 400)
+        response = self.api.get(self.url, {'limit': 0})
+        self.assertEqual(response.status_code, 400)
+        # Rejected requests don't mark the thread read
+        self.assertEqual(Message.objects.filter(recipient=self.me, read=False).count(), 5)
+        self.assertEqual(ConversationSummary.objects.get(user=self.me).unread_count, 5)
+
+
+class ConversationPairTests(TestCase):
+    def setUp(self):
+        self.a = User.objects.create_user(email='pair-a@example.com', username='paira', password='pass123')
+        self.b = User.objects.create_user(email='pair-b@example.com', username='pairb', password='pass123')
+
+    def test_get_or_create_is_order_independent(self):
+        first = get_or_create_conversation(self.a, self.b)
+        with self.assertNumQueries(1):
+            second = get_or_create_conversation(self.b, self.a)
+        self.assertEqual(first, second)
+        self.assertEqual(set(first.participants.all()), {self.a, self.b})
+
+    def test_merge_folds_legacy_duplicates(self):
+        legacy = []
+        for _ in range(3):
+            conversation = Conversation.objects.create()
+            conversation.participants.add(self.a, self.b)
+            Message.objects.create(conversation=conversation, sender=self.a, recipient=self.b, content='hi')
+            legacy.append(conversation)
+
+        self.assertEqual(merge_duplicate_conversations(), (1, 2))
+        keeper = Conversation.objects.get()
+        self.assertEqual(keeper, legacy[0])
+        self.assertEqual((keeper.user_low_id, keeper.user_high_id), tuple(sorted((self.a.id, self.b.id))))
+        self.assertEqual(keeper.messages.count(), 3)
+        self.assertEqual(get_or_create_conversation(self.b, self.a), keeper)
+
+
+class MessageSearchTests(TestCase):
+    def setUp(self):
+        self.me = User.objects.create_user(
+            email='search-me@example.com', username='searchme', password='pass123', role='client'
+        )
+        self.other = User.objects.create_user(
+            email='search-other@example.com', username='searchother', password='pass123', role='freelancer'
+        )
+        self.stranger = User.objects.create_user(
+            email='search-stranger@example.com', username='searchstranger', password='pass123'
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.me)
+
+    def test_search_is_scoped_and_highlighted(self):
+        mine = Message.objects.create(
+            sender=self.other, recipient=self.me, content='The invoice <draft> is attached'
+        )
+        Message.objects.create(sender=self.other, recipient=self.stranger, content='Another invoice')
+        Message.objects.create(sender=self.me, recipient=self.other, content='Thanks!')
+
+        self.assertTrue(message_index.is_ready())
+        response = self.api.get('/api/messages/search/', {'q': 'invoice'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([hit['id'] for hit in response.data['results']], [mine.id])
+        self.assertEqual(
+            response.data['results'][0]['snippet'],
+            'The <mark>invoice</mark> &lt;draft&gt; is attached',
+        )
+
+    def test_deleted_messages_leave_the_index(self):
+        message = Message.objects.create(sender=self.other, recipient=self.me, content='Quarterly report')
+        message.delete()
+        response = self.api.get('/api/messages/search/', {'q': 'quarterly'})
+        self.assertEqual(response.data['count'], 0)
@@ -3,13 +3,43 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import ValidationError
 from django.db.models import Q
 from django.contrib.auth import get_user_model
-from .models import Message, Conversation
-from .serializers import MessageSerializer, ConversationSerializer
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from .conversations import get_or_create_conversation
+from .models import Message, ConversationSummary
+from .push import message_event, user_channel
+from .search import message_index
+from .serializers import (
+    MessageSerializer, ConversationSerializer, ConversationSummarySerializer, MessageSearchResultSerializer
+)
+from .summaries import mark_read
+from talentlink.sse import authenticate, stream_response
 
 User = get_user_model()
 
+# Messages replayed on reconnect; beyond that the client refetches the thread
+STREAM_BACKLOG_LIMIT = 200
+# with_user windows (?after_id / ?before_id / ?limit)
+HISTORY_WINDOW = 50
+MAX_HISTORY_WINDOW = 200
+
+
+def _int_param(params, name, minimum=0):
+    raw = params.get(name)
+    if raw in (None, ''):
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValidationError({name: ['A valid integer is required.']})
+    if value < minimum:
+        raise ValidationError({name: [f'Ensure this value is greater than or equal to {minimum}.']})
+    return value
+
+
 class MessageViewSet(viewsets.ModelViewSet):
     serializer_class = MessageSerializer
     permission_classes = [IsAuthenticated]
@@ -29,15 +59,7 @@ class MessageViewSet(viewsets.ModelViewSet):
             return Response({'detail': 'Recipient not found.'}, status=status.HTTP_404_NOT_FOUND)
         
         # Get or create conversation
-        conversation = Conversation.objects.filter(
-            participants=request.user
-        ).filter(
-            participants=recipient
-        ).first()
-        
-        if not conversation:
-            conversation = Conversation.objects.create()
-            conversation.participants.add(request.user, recipient)
+        conversation = get_or_create_conversation(request.user, recipient)
         
         # Create message
         message = Message.objects.create(
@@ -53,34 +75,89 @@ class MessageViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def conversations(self, request):
-        """Get all users the current user has conversations with"""
-        user = request.user
-        messages = self.get_queryset()
-        users_in_conversation = set()
-        
-        for msg in messages:
-            if msg.sender != user:
-                users_in_conversation.add(msg.sender)
-            else:
-                users_in_conversation.add(msg.recipient)
-        
-        from users.serializers import UserSerializer
-        return Response(UserSerializer(list(users_in_conversation), many=True).data)
+        """Users the current user has conversations with, most recent first"""
+        summaries = ConversationSummary.objects.filter(
+            user=request.user
+        ).select_related('other_user').order_by('-last_message_at')
+        serializer = ConversationSummarySerializer(
+            summaries, many=True, context=self.get_serializer_context()
+        )
+        return Response(serializer.data)
 
     @action(detail=False, methods=['get'], url_path='with/(?P<user_id>[^/.]+)')
     def with_user(self, request, user_id=None):
-        """Get messages with a specific user"""
-        messages = self.get_queryset().filter(
+        """
+        Get messages with a specific user.
+
+        ?after_id=<id>               only messages newer than <id> (polling deltas)
+        ?before_id=<id>&limit=<n>    the <n> messages before <id> (paging back)
+        ?limit=<n>                   the latest <n> messages
+        Windows are ordered by id; X-Has-More says whether older/newer ones remain.
+        Without any of these the whole thread is returned.
+        """
+        # Validated first, so a rejected request leaves the thread unread
+        params = request.query_params
+        after_id = _int_param(params, 'after_id')
+        before_id = _int_param(params, 'before_id')
+        limit = _int_param(params, 'limit', minimum=1)
+
+        thread = self.get_queryset().filter(
             Q(sender_id=user_id, recipient=request.user) |
             Q(sender=request.user, recipient_id=user_id)
-        ).order_by('created_at')
-        
+        )
+
         # Mark messages as read
-        messages.filter(recipient=request.user, read=False).update(read=True)
-        
-        serializer = self.get_serializer(messages, many=True)
-        return Response(serializer.data)
+        if thread.filter(recipient=request.user, read=False).update(read=True):
+            mark_read(request.user.id, user_id)
+
+        thread = thread.select_related('sender', 'recipient')
+
+        if after_id is None and before_id is None and limit is None:
+            serializer = self.get_serializer(thread.order_by('created_at'), many=True)
+            return Response(serializer.data)
+
+        limit = min(limit or HISTORY_WINDOW, MAX_HISTORY_WINDOW)
+        if after_id is not None:
+            window = list(thread.filter(id__gt=after_id).order_by('id')[:limit + 1])
+            has_more = len(window) > limit
+            window = window[:limit]
+        else:
+            if before_id is not None:
+                thread = thread.filter(id__lt=before_id)
+            window = list(thread.order_by('-id')[:limit + 1])
+            has_more = len(window) > limit
+            window = window[:limit][::-1]
+
+        response = Response(self.get_serializer(window, many=True).data)
+        response['X-Has-More'] = 'true' if has_more else 'false'
+        return response
     
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Full-text search over the current user's messages, best match first.
+
+        ?q=<text> (required), ?with=<user_id> to stay within one conversation.
+        Paginated; each hit carries a ``snippet`` with matches in <mark>.
+        """
+        query = request.query_params.get('q', '').strip()
+        if len(query) < 2:
+            return Response({'detail': 'Query too short. Minimum 2 characters.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        messages = message_index.search(self.get_queryset(), query, scope=request.user.id)
+        other_id = _int_param(request.query_params, 'with')
+        if other_id is not None:
+            messages = messages.filter(Q(sender_id=other_id) | Q(recipient_id=other_id))
+        if 'search_rank' in messages.query.annotations:
+            messages = messages.order_by('-search_rank', '-id')
+        else:
+            messages = messages.order_by('-id')
+        messages = message_index.highlight(messages, query, 'content').select_related('sender', 'recipient')
+
+        page = self.paginate_queryset(messages)
+        serializer = MessageSearchResultSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     @action(detail=False, methods=['get'])
     def search_users(self, request):
         """Search for users to message"""
@@ -113,15 +190,7 @@ def get_or_create_thread(request):
         other_user = User.objects.get(id=other_user_id)
         
         # Get or create conversation
-        conversation = Conversation.objects.filter(
-            participants=request.user
-        ).filter(
-            participants=other_user
-        ).first()
-        
-        if not conversation:
-            conversation = Conversation.objects.create()
-            conversation.participants.add(request.user, other_user)
+        conversation = get_or_create_conversation(request.user, other_user)
         
         return Response({
             'id': other_user.id,
@@ -131,4 +200,40 @@ def get_or_create_thread(request):
             }
         })
     except User.DoesNotExist:
-        return Response({'error': 'User not found'}, status=404)
\ No newline at end of file
+        return Response({'error': 'User not found'}, status=404)
+
+
+@require_GET
+def message_stream(request):
+    """
+    SSE: the current user's new messages as they are created.
+
+    ?with=<user_id> limits the stream to one conversation. Authenticate with
+    ?ticket=<ticket from /api/stream-ticket/> (EventSource can't send headers).
+    """
+    user = authenticate(request)
+    if user is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+    other_id = request.GET.get('with')
+    if other_id is not None:
+        try:
+            other_id = int(other_id)
+        except ValueError:
+            return JsonResponse({'with': ['A valid integer is required.']}, status=400)
+
+    def backlog(last_id):
+        if last_id is None:
+            return []
+        messages = Message.objects.filter(Q(sender=user) | Q(recipient=user), id__gt=last_id)
+        if other_id is not None:
+            messages = messages.filter(Q(sender_id=other_id) | Q(recipient_id=other_id))
+        messages = messages.select_related('sender', 'recipient').order_by('id')[:STREAM_BACKLOG_LIMIT]
+        return [message_event(data) for data in MessageSerializer(messages, many=True).data]
+
+    def transform(channel, data):
+        if other_id is not None and other_id not in (data['sender'], data['recipient']):
+            return None
+        return message_event(data)
+
+    return stream_response(request, [user_channel(user.id)], backlog, transform)
@@ -0,0 +1,66 @@
+# backend/notifications/counters.py
+"""
+NotificationCounter bookkeeping.
+
+Creating an unread notification adds one; mark-read, mark-all-read,
+clear-all and deletes subtract what they actually changed, as F() deltas
+so concurrent requests never overwrite each other. Reading the badge is a
+single primary-key lookup. ``reconcile_unread_counts`` repairs drift
+(e.g. rows changed from the admin) from one grouped query.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+
+from .models import Notification, NotificationCounter
+
+
+def get_unread_count(user_id):
+    unread = NotificationCounter.objects.filter(pk=user_id).values_list('unread', flat=True).first()
+    return unread or 0
+
+
+def adjust_unread_count(user_id, delta):
+    if not user_id or not delta:
+        return
+    counters = NotificationCounter.objects.filter(pk=user_id)
+    if counters.update(unread=Greatest(F('unread') + delta, Value(0))) or delta < 0:
+        return
+    try:
+        with transaction.atomic():
+            NotificationCounter.objects.create(user_id=user_id, unread=delta)
+    except IntegrityError:
+        # Created concurrently by another notification
+        counters.update(unread=F('unread') + delta)
+
+
+def reconcile_unread_counts(notification_model=Notification, counter_model=NotificationCounter,
+                            using='default', batch_size=1000):
+    """
+    Recount unread notifications per user and fix every counter that
+    disagrees. Takes models so migrations can pass historical ones.
+    Returns the number of counters written.
+    """
+    actual = dict(
+        notification_model.objects.using(using)
+        .filter(is_read=False)
+        .order_by()
+        .values_list('user_id')
+        .annotate(n=Count('pk'))
+    )
+    stored = dict(counter_model.objects.using(using).values_list('pk', 'unread'))
+
+    stale = [
+        counter_model(pk=user_id, unread=actual.get(user_id, 0))
+        for user_id, unread in stored.items()
+        if unread != actual.get(user_id, 0)
+    ]
+    missing = [
+        counter_model(pk=user_id, unread=unread)
+        for user_id, unread in actual.items()
+        if user_id not in stored
+    ]
+    with transaction.atomic(using=using):
+        counter_model.objects.using(using).bulk_update(stale, ['unread'], batch_size=batch_size)
+        counter_model.objects.using(using).bulk_create(missing, batch_size=batch_size, ignore_conflicts=True)
+    return len(stale) + len(missing)
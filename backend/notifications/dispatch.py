@@ -0,0 +1,109 @@
+# backend/notifications/dispatch.py
+"""
+Notification fan-out.
+
+    notify(user, Notification.TYPE_CONTRACT, title='Contract Signed', message=..., metadata=...)
+
+Inside ``notification_batch()`` notifications are only queued. Every API
+request runs in one (NotificationBatchMiddleware). When the outermost
+batch exits, the queue is flushed once the surrounding transaction
+commits:
+- message, proposal and contract notifications (OPT_OUT_TYPES) to
+  recipients who turned notifications off are dropped, from one preloaded
+  lookup of their preference; other types always go out
+- every row is written with a single bulk_create
+- each recipient's unread counter is bumped once
+- the rows are pushed to open notification streams
+Outside a batch, ``notify`` flushes immediately (still on commit). A batch
+that exits with an exception discards its queue.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from .counters import adjust_unread_count
+from .models import Notification, NotificationCounter
+from .push import publish_notification
+
+_pending = ContextVar('notification_batch', default=None)
+
+# Types the notifications_enabled preference applies to
+OPT_OUT_TYPES = {Notification.TYPE_MESSAGE, Notification.TYPE_PROPOSAL, Notification.TYPE_CONTRACT}
+
+
+def notify(user, type, title='', message='', metadata=None):
+    """Queue a notification for ``user`` (instance or id)."""
+    if user is None:
+        return
+    notification = Notification(
+        user_id=getattr(user, 'pk', user),
+        type=type,
+        title=title,
+        message=message,
+        metadata=metadata,
+    )
+    pending = _pending.get()
+    if pending is None:
+        _schedule_flush([notification])
+    else:
+        pending.append(notification)
+
+
+@contextmanager
+def notification_batch():
+    if _pending.get() is not None:
+        # Nested: the outermost batch flushes
+        yield
+        return
+
+    pending = []
+    token = _pending.set(pending)
+    try:
+        yield
+    finally:
+        _pending.reset(token)
+    _schedule_flush(pending)
+
+
+def _schedule_flush(pending):
+    if pending:
+        transaction.on_commit(lambda: flush(pending))
+
+
+def flush(pending):
+    """Write queued notifications; returns the rows created."""
+    optional = {n.user_id for n in pending if n.type in OPT_OUT_TYPES}
+    opted_out = set(
+        get_user_model().objects
+        .filter(pk__in=optional, notifications_enabled=False)
+        .values_list('pk', flat=True)
+    ) if optional else set()
+    rows = [n for n in pending if n.type not in OPT_OUT_TYPES or n.user_id not in opted_out]
+    if not rows:
+        return []
+
+    with transaction.atomic():
+        created = Notification.objects.bulk_create(rows)
+        for user_id, unread in Counter(n.user_id for n in created if not n.is_read).items():
+            adjust_unread_count(user_id, unread)
+
+    unread = dict(
+        NotificationCounter.objects.filter(pk__in={n.user_id for n in created}).values_list('pk', 'unread')
+    )
+    for notification in created:
+        publish_notification(notification, unread.get(notification.user_id, 0))
+    return created
+
+
+class NotificationBatchMiddleware:
+    """Run each request inside ``notification_batch()``."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with notification_batch():
+            return self.get_response(request)
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from notifications.retention import BATCH_SIZE, compact_notifications, prune_read_notifications
+
+
+class Command(BaseCommand):
+    help = 'Delete old read notifications and collapse repeated ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS,
+                            help='Delete read notifications older than this')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--no-compact', action='store_true',
+                            help='Only prune; leave repeated notifications alone')
+
+    def handle(self, *args, **options):
+        pruned = prune_read_notifications(options['days'], options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted {pruned} read notification(s).'))
+        if not options['no_compact']:
+            collapsed = compact_notifications()
+            self.stdout.write(self.style.SUCCESS(f'Collapsed {collapsed} repeated notification(s).'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from notifications.counters import reconcile_unread_counts
+
+
+class Command(BaseCommand):
+    help = 'Repair per-user unread notification counters from the notifications table'
+
+    def handle(self, *args, **options):
+        repaired = reconcile_unread_counts()
+        self.stdout.write(self.style.SUCCESS(f'Repaired {repaired} unread counter(s).'))
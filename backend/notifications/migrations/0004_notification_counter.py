@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:29
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_counters(apps, schema_editor):
+    from notifications.counters import reconcile_unread_counts
+
+    reconcile_unread_counts(
+        apps.get_model('notifications', 'Notification'),
+        apps.get_model('notifications', 'NotificationCounter'),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_notifications_enabled'),
+        ('notifications', '0003_browse_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
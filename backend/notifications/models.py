@@ -39,6 +39,28 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_read', '-created_at'], name='notif_user_read_idx'),
+            models.Index(fields=['user', '-created_at'], name='notif_user_created_idx'),
+            # Retention sweep: read rows past the cutoff
+            models.Index(
+                fields=['created_at'], name='notif_read_created_idx', condition=models.Q(is_read=True)
+            ),
+        ]
 
     def __str__(self):
         return f'{self.user} - {self.type} - {self.title or ""}'
+
+
+class NotificationCounter(models.Model):
+    """Unread notifications per user, kept by notifications/counters.py."""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        related_name='notification_counter',
+        on_delete=models.CASCADE
+    )
+    unread = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.user} - {self.unread} unread'
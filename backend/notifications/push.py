@@ -0,0 +1,30 @@
+# backend/notifications/push.py
+"""Push new notifications and unread-count changes to open SSE streams."""
+from talentlink.broker import get_broker
+
+from .counters import get_unread_count
+from .serializers import NotificationSerializer
+
+
+def user_channel(user_id):
+    return f'notifications:user:{user_id}'
+
+
+def notification_event(data, unread):
+    return data['id'], 'notification', {'notification': data, 'unread_count': unread}
+
+
+def unread_event(unread):
+    return None, 'unread', {'unread_count': unread}
+
+
+def publish_notification(notification, unread=None):
+    data = NotificationSerializer(notification).data
+    if unread is None:
+        unread = get_unread_count(notification.user_id)
+    event = notification_event(data, unread)
+    get_broker().publish(user_channel(notification.user_id), event)
+
+
+def publish_unread_count(user_id):
+    get_broker().publish(user_channel(user_id), unread_event(get_unread_count(user_id)))
@@ -0,0 +1,85 @@
+# backend/notifications/retention.py
+"""
+Keeping the notifications table small.
+
+- ``delete_in_batches`` removes a queryset in fixed-size chunks, each its
+  own short transaction, and takes deleted unread rows off the counters.
+- ``prune_read_notifications`` drops read notifications older than the
+  retention window.
+- ``compact_notifications`` folds repeats (same user, type, title, text
+  and read state, e.g. many "New message from Ann") into the newest row,
+  with the number folded in ``metadata['count']``.
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from .counters import adjust_unread_count
+from .models import Notification
+
+BATCH_SIZE = 1000
+
+
+def delete_in_batches(queryset, batch_size=BATCH_SIZE):
+    """Delete ``queryset`` ``batch_size`` rows at a time; returns the number deleted."""
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            chunk = list(queryset.order_by().values_list('pk', 'user_id', 'is_read')[:batch_size])
+            if not chunk:
+                return deleted
+            Notification.objects.filter(pk__in=[pk for pk, _, _ in chunk]).delete()
+            for user_id, unread in Counter(u for _, u, read in chunk if not read).items():
+                adjust_unread_count(user_id, -unread)
+        deleted += len(chunk)
+
+
+def prune_read_notifications(days, batch_size=BATCH_SIZE):
+    cutoff = timezone.now() - timedelta(days=days)
+    stale = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+    return delete_in_batches(stale, batch_size)
+
+
+def compact_notifications(queryset=None):
+    """
+    Collapse repeated notifications into their newest row. Returns the
+    number of rows removed.
+    """
+    if queryset is None:
+        queryset = Notification.objects.all()
+    groups = (
+        queryset.order_by()
+        .values('user_id', 'type', 'title', 'message', 'is_read')
+        .annotate(n=Count('id'), keep=Max('id'))
+        .filter(n__gt=1)
+    )
+
+    removed = 0
+    for group in list(groups):
+        keep = group.pop('keep')
+        group.pop('n')
+        with transaction.atomic():
+            rows = list(
+                Notification.objects.select_for_update()
+                .filter(**group)
+                .order_by('-id')
+                .only('id', 'user_id', 'is_read', 'metadata')
+            )
+            keeper = rows[0]
+            if keeper.id != keep or len(rows) < 2:
+                # Changed since the grouping query; the next run picks it up
+                continue
+            repeats = rows[1:]
+            metadata = dict(keeper.metadata or {})
+            metadata['count'] = sum((r.metadata or {}).get('count', 1) for r in rows)
+            keeper.metadata = metadata
+            keeper.save(update_fields=['metadata'])
+
+            Notification.objects.filter(pk__in=[r.id for r in repeats]).delete()
+            if not keeper.is_read:
+                adjust_unread_count(keeper.user_id, -len(repeats))
+        removed += len(repeats)
+    return removed
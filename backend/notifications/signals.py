@@ -1,19 +1,17 @@
 # backend/notifications/signals.py
 # ADD THIS FUNCTION at the top (after imports, before any @receiver)
 
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from messaging.models import Message
 from proposals.models import Proposal
 from contracts.models import Contract
 from notifications.models import Notification
-
-
-# ✅ ADD THIS HELPER FUNCTION
-def should_notify(user):
-    """Check if user has notifications enabled"""
-    return getattr(user, 'notifications_enabled', True)
+from notifications.counters import adjust_unread_count
+from notifications.dispatch import notify
+from notifications.push import publish_notification
 
 
 # ========== 1) MESSAGE NOTIFICATIONS ==========
@@ -28,16 +26,12 @@ def notify_new_message(sender, instance, created, **kwargs):
     if not recipient or not sender_user or recipient == sender_user:
         return
 
-    # ✅ ADD THIS CHECK
-    if not should_notify(recipient):
-        return
-
     metadata = {
         "conversation_user_id": sender_user.id,
         "sender_name": sender_user.get_full_name() or sender_user.email,
     }
 
-    Notification.objects.create(
+    notify(
         user=recipient,
         type=Notification.TYPE_MESSAGE,
         title="New message received",
@@ -46,20 +40,6 @@ def notify_new_message(sender, instance, created, **kwargs):
     )
 
 
-# Store previous status for comparison
-_proposal_previous_status = {}
-
-@receiver(pre_save, sender=Proposal)
-def track_proposal_status(sender, instance, **kwargs):
-    """Track the previous status before save"""
-    if instance.pk:
-        try:
-            old_instance = Proposal.objects.get(pk=instance.pk)
-            _proposal_previous_status[instance.pk] = old_instance.status
-        except Proposal.DoesNotExist:
-            pass
-
-
 # ========== 2) PROPOSAL NOTIFICATIONS ==========
 @receiver(post_save, sender=Proposal)
 def notify_proposal_events(sender, instance, created, **kwargs):
@@ -70,48 +50,42 @@ def notify_proposal_events(sender, instance, created, **kwargs):
     # ---- (a) New proposal submitted → notify client ----
     if created:
         if client and freelancer:
-            # ✅ ADD THIS CHECK
-            if should_notify(client):
-                Notification.objects.create(
-                    user=client,
-                    type=Notification.TYPE_PROPOSAL,
-                    title="New proposal received",
-                    message=(
-                        f"{freelancer.get_full_name() or freelancer.email} "
-                        f"submitted a proposal for \"{project.title}\"."
-                    ),
-                    metadata={
-                        "proposal_id": instance.id,
-                        "project_id": project.id,
-                        "freelancer_id": freelancer.id,
-                        "freelancer_name": freelancer.get_full_name() or freelancer.email,
-                    },
-                )
+            notify(
+                user=client,
+                type=Notification.TYPE_PROPOSAL,
+                title="New proposal received",
+                message=(
+                    f"{freelancer.get_full_name() or freelancer.email} "
+                    f"submitted a proposal for \"{project.title}\"."
+                ),
+                metadata={
+                    "proposal_id": instance.id,
+                    "project_id": project.id,
+                    "freelancer_id": freelancer.id,
+                    "freelancer_name": freelancer.get_full_name() or freelancer.email,
+                },
+            )
         return
 
     # ---- (b) Proposal status changed → notify freelancer ----
-    previous_status = _proposal_previous_status.get(instance.pk)
+    # Proposal tracks status (talentlink/tracking.py); still the pre-save value here
+    previous_status = instance.previous('status')
     current_status = instance.status
     
     if previous_status and previous_status != current_status:
         if current_status in ["accepted", "rejected"] and freelancer and project:
-            # ✅ ADD THIS CHECK
-            if should_notify(freelancer):
-                status_text = "accepted" if current_status == "accepted" else "rejected"
-                Notification.objects.create(
-                    user=freelancer,
-                    type=Notification.TYPE_PROPOSAL,
-                    title=f"Proposal {status_text}",
-                    message=f"Your proposal for \"{project.title}\" was {status_text}.",
-                    metadata={
-                        "proposal_id": instance.id,
-                        "project_id": project.id,
-                        "status": current_status,
-                    },
-                )
-    
-    if instance.pk in _proposal_previous_status:
-        del _proposal_previous_status[instance.pk]
+            status_text = "accepted" if current_status == "accepted" else "rejected"
+            notify(
+                user=freelancer,
+                type=Notification.TYPE_PROPOSAL,
+                title=f"Proposal {status_text}",
+                message=f"Your proposal for \"{project.title}\" was {status_text}.",
+                metadata={
+                    "proposal_id": instance.id,
+                    "project_id": project.id,
+                    "status": current_status,
+                },
+            )
 
 
 # ========== 3) CONTRACT NOTIFICATIONS ==========
@@ -144,24 +118,33 @@ def notify_contract_created(sender, instance, created, **kwargs):
 
     # Notify client
     if client:
-        # ✅ ADD THIS CHECK
-        if should_notify(client):
-            Notification.objects.create(
-                user=client,
-                type=Notification.TYPE_CONTRACT,
-                title=title,
-                message=message,
-                metadata=metadata,
-            )
+        notify(
+            user=client,
+            type=Notification.TYPE_CONTRACT,
+            title=title,
+            message=message,
+            metadata=metadata,
+        )
 
     # Notify freelancer
     if freelancer:
-        # ✅ ADD THIS CHECK
-        if should_notify(freelancer):
-            Notification.objects.create(
-                user=freelancer,
-                type=Notification.TYPE_CONTRACT,
-                title=title,
-                message=message,
-                metadata=metadata,
-            )
\ No newline at end of file
+        notify(
+            user=freelancer,
+            type=Notification.TYPE_CONTRACT,
+            title=title,
+            message=message,
+            metadata=metadata,
+        )
+
+
+# ========== 4) UNREAD COUNTER + PUSH TO OPEN STREAMS ==========
+@receiver(post_save, sender=Notification)
+def count_new_notification(sender, instance, created, **kwargs):
+    if created and not instance.is_read:
+        adjust_unread_count(instance.user_id, 1)
+
+
+@receiver(post_save, sender=Notification)
+def push_new_notification(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: publish_notification(instance))
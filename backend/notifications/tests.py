@@ -1,3 +1,214 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest.mock import patch
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from talentlink.sse import issue_ticket
+from talentlink.testing import TestCase
+from .counters import get_unread_count, reconcile_unread_counts
+from .dispatch import notification_batch, notify
+from .retention import compact_notifications, prune_read_notifications
+from .models import Notification
+
+User = get_user_model()
+
+
+class NotificationConditionalGetTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='poller@example.com',
+            username='poller',
+            password='pass123',
+            role='freelancer'
+        )
+        self.notification = Notification.objects.create(
+            user=self.user, type=Notification.TYPE_SYSTEM, title='Welcome'
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def test_unchanged_list_returns_304(self):
+        first = self.api.get('/api/notifications/')
+        self.assertEqual(first.status_code, 200)
+
+        with self.assertNumQueries(1):
+            again = self.api.get('/api/notifications/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(again.status_code, 304)
+
+    def test_marking_read_changes_etag(self):
+        first = self.api.get('/api/notifications/')
+        self.api.post(f'/api/notifications/{self.notification.id}/mark-read/')
+
+        again = self.api.get('/api/notifications/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(again.status_code, 200)
+        self.assertNotEqual(again['ETag'], first['ETag'])
+
+
+@override_settings(SSE_MAX_SECONDS=1, SSE_HEARTBEAT_SECONDS=1, SSE_WSGI_STREAMS=True)
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='streamer@example.com',
+            username='streamer',
+            password='pass123',
+            role='client'
+        )
+        Notification.objects.create(user=self.user, type=Notification.TYPE_SYSTEM, title='Old')
+
+    def test_pushes_new_notifications_with_unread_count(self):
+        response = self.client.get('/api/notifications/stream/', {'ticket': issue_ticket(self.user)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created = Notification.objects.create(user=self.user, type=Notification.TYPE_SYSTEM, title='Fresh')
+
+        body = ''.join(chunk.decode() for chunk in response.streaming_content)
+        self.assertIn('event: unread\ndata: {"unread_count": 1}', body)
+        self.assertIn(f'id: {created.id}\nevent: notification\n', body)
+        self.assertIn('"unread_count": 2', body)
+
+
+class NotificationCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='badge@example.com',
+            username='badge',
+            password='pass123',
+            role='client'
+        )
+        self.notes = [
+            Notification.objects.create(user=self.user, type=Notification.TYPE_SYSTEM, title=f'N{i}')
+            for i in range(3)
+        ]
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def _badge(self):
+        with self.assertNumQueries(1):
+            return self.api.get('/api/notifications/unread-count/').data['unread_count']
+
+    def test_counter_follows_read_and_clear(self):
+        self.assertEqual(self._badge(), 3)
+
+        self.api.post(f'/api/notifications/{self.notes[0].id}/mark-read/')
+        self.api.post(f'/api/notifications/{self.notes[0].id}/mark-read/')
+        self.assertEqual(self._badge(), 2)
+
+        self.api.post('/api/notifications/mark-all-read/')
+        self.assertEqual(self._badge(), 0)
+
+        Notification.objects.create(user=self.user, type=Notification.TYPE_SYSTEM, title='Late')
+        self.assertEqual(self._badge(), 1)
+        self.api.delete('/api/notifications/clear-all/')
+        self.assertEqual(self._badge(), 0)
+
+    def test_reconcile_repairs_drift(self):
+        Notification.objects.filter(pk=self.notes[0].pk).update(is_read=True)
+        self.assertEqual(get_unread_count(self.user.id), 3)
+
+        self.assertEqual(reconcile_unread_counts(), 1)
+        self.assertEqual(get_unread_count(self.user.id), 2)
+        self.assertEqual(reconcile_unread_counts(), 0)
+
+
+class NotificationBatchTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(email=f'fan{i}@example.com', username=f'fan{i}', password='pass123')
+            for i in range(3)
+        ]
+        User.objects.filter(pk=self.users[2].pk).update(notifications_enabled=False)
+
+    def test_batch_is_written_once_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with notification_batch():
+                for user in self.users:
+                    notify(user, Notification.TYPE_MESSAGE, title='Hello')
+                notify(self.users[0], Notification.TYPE_MESSAGE, title='Again')
+            self.assertFalse(Notification.objects.exists())
+
+        self.assertEqual(len(callbacks), 1)
+        with CaptureQueriesContext(connection) as queries:
+            callbacks[0]()
+        inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "notifications_notification"')]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(Notification.objects.filter(user=self.users[0]).count(), 2)
+        self.assertFalse(Notification.objects.filter(user=self.users[2]).exists())
+        self.assertEqual(get_unread_count(self.users[0].id), 2)
+        self.assertEqual(get_unread_count(self.users[1].id), 1)
+
+    def test_opt_out_only_covers_message_proposal_and_contract(self):
+        opted_out = self.users[2]
+        with self.captureOnCommitCallbacks(execute=True):
+            with notification_batch():
+                for type in (Notification.TYPE_PAYMENT, Notification.TYPE_CONTRACT, Notification.TYPE_REVIEW):
+                    notify(opted_out, type, title=type)
+        self.assertEqual(
+            set(Notification.objects.filter(user=opted_out).values_list('type', flat=True)),
+            {Notification.TYPE_PAYMENT, Notification.TYPE_REVIEW},
+        )
+
+    def test_failed_batch_is_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), notification_batch():
+                notify(self.users[0], Notification.TYPE_SYSTEM, title='Lost')
+                raise RuntimeError
+        self.assertFalse(Notification.objects.exists())
+
+
+class NotificationRetentionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='retention@example.com',
+            username='retention',
+            password='pass123',
+            role='client'
+        )
+
+    def _create(self, n, **fields):
+        fields.setdefault('type', Notification.TYPE_MESSAGE)
+        fields.setdefault('title', 'New message received')
+        fields.setdefault('message', 'New message from Ann')
+        return [Notification.objects.create(user=self.user, **fields) for _ in range(n)]
+
+    def test_prune_deletes_only_old_read_rows(self):
+        old_read = self._create(3, is_read=True)
+        old_unread = self._create(1, title='Unread')
+        Notification.objects.update(created_at=timezone.now() - timedelta(days=100))
+        recent_read = self._create(1, is_read=True, title='Recent')
+
+        self.assertEqual(prune_read_notifications(days=90, batch_size=2), 3)
+        remaining = set(Notification.objects.values_list('id', flat=True))
+        self.assertEqual(remaining, {old_unread[0].id, recent_read[0].id})
+        self.assertFalse(remaining & {n.id for n in old_read})
+        self.assertEqual(get_unread_count(self.user.id), 1)
+
+    def test_compact_collapses_repeats_into_newest_row(self):
+        repeats = self._create(4)
+        self._create(1, message='New message from Bob')
+
+        self.assertEqual(compact_notifications(), 3)
+        keeper = Notification.objects.get(message='New message from Ann')
+        self.assertEqual(keeper.id, repeats[-1].id)
+        self.assertEqual(keeper.metadata['count'], 4)
+        self.assertEqual(get_unread_count(self.user.id), 2)
+
+        self._create(2)
+        self.assertEqual(compact_notifications(), 2)
+        self.assertEqual(Notification.objects.get(message='New message from Ann').metadata['count'], 6)
+
+    def test_clear_all_deletes_in_chunks(self):
+        self._create(5)
+        self._create(2, is_read=True)
+        api = APIClient()
+        api.force_authenticate(self.user)
+        with patch('notifications.views.CLEAR_BATCH_SIZE', 2):
+            response = api.delete('/api/notifications/clear-all/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Notification.objects.exists())
+        self.assertEqual(get_unread_count(self.user.id), 0)
@@ -1,43 +1,122 @@
 from django.shortcuts import render
 
+from django.db import transaction
+from django.db.models import Count, Q
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from .models import Notification
+from .counters import adjust_unread_count, get_unread_count
+from .push import notification_event, publish_unread_count, unread_event, user_channel
+from .retention import delete_in_batches
 from .serializers import NotificationSerializer
+from talentlink.conditional import ConditionalGetMixin
+from talentlink.sse import authenticate, stream_response
 
+# Notifications replayed on reconnect
+STREAM_BACKLOG_LIMIT = 50
+# Rows per DELETE in clear-all
+CLEAR_BATCH_SIZE = 500
 
-class NotificationViewSet(viewsets.ModelViewSet):
+
+class NotificationViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     /notifications/            GET: list current user's notifications
     /notifications/mark-all-read/ POST
     /notifications/{id}/mark-read/ POST
+    /notifications/unread-count/  GET: badge count (one primary-key read)
     """
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Notifications are never edited, only marked read
+    conditional_timestamp_field = 'created_at'
+    conditional_last_modified = False
 
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
 
+    def get_conditional_aggregates(self):
+        return {
+            **super().get_conditional_aggregates(),
+            'unread': Count('pk', filter=Q(is_read=False)),
+        }
+
     def perform_create(self, serializer):
         
         serializer.save(user=self.request.user)
 
+    def perform_update(self, serializer):
+        was_read = serializer.instance.is_read
+        notif = serializer.save()
+        if notif.is_read != was_read:
+            self._unread_changed(1 if was_read else -1)
+
+    def perform_destroy(self, instance):
+        was_unread = not instance.is_read
+        instance.delete()
+        if was_unread:
+            self._unread_changed(-1)
+
+    @action(detail=False, methods=['get'], url_path='unread-count')
+    def unread_count(self, request):
+        return Response({'unread_count': get_unread_count(request.user.id)})
+
     @action(detail=False, methods=['post'], url_path='mark-all-read')
     def mark_all_read(self, request):
-        self.get_queryset().update(is_read=True)
+        marked = self.get_queryset().filter(is_read=False).update(is_read=True)
+        self._unread_changed(-marked)
         return Response({'status': 'ok'})
 
     @action(detail=True, methods=['post'], url_path='mark-read')
     def mark_read(self, request, pk=None):
         notif = self.get_object()
-        notif.is_read = True
-        notif.save()
+        # Conditional UPDATE so two tabs marking the same row only count once
+        if Notification.objects.filter(pk=notif.pk, is_read=False).update(is_read=True):
+            self._unread_changed(-1)
         return Response({'status': 'ok'})
     
     # ✅ NEW: clear all notifications for current user
     @action(detail=False, methods=['delete'], url_path='clear-all')
     def clear_all(self, request):
-        self.get_queryset().delete()
-        return Response({'status': 'ok'})
\ No newline at end of file
+        # Chunked so a large inbox doesn't hold one long lock; counters are
+        # adjusted chunk by chunk
+        if delete_in_batches(self.get_queryset(), CLEAR_BATCH_SIZE):
+            user_id = request.user.id
+            transaction.on_commit(lambda: publish_unread_count(user_id))
+        return Response({'status': 'ok'})
+
+    def _unread_changed(self, delta):
+        if not delta:
+            return
+        user_id = self.request.user.id
+        adjust_unread_count(user_id, delta)
+        # Other open tabs update their badge
+        transaction.on_commit(lambda: publish_unread_count(user_id))
+
+
+@require_GET
+def notification_stream(request):
+    """
+    SSE: an ``unread`` event on connect, then every new notification (with
+    the current unread count) and unread-count changes from other tabs.
+    Authenticate with ?ticket=<ticket from /api/stream-ticket/>.
+    """
+    user = authenticate(request)
+    if user is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+    def backlog(last_id):
+        unread = get_unread_count(user.id)
+        events = [unread_event(unread)]
+        if last_id is not None:
+            missed = Notification.objects.filter(user=user, id__gt=last_id).order_by('id')[:STREAM_BACKLOG_LIMIT]
+            events += [
+                notification_event(data, unread)
+                for data in NotificationSerializer(missed, many=True).data
+            ]
+        return events
+
+    return stream_response(request, [user_channel(user.id)], backlog)
\ No newline at end of file
@@ -1,5 +1,6 @@
 # backend/projects/apps.py
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
@@ -10,6 +11,13 @@ class ProjectsConfig(AppConfig):
         # Import signal handlers
         import projects.signals  # noqa
 
+        post_migrate.connect(ensure_project_search_index, sender=self)
 
 
-
+def ensure_project_search_index(sender, using='default', **kwargs):
+    """
+    Make sure the FTS table exists, including on test databases built
+    without migrations (pytest --nomigrations).
+    """
+    from .search import project_index
+    project_index.ensure_schema(using=using)
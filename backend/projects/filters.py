@@ -0,0 +1,224 @@
+# backend/projects/filters.py
+"""
+Browse filters for projects (see talentlink/filters.py).
+"""
+from django.db.models import Q
+
+from talentlink.filters import (
+    ContainsFilter,
+    ExactFilter,
+    Filter,
+    FilterSet,
+    ListFilter,
+    NamedRangeFilter,
+    NumberFilter,
+    split_list,
+)
+from .models import Project
+
+CATEGORY_GROUPS = {
+    "All - Accounting & Consulting": [
+        "All - Accounting & Consulting",
+        "Personal & Professional Coaching",
+        "Accounting & Bookkeeping",
+        "Financial Planning",
+        "Recruiting & Human Resources",
+        "Management Consulting & Analysis",
+        "Other - Accounting & Consulting"
+    ],
+    "All - Admin Support": [
+        "All - Admin Support",
+        "Data Entry & Transcription Services",
+        "Virtual Assistance",
+        "Project Management",
+        "Market Research & Product Reviews"
+    ],
+    "All - Customer Service": [
+        "All - Customer Service",
+        "Community Management & Tagging",
+        "Customer Service & Tech Support"
+    ],
+    "All - Data Science & Analytics": [
+        "All - Data Science & Analytics",
+        "Data Analysis & Testing",
+        "Data Extraction/ETL",
+        "Data Mining & Management",
+        "AI & Machine Learning"
+    ],
+    "All - Design & Creative": [
+        "All - Design & Creative",
+        "Art & Illustration",
+        "Audio & Music Production",
+        "Branding & Logo Design",
+        "NFT, AR/VR & Game Art",
+        "Graphic, Editorial & Presentation Design",
+        "Performing Arts",
+        "Photography",
+        "Product Design",
+        "Video & Animation"
+    ],
+    "All - Engineering & Architecture": [
+        "All - Engineering & Architecture",
+        "Building & Landscape Architecture",
+        "Chemical Engineering",
+        "Civil & Structural Engineering",
+        "Contract Manufacturing",
+        "Electrical & Electronic Engineering",
+        "Interior & Trade Show Design",
+        "Energy & Mechanical Engineering",
+        "Physical Sciences",
+        "3D Modeling & CAD"
+    ],
+    "All - IT & Networking": [
+        "All - IT & Networking",
+        "Database Management & Administration",
+        "ERP/CRM Software",
+        "Information Security & Compliance",
+        "Network & System Administration",
+        "DevOps & Solution Architecture"
+    ],
+    "All - Legal": [
+        "All - Legal",
+        "Corporate & Contract Law",
+        "International & Immigration Law",
+        "Finance & Tax Law",
+        "Public Law"
+    ],
+    "All - Sales & Marketing": [
+        "All - Sales & Marketing",
+        "Digital Marketing",
+        "Lead Generation & Telemarketing",
+        "Marketing, PR & Brand Strategy"
+    ],
+    "All - Translation": [
+        "All - Translation",
+        "Language Tutoring & Interpretation",
+        "Translation & Localization Services"
+    ],
+    "All - Web, Mobile & Software Dev": [
+        "All - Web, Mobile & Software Dev",
+        "Blockchain, NFT & Cryptocurrency",
+        "AI Apps & Integration",
+        "Desktop Application Development",
+        "Ecommerce Development",
+        "Game Design & Development",
+        "Mobile Development",
+        "Other - Software Development",
+        "Product Management & Scrum",
+        "QA Testing",
+        "Scripts & Utilities",
+        "Web & Mobile Design",
+        "Web Development"
+    ],
+    "All - Writing": [
+        "All - Writing",
+        "Sales & Marketing Copywriting",
+        "Content Writing",
+        "Editing & Proofreading Services",
+        "Professional & Business Writing"
+    ]
+}
+
+PROPOSAL_RANGES = {
+    "0": Q(proposal_count=0),
+    "1_5": Q(proposal_count__gte=1, proposal_count__lte=5),
+    "6_15": Q(proposal_count__gte=6, proposal_count__lte=15),
+    "15_30": Q(proposal_count__gte=15, proposal_count__lte=30),
+    "30_plus": Q(proposal_count__gt=30),
+}
+
+FIXED_PAYMENT_RANGES = {
+    "less_1000": Q(budget_max__lt=1000),
+    "1000_5000": Q(budget_min__gte=1000, budget_max__lte=5000),
+    "5000_10000": Q(budget_min__gte=5000, budget_max__lte=10000),
+    "10000_25000": Q(budget_min__gte=10000, budget_max__lte=25000),
+    "25000_plus": Q(budget_min__gt=25000),
+}
+
+
+def _choice_options(field, choices, extra=()):
+    values = [value for value, _ in choices] + list(extra)
+    return {value: Q(**{field: value}) for value in values}
+
+
+# Options counted by the ``facets`` action, per sidebar facet
+FACET_OPTIONS = {
+    "duration": _choice_options("duration", Project.DURATION_CHOICES),
+    # 'less_30' is the field default and what the browse sidebar sends
+    "hours_per_week": _choice_options("hours_per_week", Project.HOURS_PER_WEEK_CHOICES, extra=["less_30"]),
+    "experience_level": _choice_options("experience_level", Project.EXPERIENCE_LEVEL_CHOICES),
+    "location_type": _choice_options("location_type", Project.LOCATION_TYPE_CHOICES),
+    "job_type": _choice_options("job_type", Project.JOB_TYPE_CHOICES),
+    "category": {group: Q(category__in=subs) for group, subs in CATEGORY_GROUPS.items()},
+    "proposal_range": PROPOSAL_RANGES,
+}
+
+
+# ============================================================
+# PROJECT FILTERS
+# ============================================================
+class JobTypeFilter(Filter):
+    """
+    ``job_type=fixed,hourly`` plus the payment params that narrow each type:
+    ``fixed_payment`` (alias ``budget_range``) for fixed, ``hourly_min`` /
+    ``hourly_max`` for hourly.
+    """
+    def __init__(self, fixed_ranges):
+        super().__init__()
+        self.fixed_ranges = fixed_ranges
+        self.hourly_min = NumberFilter('hourly_min', lookup='hourly_min__gte')
+        self.hourly_max = NumberFilter('hourly_max', lookup='hourly_max__lte')
+
+    @property
+    def params(self):
+        return (self.param, 'fixed_payment', 'budget_range', 'hourly_min', 'hourly_max')
+
+    def parse(self, raw):
+        job_types = tuple(t for t in split_list(raw.get(self.param)) if t in ('fixed', 'hourly'))
+        if not job_types:
+            return None
+        fixed = split_list(raw.get('fixed_payment') or raw.get('budget_range'))
+        fixed = tuple(r for r in fixed if r in self.fixed_ranges)
+        return (job_types, fixed, self.hourly_min.parse(raw), self.hourly_max.parse(raw))
+
+    def build(self, value):
+        job_types, fixed, hourly_min, hourly_max = value
+        q = Q()
+        if 'fixed' in job_types:
+            # No fixed_payment range provided -> include all fixed projects
+            fixed_q = Q()
+            for name in fixed:
+                fixed_q |= self.fixed_ranges[name]
+            q |= Q(job_type='fixed') & fixed_q
+        if 'hourly' in job_types:
+            hourly_q = Q(job_type='hourly')
+            if hourly_min is not None:
+                hourly_q &= self.hourly_min.build(hourly_min)
+            if hourly_max is not None:
+                hourly_q &= self.hourly_max.build(hourly_max)
+            q |= hourly_q
+        return q
+
+
+class CategoryFilter(Filter):
+    """A group name from CATEGORY_GROUPS matches all of its subcategories."""
+    def build(self, value):
+        if value in CATEGORY_GROUPS:
+            return Q(category__in=CATEGORY_GROUPS[value])
+        return Q(category=value)
+
+
+class ProjectFilterSet(FilterSet):
+    facets = ('duration', 'hours_per_week', 'experience_level', 'location_type',
+              'job_type', 'category', 'proposal_range')
+
+    status = ExactFilter()
+    client_location = ContainsFilter()
+
+    duration = ListFilter()
+    hours_per_week = ListFilter()
+    experience_level = ListFilter()
+    location_type = ListFilter()
+    proposal_range = NamedRangeFilter(PROPOSAL_RANGES)
+    job_type = JobTypeFilter(FIXED_PAYMENT_RANGES)
+    category = CategoryFilter()
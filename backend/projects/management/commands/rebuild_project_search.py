@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from projects.search import rebuild_project_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index used by project browse'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        count = rebuild_project_index(using=options['database'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} project(s).'))
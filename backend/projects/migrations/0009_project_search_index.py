@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def build_search_index(apps, schema_editor):
+    from projects.search import project_index
+
+    Project = apps.get_model('projects', 'Project')
+    alias = schema_editor.connection.alias
+    project_index.rebuild(
+        Project.objects.using(alias).prefetch_related('skills_required'),
+        using=alias,
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    from projects.search import project_index
+
+    project_index.drop_schema(using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_alter_project_budget_max_alter_project_budget_min_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(build_search_index, drop_search_index),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:54
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_proposal_count(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Proposal = apps.get_model('proposals', 'Proposal')
+    alias = schema_editor.connection.alias
+
+    counted = (
+        Proposal.objects.using(alias)
+        .filter(project=OuterRef('pk'))
+        .exclude(status='withdrawn')
+        .order_by()
+        .values('project')
+        .annotate(n=Count('pk'))
+        .values('n')
+    )
+    Project.objects.using(alias).update(proposal_count=Coalesce(Subquery(counted), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_project_search_index'),
+        ('proposals', '0004_proposal_availability_proposal_portfolio_links_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='proposal_count',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_proposal_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0010_project_proposal_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('visibility', 'public')), fields=['-created_at', '-id'], name='project_public_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('visibility', 'public')), fields=['status', '-created_at'], name='project_public_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['client', '-created_at'], name='project_client_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['client', 'status'], name='project_client_status_idx'),
+        ),
+    ]
@@ -87,6 +87,9 @@ class Project(models.Model):
     # Attachments
     attachments = models.JSONField(default=list, blank=True)
 
+    # Denormalized: non-withdrawn proposals, maintained by proposals/counters.py
+    proposal_count = models.PositiveIntegerField(default=0, db_index=True)
+
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -94,10 +97,32 @@ class Project(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Browse feed: public only, newest first (keyset on created_at, id)
+            models.Index(
+                fields=['-created_at', '-id'], name='project_public_feed_idx',
+                condition=models.Q(visibility='public'),
+            ),
+            models.Index(
+                fields=['status', '-created_at'], name='project_public_status_idx',
+                condition=models.Q(visibility='public'),
+            ),
+            # Client dashboard (my_projects) and profile counters
+            models.Index(fields=['client', '-created_at'], name='project_client_created_idx'),
+            models.Index(fields=['client', 'status'], name='project_client_status_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # proposal_count only moves through F() deltas; saving a stale
+        # instance must not write an old value back over it. Only the UPDATE
+        # drops it, so inserts, deferred fields and the insert fallback for a
+        # missing row behave as usual.
+        values = [value for value in values if value[0].name != 'proposal_count']
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+
 
 # ============================================================
 # PROJECT ATTACHMENT MODEL
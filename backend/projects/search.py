@@ -0,0 +1,33 @@
+# backend/projects/search.py
+from talentlink.search import SearchIndex
+
+from .models import Project
+
+
+class ProjectSearchIndex(SearchIndex):
+    """
+    Full-text index for the browse page search box.
+    Title matches outrank skill matches, which outrank description matches.
+    """
+    model = Project
+    table = 'projects_project_search'
+    columns = ('title', 'skills', 'description')
+    weights = (10.0, 5.0, 1.0)
+    fallback_lookups = (
+        'title__icontains',
+        'description__icontains',
+        'skills_required__name__icontains',
+    )
+
+    def get_values(self, instance):
+        skills = ' '.join(s.name for s in instance.skills_required.all())
+        return [instance.title, skills, instance.description]
+
+
+project_index = ProjectSearchIndex()
+
+
+def rebuild_project_index(using='default', queryset=None):
+    if queryset is None:
+        queryset = Project.objects.using(using).all()
+    return project_index.rebuild(queryset.prefetch_related('skills_required'), using=using)
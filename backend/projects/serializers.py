@@ -2,6 +2,7 @@ from rest_framework import serializers
 from .models import Project, ProjectAttachment
 from users.models import Skill
 from users.serializers import SkillSerializer
+from talentlink.fieldsets import SparseFieldsetSerializerMixin
 
 class ProjectAttachmentSerializer(serializers.ModelSerializer):
     file_url = serializers.SerializerMethodField()
@@ -18,7 +19,7 @@ class ProjectAttachmentSerializer(serializers.ModelSerializer):
         return request.build_absolute_uri(url) if request else url
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     client_name = serializers.CharField(source='client.get_full_name', read_only=True)
     skills_required = SkillSerializer(many=True, read_only=True)
     skill_ids = serializers.PrimaryKeyRelatedField(
@@ -28,8 +29,6 @@ class ProjectSerializer(serializers.ModelSerializer):
         source='skills_required',
         required=False
     )
-    proposal_count = serializers.SerializerMethodField()
-
     duration_estimate = serializers.CharField(write_only=True, required=False, allow_blank=True)
     file_attachments = ProjectAttachmentSerializer(many=True, read_only=True)
 
@@ -49,9 +48,6 @@ class ProjectSerializer(serializers.ModelSerializer):
         read_only_fields = ['client', 'created_at', 'updated_at', 'status', 'proposal_count']
         extra_kwargs = {'attachments': {'read_only': True}}
 
-    def get_proposal_count(self, obj):
-        return obj.proposals.count()
-
     def validate(self, attrs):
         de = attrs.pop('duration_estimate', None)
         if de:
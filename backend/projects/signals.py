@@ -1,9 +1,11 @@
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 
-from .models import Project
+from .models import Project, ProjectAttachment
+from .search import project_index
 from users.models import ClientProfile
+from talentlink.cache import bump_generation
 
 User = get_user_model()
 
@@ -43,3 +45,55 @@ def project_post_save(sender, instance, **kwargs):
 def project_post_delete(sender, instance, **kwargs):
     if instance.client_id:
         _recalculate_client_project_counts(instance.client)
+
+
+# ============================================================
+# SEARCH INDEX SYNC
+# ============================================================
+@receiver(post_save, sender=Project)
+def project_search_index_save(sender, instance, using, update_fields=None, **kwargs):
+    # status-only saves (proposal accepted, contract completed, ...) don't touch indexed text
+    if update_fields and not {'title', 'description'} & set(update_fields):
+        return
+    project_index.update(instance, using=using)
+
+
+@receiver(post_delete, sender=Project)
+def project_search_index_delete(sender, instance, using, **kwargs):
+    project_index.remove([instance.pk], using=using)
+
+
+@receiver(m2m_changed, sender=Project.skills_required.through)
+def project_search_index_skills(sender, instance, action, reverse, pk_set, using, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        project_index.update(instance, using=using)
+        return
+
+    # skill.project_set.add(...) -> re-index the affected projects
+    projects = Project.objects.using(using).prefetch_related('skills_required')
+    if pk_set:
+        projects = projects.filter(pk__in=pk_set)
+    else:
+        projects = projects.filter(skills_required=instance)
+    for project in projects:
+        project_index.update(project, using=using)
+
+
+# ============================================================
+# RESPONSE CACHE INVALIDATION
+# ============================================================
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ProjectAttachment)
+@receiver(post_delete, sender=ProjectAttachment)
+def project_response_cache_bump(sender, **kwargs):
+    bump_generation('projects')
+
+
+@receiver(m2m_changed, sender=Project.skills_required.through)
+def project_response_cache_skills(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_generation('projects')
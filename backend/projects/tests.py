@@ -1,6 +1,9 @@
 # backend/projects/tests.py
-from django.test import TestCase
+import json
+
 from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from talentlink.testing import TestCase
 from .models import Project
 from users.models import Skill
 
@@ -29,4 +32,262 @@ class ProjectModelTests(TestCase):
         
         self.assertEqual(project.title, 'Test Project')
         self.assertEqual(project.client, self.client_user)
-        self.assertEqual(project.skills_required.count(), 1)
\ No newline at end of file
+        self.assertEqual(project.skills_required.count(), 1)
+
+class ProjectSearchTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='search@example.com',
+            username='searcher',
+            password='pass123',
+            role='client'
+        )
+        self.django_skill = Skill.objects.create(name='Django', slug='django')
+
+    def _project(self, title, description='Something', **kwargs):
+        return Project.objects.create(
+            client=self.client_user,
+            title=title,
+            description=description,
+            budget_min=100,
+            budget_max=200,
+            **kwargs
+        )
+
+    def test_search_ranks_title_matches_first(self):
+        in_description = self._project('Backend help', 'Needs a Django developer')
+        in_title = self._project('Django REST API')
+
+        response = self.client.get('/api/projects/', {'search': 'django'})
+        ids = [p['id'] for p in response.data['results']]
+
+        self.assertEqual(ids, [in_title.id, in_description.id])
+
+    def test_search_index_follows_skills_and_deletes(self):
+        project = self._project('Website rebuild')
+        project.skills_required.add(self.django_skill)
+
+        response = self.client.get('/api/projects/', {'search': 'djan'})
+        self.assertEqual([p['id'] for p in response.data['results']], [project.id])
+
+        project.delete()
+        response = self.client.get('/api/projects/', {'search': 'djan'})
+        self.assertEqual(response.data['results'], [])
+
+    def test_search_ignores_query_syntax(self):
+        self._project('C++ engine work')
+        response = self.client.get('/api/projects/', {'search': 'c++ "engine'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 1)
+
+
+class ProjectQueryTraceTests(TestCase):
+    def setUp(self):
+        client_user = User.objects.create_user(
+            email='trace@example.com',
+            username='tracer',
+            password='pass123',
+            role='client'
+        )
+        Project.objects.create(
+            client=client_user,
+            title='Traced project',
+            description='Something',
+            budget_min=100,
+            budget_max=200,
+        )
+
+    def test_trace_header_only_when_requested(self):
+        # Response cache off, or the traced request is served from the
+        # untraced one above with no queries
+        with self.settings(QUERY_TRACE=False, QUERY_TRACE_ALLOW_HEADER=True, RESPONSE_CACHE_SECONDS=0):
+            response = self.client.get('/api/projects/')
+            self.assertNotIn('X-Query-Trace', response)
+
+            with self.assertLogs('talentlink.querytrace', 'INFO') as logs:
+                response = self.client.get('/api/projects/', HTTP_X_QUERY_TRACE='1')
+            self.assertIn('queries=', response['X-Query-Trace'])
+            trace = json.loads(logs.records[0].getMessage())
+            self.assertGreater(trace['query_count'], 0)
+            self.assertTrue(trace['stages'])
+
+        with self.settings(QUERY_TRACE=False, QUERY_TRACE_ALLOW_HEADER=False, RESPONSE_CACHE_SECONDS=0):
+            with self.assertNoLogs('talentlink.querytrace'):
+                response = self.client.get('/api/projects/', HTTP_X_QUERY_TRACE='1')
+            self.assertNotIn('X-Query-Trace', response)
+
+
+class ProjectCursorPaginationTests(TestCase):
+    def setUp(self):
+        client_user = User.objects.create_user(
+            email='feed@example.com',
+            username='feeder',
+            password='pass123',
+            role='client'
+        )
+        self.projects = [
+            Project.objects.create(
+                client=client_user,
+                title=f'Project {i}',
+                description='Something',
+                budget_min=100,
+                budget_max=200,
+            )
+            for i in range(25)
+        ]
+        # Force ties on created_at so the id tie-breaker is exercised
+        Project.objects.filter(pk__in=[p.pk for p in self.projects[:10]]).update(
+            created_at=self.projects[0].created_at
+        )
+
+    def test_cursor_pages_cover_feed_once_in_order(self):
+        expected = list(Project.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+        response = self.client.get('/api/projects/', {'paginate': 'cursor', 'include_total': 'true'})
+        self.assertEqual(response.data['approximate_count'], 25)
+        self.assertNotIn('count', response.data)
+        seen = [p['id'] for p in response.data['results']]
+
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            self.assertEqual(response.data['approximate_count'], 25)
+            seen += [p['id'] for p in response.data['results']]
+
+        self.assertEqual(seen, expected)
+
+    def test_page_numbers_remain_default_and_bad_cursor_404s(self):
+        response = self.client.get('/api/projects/')
+        self.assertEqual(response.data['count'], 25)
+
+        response = self.client.get('/api/projects/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+
+class ProjectFacetTests(TestCase):
+    def setUp(self):
+        client_user = User.objects.create_user(
+            email='facets@example.com',
+            username='faceter',
+            password='pass123',
+            role='client'
+        )
+        for duration, job_type, level in [
+            ('less_1_month', 'fixed', 'entry'),
+            ('less_1_month', 'hourly', 'expert'),
+            ('1_3_months', 'fixed', 'expert'),
+        ]:
+            Project.objects.create(
+                client=client_user,
+                title='Facet project',
+                description='Something',
+                budget_min=100,
+                budget_max=200,
+                duration=duration,
+                job_type=job_type,
+                experience_level=level,
+            )
+
+    def test_facets_exclude_their_own_filter(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/projects/facets/', {'experience_level': 'expert', 'duration': 'less_1_month'})
+
+        data = response.data
+        self.assertEqual(data['total'], 1)
+        # duration counts ignore the duration filter but apply experience_level
+        self.assertEqual(data['duration']['less_1_month'], 1)
+        self.assertEqual(data['duration']['1_3_months'], 1)
+        # experience_level counts ignore their own filter
+        self.assertEqual(data['experience_level']['entry'], 1)
+        self.assertEqual(data['experience_level']['expert'], 1)
+        self.assertEqual(data['job_type'], {'hourly': 1, 'fixed': 0})
+
+
+class ProjectResponseCacheTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='cached@example.com',
+            username='cacher',
+            password='pass123',
+            role='client'
+        )
+
+    def _project(self, title):
+        return Project.objects.create(
+            client=self.client_user,
+            title=title,
+            description='Something',
+            budget_min=100,
+            budget_max=200,
+        )
+
+    def test_anonymous_list_is_cached_until_projects_change(self):
+        self._project('First')
+
+        first = self.client.get('/api/projects/', {'status': 'open'})
+        second = self.client.get('/api/projects/', {'status': 'open'})
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.data, first.data)
+
+        self._project('Second')
+        third = self.client.get('/api/projects/', {'status': 'open'})
+        self.assertEqual(third['X-Cache'], 'MISS')
+        self.assertEqual(third.data['count'], 2)
+
+    def test_authenticated_requests_bypass_cache(self):
+        api = APIClient()
+        api.force_authenticate(self.client_user)
+        response = api.get('/api/projects/')
+        self.assertNotIn('X-Cache', response)
+
+    def test_cached_response_answers_if_none_match(self):
+        project = self._project('Polled')
+        first = self.client.get(f'/api/projects/{project.id}/')
+        # proposal_count/skills don't move updated_at, so only the ETag is sent
+        self.assertNotIn('Last-Modified', first)
+
+        again = self.client.get(f'/api/projects/{project.id}/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again['X-Cache'], 'HIT')
+
+        project.title = 'Polled (edited)'
+        project.save()
+        changed = self.client.get(f'/api/projects/{project.id}/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+
+
+class ProjectSparseFieldsetTests(TestCase):
+    def setUp(self):
+        client_user = User.objects.create_user(
+            email='cards@example.com',
+            username='carder',
+            password='pass123',
+            role='client',
+            first_name='Card',
+            last_name='Owner',
+        )
+        skill = Skill.objects.create(name='Vue', slug='vue')
+        for i in range(3):
+            project = Project.objects.create(
+                client=client_user,
+                title=f'Card {i}',
+                description='Something',
+                budget_min=100,
+                budget_max=200,
+            )
+            project.skills_required.add(skill)
+
+    def test_card_fields_skip_prefetches(self):
+        # ETag aggregate + COUNT + page
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/projects/', {'fields': 'id,title,client_name,budget_max'})
+        row = response.data['results'][0]
+        self.assertEqual(set(row), {'id', 'title', 'client_name', 'budget_max'})
+        self.assertEqual(row['client_name'], 'Card Owner')
+
+    def test_full_representation_prefetches_relations(self):
+        # ETag aggregate + COUNT + page (with client joined) + skills + attachments
+        with self.assertNumQueries(5):
+            response = self.client.get('/api/projects/')
+        self.assertEqual(response.data['results'][0]['skills_required'][0]['name'], 'Vue')
@@ -1,8 +1,18 @@
-from django.db.models import Q, Count
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db.models import Count
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from .models import Project
 from .serializers import ProjectSerializer
+from .filters import FACET_OPTIONS, ProjectFilterSet
+from .search import project_index
+from talentlink.cache import ResponseCacheMixin, get_generation
+from talentlink.conditional import ConditionalGetMixin
+from talentlink.fieldsets import SparseFieldsetMixin
+from talentlink.pagination import FeedPagination
+from talentlink.querytrace import QueryTraceMixin
 
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -10,112 +20,23 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from proposals.serializers import ProposalSerializer
 from proposals.models import Proposal
 
-CATEGORY_GROUPS = {
-    "All - Accounting & Consulting": [
-        "All - Accounting & Consulting",
-        "Personal & Professional Coaching",
-        "Accounting & Bookkeeping",
-        "Financial Planning",
-        "Recruiting & Human Resources",
-        "Management Consulting & Analysis",
-        "Other - Accounting & Consulting"
-    ],
-    "All - Admin Support": [
-        "All - Admin Support",
-        "Data Entry & Transcription Services",
-        "Virtual Assistance",
-        "Project Management",
-        "Market Research & Product Reviews"
-    ],
-    "All - Customer Service": [
-        "All - Customer Service",
-        "Community Management & Tagging",
-        "Customer Service & Tech Support"
-    ],
-    "All - Data Science & Analytics": [
-        "All - Data Science & Analytics",
-        "Data Analysis & Testing",
-        "Data Extraction/ETL",
-        "Data Mining & Management",
-        "AI & Machine Learning"
-    ],
-    "All - Design & Creative": [
-        "All - Design & Creative",
-        "Art & Illustration",
-        "Audio & Music Production",
-        "Branding & Logo Design",
-        "NFT, AR/VR & Game Art",
-        "Graphic, Editorial & Presentation Design",
-        "Performing Arts",
-        "Photography",
-        "Product Design",
-        "Video & Animation"
-    ],
-    "All - Engineering & Architecture": [
-        "All - Engineering & Architecture",
-        "Building & Landscape Architecture",
-        "Chemical Engineering",
-        "Civil & Structural Engineering",
-        "Contract Manufacturing",
-        "Electrical & Electronic Engineering",
-        "Interior & Trade Show Design",
-        "Energy & Mechanical Engineering",
-        "Physical Sciences",
-        "3D Modeling & CAD"
-    ],
-    "All - IT & Networking": [
-        "All - IT & Networking",
-        "Database Management & Administration",
-        "ERP/CRM Software",
-        "Information Security & Compliance",
-        "Network & System Administration",
-        "DevOps & Solution Architecture"
-    ],
-    "All - Legal": [
-        "All - Legal",
-        "Corporate & Contract Law",
-        "International & Immigration Law",
-        "Finance & Tax Law",
-        "Public Law"
-    ],
-    "All - Sales & Marketing": [
-        "All - Sales & Marketing",
-        "Digital Marketing",
-        "Lead Generation & Telemarketing",
-        "Marketing, PR & Brand Strategy"
-    ],
-    "All - Translation": [
-        "All - Translation",
-        "Language Tutoring & Interpretation",
-        "Translation & Localization Services"
-    ],
-    "All - Web, Mobile & Software Dev": [
-        "All - Web, Mobile & Software Dev",
-        "Blockchain, NFT & Cryptocurrency",
-        "AI Apps & Integration",
-        "Desktop Application Development",
-        "Ecommerce Development",
-        "Game Design & Development",
-        "Mobile Development",
-        "Other - Software Development",
-        "Product Management & Scrum",
-        "QA Testing",
-        "Scripts & Utilities",
-        "Web & Mobile Design",
-        "Web Development"
-    ],
-    "All - Writing": [
-        "All - Writing",
-        "Sales & Marketing Copywriting",
-        "Content Writing",
-        "Editing & Proofreading Services",
-        "Professional & Business Writing"
-    ]
-}
+FACET_CACHE_SECONDS = 60
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(QueryTraceMixin, ResponseCacheMixin, ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = ProjectSerializer
+    pagination_class = FeedPagination
+    response_cache_namespace = 'projects'
+    # proposal_count and skills change without moving updated_at (ETag only)
+    conditional_last_modified = False
+
+    # ?fields= / ?omit= (talentlink/fieldsets.py)
+    sparse_relations = {
+        'client_name': {'select': ['client'], 'only': ['client', 'client__first_name', 'client__last_name']},
+        'skills_required': {'prefetch': ['skills_required'], 'only': []},
+        'file_attachments': {'prefetch': ['file_attachments'], 'only': []},
+    }
+    sparse_required_columns = ('created_at',)
 
     permission_classes = [AllowAny]
 
@@ -133,7 +54,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         Allow unauthenticated users to list and retrieve projects.
         Require authentication for create, update, delete.
         """
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'facets']:
             return [AllowAny()]
         return [IsAuthenticated()]
 
@@ -145,8 +66,15 @@ class ProjectViewSet(viewsets.ModelViewSet):
         """
         Filter projects based on multiple criteria.
         Returns queryset of filtered projects.
+
+        Params are parsed and validated by ProjectFilterSet (projects/filters.py);
+        invalid numbers are rejected with a 400.
+
+        Send ``X-Query-Trace: 1`` to get per-stage counts, SQL and EXPLAIN
+        (see talentlink/querytrace.py); otherwise no extra queries run.
         """
         params = self.request.query_params
+        trace = self.query_trace
 
         #  FIX: Check if this is a "my_projects" request from dashboard
         my_projects = params.get('my_projects', '').lower() == 'true'
@@ -154,222 +82,86 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if my_projects and self.request.user and self.request.user.is_authenticated:
             # Return ALL projects for this client (no visibility or status filter)
             qs = Project.objects.filter(client=self.request.user)
-            qs = qs.annotate(num_proposals=Count('proposals'))
-            
-            print(f"\n✅ MY_PROJECTS MODE: Returning {qs.count()} projects for user {self.request.user.id}")
+            trace.stage('my_projects', qs, user_id=self.request.user.id)
+            trace.finish(qs)
             return qs
 
         # Normal public listing (for browse page)
-        qs = Project.objects.filter(visibility='public')
-        qs = qs.annotate(num_proposals=Count('proposals'))
-
-        # ==========================================
-        # DEBUG LOGGING (remove in production)
-        # ==========================================
-        print("\n" + "="*50)
-        print("FILTER REQUEST")
-        print("="*50)
-        print(f"Initial queryset count: {qs.count()}")
-        print(f"Params received: {dict(params)}")
-        print("-"*50)
-
-        # ==========================================
-        # 1. STATUS FILTER
-        # ==========================================
-        status = params.get("status", "").strip()
-        if status:
-            qs = qs.filter(status=status)
-            print(f"✓ Status filter '{status}': {qs.count()} projects")
-
-        # ==========================================
-        # 2. DURATION FILTER (Project Length)
-        # ==========================================
-        duration = params.get("duration", "").strip()
-        if duration:
-            duration_list = [d.strip() for d in duration.split(",") if d.strip()]
-            if duration_list:
-                qs = qs.filter(duration__in=duration_list)
-                print(f"✓ Duration filter {duration_list}: {qs.count()} projects")
-
-        # ==========================================
-        # 3. HOURS PER WEEK FILTER
-        # ==========================================
-        hours_per_week = params.get("hours_per_week", "").strip()
-        if hours_per_week:
-            hours_list = [h.strip() for h in hours_per_week.split(",") if h.strip()]
-            if hours_list:
-                qs = qs.filter(hours_per_week__in=hours_list)
-                print(f"✓ Hours/week filter {hours_list}: {qs.count()} projects")
-
-        # ==========================================
-        # 4. PROPOSAL COUNT FILTER
-        # ==========================================
-        proposal_range = params.get("proposal_range", "").strip()
-        if proposal_range:
-            proposal_list = [p.strip() for p in proposal_range.split(",") if p.strip()]
-            if proposal_list:
-                proposal_query = Q()
-                for val in proposal_list:
-                    if val == "0":
-                        proposal_query |= Q(num_proposals=0)
-                    elif val == "1_5":
-                        proposal_query |= Q(num_proposals__gte=1, num_proposals__lte=5)
-                    elif val == "6_15":
-                        proposal_query |= Q(num_proposals__gte=6, num_proposals__lte=15)
-                    elif val == "15_30":
-                        proposal_query |= Q(num_proposals__gte=15, num_proposals__lte=30)
-                    elif val == "30_plus":
-                        proposal_query |= Q(num_proposals__gt=30)
-
-                if proposal_query:
-                    qs = qs.filter(proposal_query)
-                    print(f"✓ Proposal filter {proposal_list}: {qs.count()} projects")
-
-        # ==========================================
-        # 5. JOB TYPE & PAYMENT FILTERS 
-        # ==========================================
-        job_types_param = params.get("job_type", "").strip()
-
-        if job_types_param:
-            job_types_list = [j.strip() for j in job_types_param.split(",") if j.strip()]
-            print(f"\nJob types selected: {job_types_list}")
-
-            combined_query = Q()
-
-            # -------------------------
-            # FIXED PRICE JOB FILTER
-            # -------------------------
-            if "fixed" in job_types_list:
-                fixed_param = (
-                    params.get("fixed_payment")
-                    or params.get("budget_range")
-                    or ""
-                ).strip()
-
-                if fixed_param:
-                    fixed_ranges = [r.strip() for r in fixed_param.split(",") if r.strip()]
-                    print(f"  Fixed ranges: {fixed_ranges}")
-
-                    fixed_query = Q()
-                    for r in fixed_ranges:
-                        if r == "less_1000":
-                            fixed_query |= Q(budget_max__lt=1000)
-                        elif r == "1000_5000":
-                            fixed_query |= Q(budget_min__gte=1000, budget_max__lte=5000)
-                        elif r == "5000_10000":
-                            fixed_query |= Q(budget_min__gte=5000, budget_max__lte=10000)
-                        elif r == "10000_25000":
-                            fixed_query |= Q(budget_min__gte=10000, budget_max__lte=25000)
-                        elif r == "25000_plus":
-                            fixed_query |= Q(budget_min__gt=25000)
+        compiled = ProjectFilterSet.compile(params)
+        qs = self.get_base_queryset(params, compiled)
 
-                    combined_query |= Q(job_type="fixed") & fixed_query
-                    debug_fixed = Project.objects.filter(Q(job_type="fixed") & fixed_query)
-                    print(f"  → Fixed (budget) filter matched: {debug_fixed.count()} projects")
-                else:
-                    print("  No fixed_payment range provided → include all fixed projects")
-                    combined_query |= Q(job_type="fixed")
+        # Sidebar facets (duration, job type, category, ...)
+        for name, facet_q in compiled.facet_filters.items():
+            qs = qs.filter(facet_q)
+            trace.stage(name, qs, **{name: params.get(name)})
 
-            # -------------------------
-            # HOURLY JOB FILTER
-            # -------------------------
-            if "hourly" in job_types_list:
-                min_rate = params.get("hourly_min", "").strip()
-                max_rate = params.get("hourly_max", "").strip()
-                print(f"  Hourly filters: min={min_rate}, max={max_rate}")
-
-                hourly_query = Q(job_type="hourly")
-
-                try:
-                    if min_rate:
-                        hourly_query &= Q(hourly_min__gte=int(min_rate))
-                        print(f"    ✓ Min hourly ≥ ₹{min_rate}")
-                    if max_rate:
-                        hourly_query &= Q(hourly_max__lte=int(max_rate))
-                        print(f"    ✓ Max hourly ≤ ₹{max_rate}")
-                except ValueError:
-                    print("    ⚠ Invalid hourly range input detected")
-
-                debug_hourly = Project.objects.filter(hourly_query)
-                print(f"  → Hourly filter matched: {debug_hourly.count()} projects")
+        trace.finish(qs)
+        return qs
 
-                combined_query |= hourly_query
+    def get_base_queryset(self, params, compiled, rank=True):
+        """
+        Public projects narrowed by search and the non-facet filters
+        (status, client location). With ``rank``, search results come best first.
+        """
+        trace = self.query_trace
+        qs = Project.objects.filter(visibility='public')
+        trace.stage('initial', qs, params=dict(params))
 
-            # -------------------------
-            # APPLY COMBINED FILTER
-            # -------------------------
-            if combined_query:
-                before = qs.count()
-                qs = qs.filter(combined_query)
-                after = qs.count()
-                print(f"\n✓ Job type filter applied: {before} → {after} projects")
-            else:
-                print("\n⚠ No valid job type query built")
+        if compiled.base_q:
+            qs = qs.filter(compiled.base_q)
+            trace.stage('base', qs)
 
-        # ==========================================
-        # 6. SEARCH FILTER
-        # ==========================================
         search = params.get("search", "").strip()
         if search:
-            search_query = (
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(skills_required__name__icontains=search)
-            )
-            qs = qs.filter(search_query).distinct()
-            print(f"✓ Search filter '{search}': {qs.count()} projects")
-
-        # ==========================================
-        # 7. CATEGORY FILTER (HIERARCHICAL)
-        # ==========================================
-        category = params.get("category", "").strip()
-        if category:
-            if category in CATEGORY_GROUPS:
-                subcategories = CATEGORY_GROUPS[category]
-                qs = qs.filter(category__in=subcategories)
-                print(f"✓ Category group filter '{category}': searching in {len(subcategories)} subcategories: {qs.count()} projects")
+            if rank:
+                # Full-text index (FTS5 / tsvector), best matches first
+                qs = project_index.search(qs, search)
+                if 'search_rank' in qs.query.annotations:
+                    qs = qs.order_by('-search_rank', '-created_at')
             else:
-                qs = qs.filter(category=category)
-                print(f"✓ Category filter '{category}': {qs.count()} projects")
-
-        # ==========================================
-        # 8. EXPERIENCE LEVEL FILTER
-        # ==========================================
-        experience_level = params.get("experience_level", "").strip()
-        if experience_level:
-            exp_list = [e.strip() for e in experience_level.split(",") if e.strip()]
-            if exp_list:
-                qs = qs.filter(experience_level__in=exp_list)
-                print(f"✓ Experience filter {exp_list}: {qs.count()} projects")
+                qs = project_index.filter(qs, search)
+            trace.stage('search', qs, search=search)
 
-        # ==========================================
-        # 9. LOCATION TYPE FILTER
-        # ==========================================
-        location_type = params.get("location_type", "").strip()
-        if location_type:
-            loc_list = [l.strip() for l in location_type.split(",") if l.strip()]
-            if loc_list:
-                qs = qs.filter(location_type__in=loc_list)
-                print(f"✓ Location type filter {loc_list}: {qs.count()} projects")
-
-        # ==========================================
-        # 10. CLIENT LOCATION FILTER
-        # ==========================================
-        client_location = params.get("client_location", "").strip()
-        if client_location:
-            qs = qs.filter(client_location__icontains=client_location)
-            print(f"✓ Client location filter '{client_location}': {qs.count()} projects")
+        return qs
 
-        # ==========================================
-        # FINAL RESULT
-        # ==========================================
-        print("-"*50)
-        print(f"FINAL RESULT: {qs.count()} projects")
-        print("="*50 + "\n")
+    @action(detail=False, methods=['get'], url_path='facets')
+    def facets(self, request):
+        """
+        Per-option counts for the browse sidebar.
 
-        return qs
+        Takes the same params as the list endpoint. Each facet's options are
+        counted with every *other* active facet applied, all in a single
+        conditional-aggregation query, and the result is cached briefly.
+        """
+        params = request.query_params
+        key = ProjectFilterSet.normalize(params) + (('search', params.get('search', '').strip()),)
+        cache_key = f'projects:facets:{get_generation("projects")}:' + urlencode(key)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._count_facets(params)
+            cache.set(cache_key, data, FACET_CACHE_SECONDS)
+        return Response(data)
+
+    def _count_facets(self, params):
+        compiled = ProjectFilterSet.compile(params)
+        qs = self.get_base_queryset(params, compiled, rank=False)
+
+        # Option values (category groups) aren't valid SQL aliases; number them
+        aggregates = {'total': Count('pk', filter=compiled.facets_except(None))}
+        slots = []
+        for name, options in FACET_OPTIONS.items():
+            others_q = compiled.facets_except(name)
+            for value, option_q in options.items():
+                alias = f'facet_{len(slots)}'
+                aggregates[alias] = Count('pk', filter=others_q & option_q)
+                slots.append((name, value, alias))
+
+        counts = qs.aggregate(**aggregates)
+        data = {'total': counts['total']}
+        for name, value, alias in slots:
+            data.setdefault(name, {})[value] = counts[alias]
+        return data
 
-   
     @action(detail=True, methods=['get'], url_path='proposals', permission_classes=[IsAuthenticated])
     def proposals(self, request, pk=None):
         project = self.get_object()
@@ -6,3 +6,5 @@ class ProposalsConfig(AppConfig):
     name = 'proposals'
     verbose_name = 'Proposal System'
 
+    def ready(self):
+        import proposals.signals  # noqa
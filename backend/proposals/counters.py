@@ -0,0 +1,45 @@
+# backend/proposals/counters.py
+"""
+Project.proposal_count bookkeeping.
+
+Every proposal counts except withdrawn ones. Changes are applied as
+F() deltas so concurrent submissions never overwrite each other.
+"""
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from projects.models import Project
+from .models import Proposal
+
+UNCOUNTED_STATUSES = ('withdrawn',)
+
+
+def is_counted(status):
+    return status is not None and status not in UNCOUNTED_STATUSES
+
+
+def adjust_proposal_count(project_id, delta):
+    if not project_id or not delta:
+        return
+    Project.objects.filter(pk=project_id).update(
+        proposal_count=Greatest(F('proposal_count') + delta, Value(0))
+    )
+
+
+def rebuild_proposal_counts(projects=None):
+    """
+    Recompute proposal_count for ``projects`` (default: all) in a single
+    UPDATE with a grouped subquery. Returns the number of rows updated.
+    """
+    counted = (
+        Proposal.objects
+        .filter(project=OuterRef('pk'))
+        .exclude(status__in=UNCOUNTED_STATUSES)
+        .order_by()
+        .values('project')
+        .annotate(n=Count('pk'))
+        .values('n')
+    )
+    if projects is None:
+        projects = Project.objects.all()
+    return projects.update(proposal_count=Coalesce(Subquery(counted), 0))
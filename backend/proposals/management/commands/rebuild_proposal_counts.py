@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from proposals.counters import rebuild_proposal_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute Project.proposal_count from the proposals table'
+
+    def handle(self, *args, **options):
+        updated = rebuild_proposal_counts()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt proposal counts for {updated} project(s).'))
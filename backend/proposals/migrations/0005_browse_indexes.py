@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 06:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0004_proposal_availability_proposal_portfolio_links_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['freelancer', '-created_at'], name='proposal_freelancer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['project', '-created_at'], name='proposal_project_idx'),
+        ),
+    ]
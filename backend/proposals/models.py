@@ -30,16 +30,19 @@
 #     def __str__(self):
 #         return f"Proposal by {self.freelancer} for {self.project}"
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from projects.models import Project
 from users.models import Skill  # 🔥 use Skill from users.models
+from talentlink.tracking import FieldTrackerMixin
 
 User = get_user_model()
 
 
-class Proposal(models.Model):
+class Proposal(FieldTrackerMixin, models.Model):
+    tracked_fields = ('status',)
+
     STATUS_CHOICES = (
         ('pending', 'Pending'),
         ('accepted', 'Accepted'),
@@ -105,6 +108,11 @@ class Proposal(models.Model):
     class Meta:
         unique_together = ('project', 'freelancer')
         ordering = ['-created_at']
+        indexes = [
+            # Freelancer's own proposals / client's proposals per project, newest first
+            models.Index(fields=['freelancer', '-created_at'], name='proposal_freelancer_idx'),
+            models.Index(fields=['project', '-created_at'], name='proposal_project_idx'),
+        ]
 
     def __str__(self):
         return f"Proposal by {self.freelancer} for {self.project}"
@@ -113,18 +121,21 @@ class Proposal(models.Model):
         """
         Preserve existing logic: when proposal is accepted, move project to in_progress.
         """
-        if self.pk:
-            old = Proposal.objects.get(pk=self.pk)
-            old_status = old.status
-        else:
-            old_status = None
+        old_status = self.previous('status')
 
         # When proposal is accepted (and was not accepted before), update project
         if self.status == 'accepted' and old_status != 'accepted':
             self.project.status = 'in_progress'
             self.project.save()
 
-        super().save(*args, **kwargs)
+        from .counters import is_counted, adjust_proposal_count
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            # Keep Project.proposal_count in step (new / withdrawn / un-withdrawn)
+            if is_counted(self.status) != is_counted(old_status):
+                adjust_proposal_count(self.project_id, 1 if is_counted(self.status) else -1)
 
 
 class ProposalAttachment(models.Model):
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from .models import Proposal, ProposalAttachment
 from users.models import Skill
 from users.serializers import UserSerializer, FreelancerProfileSerializer
+from talentlink.fieldsets import SparseFieldsetSerializerMixin
 
 
 class ProposalAttachmentSerializer(serializers.ModelSerializer):
@@ -16,7 +17,7 @@ class SimpleSkillSerializer(serializers.ModelSerializer):
         fields = ['id', 'name']
 
 
-class ProposalSerializer(serializers.ModelSerializer):
+class ProposalSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     project_title = serializers.CharField(source='project.title', read_only=True)
     project_id = serializers.IntegerField(source='project.id', read_only=True)
     freelancer_id = serializers.IntegerField(source='freelancer.id', read_only=True)
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Proposal
+from .counters import is_counted, adjust_proposal_count
+from talentlink.cache import bump_generation
+
+
+@receiver(post_delete, sender=Proposal)
+def proposal_post_delete(sender, instance, **kwargs):
+    if is_counted(instance.status):
+        adjust_proposal_count(instance.project_id, -1)
+
+
+# Listings show proposal_count, which moves without a Project save
+@receiver(post_save, sender=Proposal)
+@receiver(post_delete, sender=Proposal)
+def proposal_response_cache_bump(sender, **kwargs):
+    bump_generation('projects')
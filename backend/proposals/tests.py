@@ -1,6 +1,9 @@
 # backend/proposals/tests.py
-from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from talentlink.testing import TestCase
 from projects.models import Project
 from .models import Proposal
 
@@ -39,4 +42,131 @@ class ProposalModelTests(TestCase):
         )
         self.assertEqual(proposal.project, self.project)
         self.assertEqual(proposal.freelancer, self.freelancer)
-        self.assertEqual(proposal.status, 'pending')
\ No newline at end of file
+        self.assertEqual(proposal.status, 'pending')
+
+    def _proposal(self, freelancer=None, **kwargs):
+        return Proposal.objects.create(
+            project=self.project,
+            freelancer=freelancer or self.freelancer,
+            cover_letter='I am interested',
+            bid_amount=1500,
+            estimated_time='2 weeks',
+            **kwargs
+        )
+
+    def test_proposal_count_follows_create_withdraw_delete(self):
+        proposal = self._proposal()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.proposal_count, 1)
+
+        proposal.status = 'withdrawn'
+        proposal.save()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.proposal_count, 0)
+
+        proposal.status = 'pending'
+        proposal.save()
+        proposal.delete()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.proposal_count, 0)
+
+    def test_stale_project_save_keeps_proposal_count(self):
+        stale = Project.objects.get(pk=self.project.pk)
+        self._proposal()
+
+        stale.title = 'Renamed'
+        stale.save()
+        stale.refresh_from_db()
+        self.assertEqual(stale.proposal_count, 1)
+        self.assertEqual(stale.title, 'Renamed')
+
+    def test_project_save_keeps_default_save_behaviour(self):
+        # Deferred fields stay unwritten, with no query to load them first
+        partial = Project.objects.only('id', 'title').get(pk=self.project.pk)
+        partial.title = 'Partial'
+        with CaptureQueriesContext(connection) as queries:
+            partial.save()
+        update = queries[0]['sql']
+        self.assertTrue(update.startswith('UPDATE "projects_project" SET "title" ='), update)
+        self.assertNotIn('proposal_count', update)
+
+        # A row that is gone is inserted again
+        pk = self.project.pk
+        Project.objects.filter(pk=pk).delete()
+        self.project.save()
+        self.assertTrue(Project.objects.filter(pk=pk).exists())
+
+    def test_status_change_is_tracked_without_queries(self):
+        proposal = Proposal.objects.get(pk=self._proposal().pk)
+        proposal.status = 'accepted'
+        with self.assertNumQueries(0):
+            self.assertTrue(proposal.has_changed('status'))
+            self.assertEqual(proposal.previous('status'), 'pending')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            proposal.save()
+        self.assertFalse(proposal.has_changed('status'))
+        self.assertEqual(
+            list(self.freelancer.notifications.values_list('title', flat=True)), ['Proposal accepted']
+        )
+
+    def test_rebuild_proposal_counts(self):
+        from .counters import rebuild_proposal_counts
+
+        self._proposal()
+        Project.objects.filter(pk=self.project.pk).update(proposal_count=42)
+
+        rebuild_proposal_counts()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.proposal_count, 1)
+
+
+class ProposalSparseFieldsetTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='sparse-client@example.com',
+            username='sparse-client',
+            password='pass123',
+            role='client'
+        )
+        project = Project.objects.create(
+            client=self.client_user,
+            title='Sparse Project',
+            description='Description',
+            budget_min=1000,
+            budget_max=2000,
+        )
+        for i in range(3):
+            freelancer = User.objects.create_user(
+                email=f'sparse-f{i}@example.com',
+                username=f'sparse-f{i}',
+                password='pass123',
+                role='freelancer'
+            )
+            Proposal.objects.create(
+                project=project,
+                freelancer=freelancer,
+                cover_letter='Hello',
+                bid_amount=1500,
+                estimated_time='1 week',
+            )
+        self.api = APIClient()
+        self.api.force_authenticate(self.client_user)
+
+    def test_fields_trims_payload_and_queries(self):
+        # COUNT + one page query; no freelancer profile or prefetch queries
+        with self.assertNumQueries(2):
+            response = self.api.get('/api/proposals/', {'fields': 'id,project_title,bid_amount,status'})
+
+        self.assertEqual(len(response.data['results']), 3)
+        for row in response.data['results']:
+            self.assertEqual(set(row), {'id', 'project_title', 'bid_amount', 'status'})
+            self.assertEqual(row['project_title'], 'Sparse Project')
+
+    def test_omit_and_unknown_fields(self):
+        response = self.api.get('/api/proposals/', {'omit': 'freelancer'})
+        self.assertNotIn('freelancer', response.data['results'][0])
+        self.assertIn('cover_letter', response.data['results'][0])
+
+        response = self.api.get('/api/proposals/', {'fields': 'id,nope'})
+        self.assertEqual(response.status_code, 400)
@@ -7,12 +7,32 @@ from rest_framework.permissions import IsAuthenticated
 from .models import Proposal, ProposalAttachment
 from .serializers import ProposalSerializer
 from projects.models import Project
+from talentlink.fieldsets import SparseFieldsetMixin
+from talentlink.querytrace import QueryTraceMixin
 
 
-class ProposalViewSet(viewsets.ModelViewSet):
+class ProposalViewSet(QueryTraceMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     serializer_class = ProposalSerializer
     permission_classes = [IsAuthenticated]
 
+    # ?fields= / ?omit= (talentlink/fieldsets.py); the full freelancer
+    # profile is only loaded when 'freelancer' is requested
+    sparse_relations = {
+        'project_id': {'select': ['project'], 'only': ['project', 'project__id']},
+        'project_title': {'select': ['project'], 'only': ['project', 'project__title']},
+        'freelancer': {
+            'select': ['freelancer', 'freelancer__freelancer_profile'],
+            'prefetch': [
+                'freelancer__freelancer_profile__skills',
+                'freelancer__freelancer_profile__portfolio_files',
+            ],
+            'only': None,
+        },
+        'freelancer_id': {'select': ['freelancer'], 'only': ['freelancer', 'freelancer__id']},
+        'relevant_skills': {'prefetch': ['relevant_skills'], 'only': []},
+        'file_attachments': {'prefetch': ['file_attachments'], 'only': []},
+    }
+
     def get_queryset(self):
         user = self.request.user
 
@@ -23,23 +43,12 @@ class ProposalViewSet(viewsets.ModelViewSet):
         else:
             queryset = Proposal.objects.none()
 
-        print(f"[Proposals] User: {user.email}, Role: {user.role}, Count: {queryset.count()}")
+        self.query_trace.stage('proposals', queryset, user_id=user.id, role=user.role)
 
-        return (
-            queryset
-            .select_related(
-                'project',
-                'freelancer',
-                'freelancer__freelancer_profile',
-            )
-            .prefetch_related(
-                'freelancer__freelancer_profile__skills',
-                'freelancer__freelancer_profile__portfolio_files',
-                'relevant_skills',
-                'file_attachments',
-            )
-            .order_by('-created_at')
-        )
+        # Related rows are loaded per requested field in load_for_fields()
+        queryset = queryset.order_by('-created_at')
+        self.query_trace.finish(queryset)
+        return queryset
 
     def create(self, request, *args, **kwargs):
         """
@@ -0,0 +1,136 @@
+# backend/talentlink/broker.py
+"""
+Publish/subscribe for the push (SSE) endpoints.
+
+    broker = get_broker()
+    broker.publish('messages:user:7', payload)
+
+    with broker.subscribe('messages:user:7') as sub:
+        item = sub.get(timeout=15)          # blocking (WSGI)
+        item = await sub.aget(timeout=15)   # asyncio (ASGI)
+
+``LocalBroker`` delivers to subscribers in the current process only, which
+covers a single ASGI worker (or runserver). PUSH_BROKER in settings takes
+the dotted path of another class with the same ``subscribe`` / ``publish``
+interface, e.g. one backed by Redis pub/sub, to fan out across workers.
+"""
+import asyncio
+import queue
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class Subscription:
+    """Queue of ``(channel, payload)`` pairs for one listener."""
+
+    def __init__(self, broker, channels, maxsize=0):
+        self.broker = broker
+        self.channels = tuple(channels)
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._waiter = None  # (loop, asyncio.Event) while aget() is waiting
+
+    def deliver(self, channel, payload):
+        try:
+            self._queue.put_nowait((channel, payload))
+        except queue.Full:
+            # Slow listener: it catches up from the database when it reconnects
+            self.dropped += 1
+            return
+        waiter = self._waiter
+        if waiter is not None:
+            loop, event = waiter
+            loop.call_soon_threadsafe(event.set)
+
+    def _pop(self):
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def get(self, timeout=None):
+        """Next ``(channel, payload)``, or None once ``timeout`` seconds pass."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    async def aget(self, timeout=None):
+        item = self._pop()
+        if item is not None:
+            return item
+
+        event = asyncio.Event()
+        self._waiter = (asyncio.get_running_loop(), event)
+        try:
+            # A publish may have landed before the waiter was registered
+            item = self._pop()
+            if item is not None:
+                return item
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        finally:
+            self._waiter = None
+        return self._pop()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LocalBroker:
+    """In-process broker; thread-safe, so sync views and ASGI streams can share it."""
+
+    def __init__(self, queue_size=1000):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, *channels):
+        subscription = Subscription(self, channels, maxsize=self.queue_size)
+        with self._lock:
+            for channel in channels:
+                self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                listeners = self._subscribers.get(channel)
+                if listeners is None:
+                    continue
+                listeners.discard(subscription)
+                if not listeners:
+                    del self._subscribers[channel]
+
+    def publish(self, channel, payload):
+        """Deliver ``payload`` to every listener on ``channel``; returns the listener count."""
+        with self._lock:
+            listeners = list(self._subscribers.get(channel, ()))
+        for subscription in listeners:
+            subscription.deliver(channel, payload)
+        return len(listeners)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                path = getattr(settings, 'PUSH_BROKER', 'talentlink.broker.LocalBroker')
+                _broker = import_string(path)()
+    return _broker
@@ -0,0 +1,166 @@
+# backend/talentlink/cache.py
+"""
+Versioned response cache for anonymous browse endpoints.
+
+Every namespace ("projects", "jobs") has a generation counter stored in the
+cache. Cache keys embed the current generation, so invalidating a whole
+namespace is a single ``incr`` from a signal handler; stale entries are
+never read again and simply age out.
+
+Backed by Django's cache framework (see CACHES in settings: local memory by
+default, file-based with CACHE_BACKEND=file). Hit/miss counts and latency
+are kept per namespace and served to staff by ``ResponseCacheStatsView``.
+"""
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+GENERATION_KEY = 'respcache:gen:{}'
+STATS_KEY = 'respcache:stats:{}:{}'
+STAT_FIELDS = ('hits', 'misses', 'hit_us', 'miss_us')
+CACHE_HEADER = 'X-Cache'
+CACHED_HEADERS = ('ETag', 'Last-Modified')
+
+
+# ============================================================
+# GENERATIONS
+# ============================================================
+def get_generation(namespace):
+    return cache.get_or_set(GENERATION_KEY.format(namespace), 1, timeout=None)
+
+
+def bump_generation(*namespaces):
+    """Invalidate every cached response in ``namespaces``."""
+    for namespace in namespaces:
+        key = GENERATION_KEY.format(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, timeout=None)
+
+
+# ============================================================
+# STATS
+# ============================================================
+def _incr(key, delta):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, delta)
+
+
+def record(namespace, hit, elapsed):
+    kind = 'hit' if hit else 'miss'
+    _incr(STATS_KEY.format(namespace, kind + 's'), 1)
+    _incr(STATS_KEY.format(namespace, kind + '_us'), int(elapsed * 1_000_000))
+
+
+def get_stats(namespace):
+    raw = cache.get_many([STATS_KEY.format(namespace, f) for f in STAT_FIELDS])
+    hits, misses, hit_us, miss_us = (raw.get(STATS_KEY.format(namespace, f), 0) for f in STAT_FIELDS)
+    lookups = hits + misses
+    return {
+        'generation': get_generation(namespace),
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / lookups, 4) if lookups else None,
+        'avg_hit_ms': round(hit_us / hits / 1000, 2) if hits else None,
+        'avg_miss_ms': round(miss_us / misses / 1000, 2) if misses else None,
+    }
+
+
+def reset_stats(namespace):
+    cache.delete_many([STATS_KEY.format(namespace, f) for f in STAT_FIELDS])
+
+
+# ============================================================
+# VIEWSET MIXIN
+# ============================================================
+class ResponseCacheMixin:
+    """
+    Cache anonymous ``list``/``retrieve`` responses.
+
+    Set ``response_cache_namespace`` on the viewset and bump that namespace
+    (``bump_generation``) whenever the underlying data changes.
+    """
+    response_cache_namespace = None
+    response_cache_actions = ('list', 'retrieve')
+
+    def get_response_cache_key(self, request):
+        params = urlencode(sorted(
+            (key, value) for key, values in request.query_params.lists() for value in values
+        ))
+        raw = '|'.join([
+            request.get_host(),
+            self.action,
+            str(self.kwargs.get(self.lookup_url_kwarg or self.lookup_field, '')),
+            params,
+        ])
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        generation = get_generation(self.response_cache_namespace)
+        return f'respcache:{self.response_cache_namespace}:{generation}:{digest}'
+
+    def response_cache_enabled(self, request):
+        return (
+            getattr(settings, 'RESPONSE_CACHE_SECONDS', 0) > 0
+            and self.response_cache_namespace is not None
+            and self.action in self.response_cache_actions
+            and not request.user.is_authenticated
+        )
+
+    def _cached(self, handler, request, *args, **kwargs):
+        if not self.response_cache_enabled(request):
+            return handler(request, *args, **kwargs)
+
+        start = time.perf_counter()
+        key = self.get_response_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            status_code, data, headers = cached
+            # Validators stored from the original response (talentlink/conditional.py)
+            response = None
+            if 'ETag' in headers:
+                response = get_conditional_response(request._request, etag=headers['ETag'])
+            if response is None:
+                response = Response(data, status=status_code)
+            for name, value in headers.items():
+                response[name] = value
+            response[CACHE_HEADER] = 'HIT'
+            record(self.response_cache_namespace, True, time.perf_counter() - start)
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            headers = {h: response[h] for h in CACHED_HEADERS if h in response}
+            cache.set(key, (response.status_code, response.data, headers), settings.RESPONSE_CACHE_SECONDS)
+        response[CACHE_HEADER] = 'MISS'
+        record(self.response_cache_namespace, False, time.perf_counter() - start)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(super().retrieve, request, *args, **kwargs)
+
+
+class ResponseCacheStatsView(APIView):
+    """Staff-only: hit ratio and latency per cached namespace."""
+    permission_classes = [permissions.IsAdminUser]
+    namespaces = ('projects', 'jobs')
+
+    def get(self, request):
+        return Response({ns: get_stats(ns) for ns in self.namespaces})
+
+    def delete(self, request):
+        for ns in self.namespaces:
+            reset_stats(ns)
+        return Response(status=204)
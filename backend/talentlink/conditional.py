@@ -0,0 +1,116 @@
+# backend/talentlink/conditional.py
+"""
+Conditional GET (ETag / Last-Modified) for polled endpoints.
+
+The validator is computed with a single aggregate query over the filtered
+queryset, never by serializing the body:
+- detail: ``updated_at`` and id of the object
+- list:   ``max(updated_at)`` and ``count`` over the filtered queryset
+
+Views add aggregates for related rows their representation includes (e.g.
+tasks on a workspace) through ``get_conditional_aggregates``. A matching
+``If-None-Match`` (or, for detail views, ``If-Modified-Since``) gets a 304.
+``If-Modified-Since`` is ignored for lists because a deletion lowers the
+count without moving ``max(updated_at)``.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from talentlink.cache import get_generation
+
+CONDITIONAL_HEADERS = ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE')
+
+
+def set_validators(response, etag, last_modified=None):
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def not_modified(request, etag, last_modified=None):
+    """Return a 304 response when the request's validators match, else None."""
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+class ConditionalGetMixin:
+    """ViewSet mixin adding ETag / Last-Modified to ``list`` and ``retrieve``."""
+    conditional_timestamp_field = 'updated_at'
+    conditional_actions = ('list', 'retrieve')
+    # Off when rows change without moving the timestamp (ETag still covers
+    # it): anything with related aggregates or a response cache namespace
+    conditional_last_modified = True
+
+    def get_conditional_aggregates(self):
+        """Aggregates whose values change whenever the response body would."""
+        return {
+            'last_modified': Max(self.conditional_timestamp_field),
+            'count': Count('pk', distinct=True),
+        }
+
+    def get_validator_base_queryset(self):
+        """What the validators aggregate over; override to skip costly annotations."""
+        return self.get_queryset()
+
+    def get_validator_queryset(self):
+        queryset = self.filter_queryset(self.get_validator_base_queryset())
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset.order_by()
+
+    def compute_validators(self, request):
+        """Return ``(etag, last_modified)``, or ``(None, None)`` when nothing matches."""
+        values = self.get_validator_queryset().aggregate(**self.get_conditional_aggregates())
+        if not values['count']:
+            return None, None
+
+        parts = [
+            type(self).__name__,
+            self.action,
+            request.get_full_path(),
+            str(request.user.pk),
+            getattr(request, 'accepted_media_type', ''),
+            repr(sorted(values.items())),
+        ]
+        namespace = getattr(self, 'response_cache_namespace', None)
+        if namespace:
+            # Covers changes the timestamps can't see (proposal_count, skills, ...)
+            parts.append(str(get_generation(namespace)))
+
+        etag = 'W/' + quote_etag(hashlib.sha1('|'.join(parts).encode()).hexdigest())
+        last_modified = values['last_modified'] if self.conditional_last_modified else None
+        return etag, last_modified
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        if self.action not in self.conditional_actions:
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = self.compute_validators(request)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+
+        if any(header in request.META for header in CONDITIONAL_HEADERS):
+            response = not_modified(
+                request._request, etag, last_modified if self.action == 'retrieve' else None
+            )
+            if response is not None:
+                return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag, last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
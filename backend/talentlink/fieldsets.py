@@ -0,0 +1,146 @@
+# backend/talentlink/fieldsets.py
+"""
+Sparse fieldsets for list/detail endpoints.
+
+    GET /api/projects/?fields=id,title,budget_min,budget_max,client_name
+    GET /api/proposals/?omit=freelancer
+
+The serializer drops unrequested fields, and the viewset loads only what
+the remaining fields need: ``select_related`` / ``prefetch_related`` come
+from ``sparse_relations`` and SQL columns are limited with ``only()``.
+Without either param the full representation is returned (with all of its
+relations loaded up front).
+"""
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+from talentlink.filters import split_list
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+class SparseFieldset:
+    def __init__(self, only=(), omit=()):
+        self.only = frozenset(only)
+        self.omit = frozenset(omit)
+
+    def wants(self, name):
+        if self.only and name not in self.only:
+            return False
+        return name not in self.omit
+
+    def trim(self, fields):
+        for name in list(fields):
+            if not self.wants(name):
+                fields.pop(name)
+        return fields
+
+
+class SparseFieldsetSerializerMixin:
+    """Honour the view's sparse fieldset on the top-level serializer only."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        sparse = self.context.get('sparse_fieldset')
+        if sparse is None:
+            return fields
+
+        parent = self.parent
+        if parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None):
+            return sparse.trim(fields)
+        return fields
+
+
+class SparseFieldsetMixin:
+    """
+    ViewSet side of sparse fieldsets.
+
+    ``sparse_relations`` maps serializer fields that read across relations to
+    what they need loaded::
+
+        'client_name': {'select': ['client'], 'only': ['client', 'client__first_name']}
+        'skills_required': {'prefetch': ['skills_required'], 'only': []}
+
+    ``only`` lists the columns (on this model or selected relations) the
+    field reads; ``None`` means "unknown", which turns column trimming off.
+    Fields sourced from a concrete model field need no entry.
+    """
+    sparse_relations = {}
+    # Columns always loaded when trimming (e.g. created_at for the keyset cursor)
+    sparse_required_columns = ()
+
+    def get_readable_fields(self):
+        if not hasattr(self, '_readable_fields'):
+            serializer = self.get_serializer_class()()
+            self._readable_fields = {
+                name: f for name, f in serializer.fields.items() if not f.write_only
+            }
+        return self._readable_fields
+
+    def get_sparse_fieldset(self):
+        if not hasattr(self, '_sparse_fieldset'):
+            self._sparse_fieldset = self._parse_sparse_fieldset()
+        return self._sparse_fieldset
+
+    def _parse_sparse_fieldset(self):
+        if self.request is None or self.request.method not in SAFE_METHODS:
+            return None
+        params = self.request.query_params
+        only = split_list(params.get(FIELDS_PARAM))
+        omit = split_list(params.get(OMIT_PARAM))
+        if not only and not omit:
+            return None
+
+        readable = self.get_readable_fields()
+        for param, names in ((FIELDS_PARAM, only), (OMIT_PARAM, omit)):
+            unknown = [n for n in names if n not in readable]
+            if unknown:
+                raise ValidationError({param: [f"Unknown field(s): {', '.join(unknown)}"]})
+        return SparseFieldset(only, omit)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['sparse_fieldset'] = self.get_sparse_fieldset()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method in SAFE_METHODS:
+            queryset = self.load_for_fields(queryset)
+        return queryset
+
+    def load_for_fields(self, queryset):
+        """Apply select_related / prefetch_related / only() for the requested fields."""
+        sparse = self.get_sparse_fieldset()
+        readable = self.get_readable_fields()
+        names = [n for n in readable if sparse is None or sparse.wants(n)]
+
+        concrete = {f.name for f in queryset.model._meta.concrete_fields}
+        select, prefetch = [], []
+        columns = {'pk', *self.sparse_required_columns}
+        trim = sparse is not None
+
+        for name in names:
+            relation = self.sparse_relations.get(name)
+            if relation is not None:
+                select += [s for s in relation.get('select', ()) if s not in select]
+                prefetch += [p for p in relation.get('prefetch', ()) if p not in prefetch]
+                if relation.get('only') is None:
+                    trim = False
+                else:
+                    columns.update(relation['only'])
+            elif readable[name].source in concrete:
+                columns.add(readable[name].source)
+            else:
+                # Method fields and dotted sources may read anything
+                trim = False
+
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if trim:
+            queryset = queryset.only(*columns)
+        return queryset
@@ -0,0 +1,257 @@
+# backend/talentlink/filters.py
+"""
+Declarative query-param filters shared by the browse endpoints.
+
+A FilterSet lists its filters as class attributes:
+
+    class JobFilterSet(FilterSet):
+        status = ExactFilter()
+        job_type = ListFilter()
+        hourly_min = NumberFilter(lookup='hourly_min__gte')
+
+``JobFilterSet.compile(request.query_params)`` parses and validates every
+param in one pass and returns a CompiledFilters with one Q per filter.
+Bad input (e.g. ``hourly_min=abc``) raises a DRF ValidationError, so the
+client gets a 400 before any query runs.
+
+Parsing is memoised per normalised param set (only the params the set
+declares, sorted), so repeated identical browse requests skip it. Q objects
+are rebuilt from the parsed values on every call, which keeps relative
+filters like "posted in the last 24h" correct.
+"""
+from datetime import timedelta
+from functools import lru_cache
+
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+PARSE_CACHE_SIZE = 512
+
+
+def split_list(value):
+    """Comma-separated query param -> tuple of non-empty values."""
+    return tuple(v.strip() for v in (value or '').split(',') if v.strip())
+
+
+# ============================================================
+# FILTERS
+# ============================================================
+class Filter:
+    """
+    One filter over one or more query params.
+
+    ``parse`` turns raw param values into a hashable value (or None when the
+    filter is inactive); ``build`` turns that value into a Q.
+    """
+    def __init__(self, param=None, field=None):
+        self.param = param
+        self.field = field
+
+    def bind(self, name):
+        self.name = name
+        self.param = self.param or name
+        self.field = self.field or name
+
+    @property
+    def params(self):
+        return (self.param,)
+
+    def parse(self, raw):
+        value = (raw.get(self.param) or '').strip()
+        return value or None
+
+    def build(self, value):
+        raise NotImplementedError
+
+    def invalid(self, param, message):
+        raise ValidationError({param: [message]})
+
+
+class ExactFilter(Filter):
+    def build(self, value):
+        return Q(**{self.field: value})
+
+
+class ContainsFilter(Filter):
+    def build(self, value):
+        return Q(**{f'{self.field}__icontains': value})
+
+
+class TextSearchFilter(Filter):
+    """Case-insensitive match on any of ``fields``."""
+    def __init__(self, param=None, fields=()):
+        super().__init__(param)
+        self.fields = fields
+
+    def build(self, value):
+        q = Q()
+        for field in self.fields:
+            q |= Q(**{f'{field}__icontains': value})
+        return q
+
+
+class ListFilter(Filter):
+    """``a,b,c`` -> ``field__in``. Unknown values simply match nothing."""
+    def parse(self, raw):
+        return split_list(raw.get(self.param)) or None
+
+    def build(self, value):
+        return Q(**{f'{self.field}__in': value})
+
+
+class NamedRangeFilter(Filter):
+    """``a,b`` where each name maps to a Q in ``ranges``; unknown names are ignored."""
+    def __init__(self, ranges, param=None):
+        super().__init__(param)
+        self.ranges = ranges
+
+    def parse(self, raw):
+        names = tuple(n for n in split_list(raw.get(self.param)) if n in self.ranges)
+        return names or None
+
+    def build(self, value):
+        q = Q()
+        for name in value:
+            q |= self.ranges[name]
+        return q
+
+
+class NumberFilter(Filter):
+    """Single numeric bound, e.g. ``lookup='hourly_min__gte'``."""
+    def __init__(self, param=None, lookup=None, cast=int, minimum=0):
+        super().__init__(param)
+        self.lookup = lookup
+        self.cast = cast
+        self.minimum = minimum
+
+    def bind(self, name):
+        super().bind(name)
+        self.lookup = self.lookup or self.field
+
+    def parse(self, raw):
+        text = (raw.get(self.param) or '').strip()
+        if not text:
+            return None
+        try:
+            value = self.cast(text)
+        except (TypeError, ValueError):
+            self.invalid(self.param, 'A valid number is required.')
+        if self.minimum is not None and value < self.minimum:
+            self.invalid(self.param, f'Ensure this value is greater than or equal to {self.minimum}.')
+        return value
+
+    def build(self, value):
+        return Q(**{self.lookup: value})
+
+
+class PostedWithinFilter(Filter):
+    """``24h`` / ``week`` / ``month`` -> ``field >= now - window`` (timezone-aware)."""
+    WINDOWS = {
+        '24h': timedelta(hours=24),
+        'week': timedelta(days=7),
+        'month': timedelta(days=30),
+    }
+
+    def __init__(self, param=None, field='created_at'):
+        super().__init__(param, field)
+
+    def parse(self, raw):
+        value = (raw.get(self.param) or '').strip()
+        return value if value in self.WINDOWS else None
+
+    def build(self, value):
+        return Q(**{f'{self.field}__gte': timezone.now() - self.WINDOWS[value]})
+
+
+# ============================================================
+# FILTER SETS
+# ============================================================
+class CompiledFilters:
+    """Result of ``FilterSet.compile``: one Q per active filter."""
+
+    def __init__(self, filters, facets):
+        self.filters = filters
+        self.facets = facets
+
+    @property
+    def q(self):
+        """Every active filter ANDed together."""
+        return self.combine()
+
+    def combine(self, exclude=()):
+        q = Q()
+        for name, filter_q in self.filters.items():
+            if name not in exclude:
+                q &= filter_q
+        return q
+
+    @property
+    def base_q(self):
+        """Only the non-facet filters."""
+        return self.combine(exclude=self.facets)
+
+    @property
+    def facet_filters(self):
+        return {name: q for name, q in self.filters.items() if name in self.facets}
+
+    def facets_except(self, name=None):
+        """Facet filters ANDed, leaving out ``name`` (for per-option counts)."""
+        base = set(self.filters) - set(self.facets)
+        return self.combine(exclude=base | {name})
+
+    def __bool__(self):
+        return bool(self.filters)
+
+
+class FilterSet:
+    """
+    Declare filters as class attributes. ``facets`` names the filters the
+    browse sidebar counts per option; the rest are base filters.
+    """
+    facets = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        declared = {}
+        for base in reversed(cls.__mro__[1:]):
+            declared.update(getattr(base, 'declared_filters', {}))
+        for name, value in list(vars(cls).items()):
+            if isinstance(value, Filter):
+                value.bind(name)
+                declared[name] = value
+        cls.declared_filters = declared
+        cls.param_names = tuple(sorted({p for f in declared.values() for p in f.params}))
+        cls._parse_cached = classmethod(lru_cache(maxsize=PARSE_CACHE_SIZE)(cls._parse.__func__))
+
+    @classmethod
+    def normalize(cls, query_params):
+        """Hashable key of the params this set reads (last value wins, like .get)."""
+        return tuple(
+            (name, query_params.get(name, '').strip())
+            for name in cls.param_names
+            if query_params.get(name, '').strip()
+        )
+
+    @classmethod
+    def _parse(cls, key):
+        raw = dict(key)
+        parsed = []
+        for name, flt in cls.declared_filters.items():
+            value = flt.parse(raw)
+            if value is not None:
+                parsed.append((name, value))
+        return tuple(parsed)
+
+    @classmethod
+    def parse(cls, query_params):
+        return cls._parse_cached(cls.normalize(query_params))
+
+    @classmethod
+    def compile(cls, query_params):
+        filters = {}
+        for name, value in cls.parse(query_params):
+            q = cls.declared_filters[name].build(value)
+            if q:
+                filters[name] = q
+        return CompiledFilters(filters, facets=cls.facets)
@@ -0,0 +1,126 @@
+# backend/talentlink/pagination.py
+"""
+Pagination for browse feeds.
+
+By default this behaves exactly like DRF's PageNumberPagination. Clients
+that scroll deep (the React infinite-scroll) can opt in to keyset paging:
+
+    GET /api/projects/?paginate=cursor            -> first page
+    GET /api/projects/?paginate=cursor&cursor=... -> following pages
+
+Keyset pages are ordered newest first on (created_at, id) and seek with
+``WHERE (created_at, id) < (last_created_at, last_id)`` instead of
+``OFFSET``, so page 50 costs the same as page 1 and no COUNT(*) runs per
+page. Add ``include_total=true`` to the first request to get an
+approximate total, which is then carried along inside the cursor.
+"""
+import base64
+import json
+from collections import OrderedDict
+
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+TRUTHY = ('1', 'true', 'yes')
+
+
+def encode_cursor(payload):
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = parse_datetime(payload['c'])
+        pk = int(payload['i'])
+    except (TypeError, ValueError, KeyError):
+        raise NotFound('Invalid cursor')
+    if created_at is None:
+        raise NotFound('Invalid cursor')
+    total = payload.get('t')
+    return created_at, pk, total if isinstance(total, int) else None
+
+
+def estimate_count(queryset):
+    """
+    Cheap row estimate for ``queryset``.
+
+    PostgreSQL answers from the planner (EXPLAIN) without scanning; other
+    engines fall back to a single COUNT(*).
+    """
+    if connections[queryset.db].vendor == 'postgresql':
+        try:
+            plan = json.loads(queryset.explain(format='json'))
+            return int(plan[0]['Plan']['Plan Rows'])
+        except (ValueError, KeyError, IndexError, TypeError):
+            pass
+    return queryset.count()
+
+
+class FeedPagination(PageNumberPagination):
+    """
+    Page numbers by default, keyset cursor with ``?paginate=cursor``.
+    """
+    mode_query_param = 'paginate'
+    cursor_query_param = 'cursor'
+    total_query_param = 'include_total'
+
+    def use_keyset(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.use_keyset(request)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        token = request.query_params.get(self.cursor_query_param)
+
+        self.total = None
+        if token:
+            created_at, pk, self.total = decode_cursor(token)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            )
+        elif request.query_params.get(self.total_query_param, '').lower() in TRUTHY:
+            self.total = estimate_count(queryset)
+
+        # One extra row tells us whether there is a next page
+        rows = list(queryset.order_by('-created_at', '-pk')[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page_rows = rows[:self.page_size]
+        return self.page_rows
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        last = self.page_rows[-1]
+        payload = {'c': last.created_at.isoformat(), 'i': last.pk}
+        if self.total is not None:
+            payload['t'] = self.total
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.mode_query_param, 'cursor')
+        url = remove_query_param(url, self.total_query_param)
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(payload))
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('approximate_count', self.total),
+            ('results', data),
+        ]))
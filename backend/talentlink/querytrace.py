@@ -0,0 +1,148 @@
+# backend/talentlink/querytrace.py
+"""
+Opt-in query instrumentation for list endpoints.
+
+Tracing is off by default, so a normal request runs only the queries it
+needs. Turn it on with:
+- settings.QUERY_TRACE = True            (every request), or
+- an ``X-Query-Trace: 1`` request header (when QUERY_TRACE_ALLOW_HEADER)
+
+A traced request records each filter stage (with its row count), every
+SQL statement and its duration, plus the final SQL and EXPLAIN output.
+The full trace is logged as JSON on the ``talentlink.querytrace`` logger
+and a short summary is returned in the ``X-Query-Trace`` response header.
+"""
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+TRACE_HEADER = 'HTTP_X_QUERY_TRACE'
+RESPONSE_HEADER = 'X-Query-Trace'
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+class QueryTrace:
+    """Collects filter stages and executed SQL for one request."""
+
+    def __init__(self, label, enabled=True):
+        self.label = label
+        self.enabled = enabled
+        self.stages = []
+        self.queries = []
+        self.notes = []
+        self.final = None
+        self._started = time.perf_counter()
+
+    @classmethod
+    def for_request(cls, request, label):
+        return cls(label, enabled=tracing_requested(request))
+
+    # ------------------------------
+    # Recording
+    # ------------------------------
+    def stage(self, name, queryset, **params):
+        """Record a filter stage; only runs a COUNT when tracing is on."""
+        if not self.enabled:
+            return
+        start = time.perf_counter()
+        count = queryset.count()
+        self.stages.append({
+            'stage': name,
+            'params': params,
+            'count': count,
+            'ms': _elapsed_ms(start),
+        })
+
+    def note(self, message):
+        if self.enabled:
+            self.notes.append(message)
+
+    def finish(self, queryset):
+        """Record the final SQL and query plan of the filtered queryset."""
+        if not self.enabled:
+            return
+        try:
+            sql = str(queryset.query)
+        except Exception as exc:  # EmptyResultSet and friends
+            sql = f'<unavailable: {exc}>'
+        try:
+            plan = queryset.explain()
+        except Exception as exc:
+            plan = f'<unavailable: {exc}>'
+        self.final = {'sql': sql, 'explain': plan}
+
+    def record_query(self, execute, sql, params, many, context):
+        """connection.execute_wrapper hook: time every statement."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({'sql': sql, 'ms': _elapsed_ms(start)})
+
+    # ------------------------------
+    # Output
+    # ------------------------------
+    def as_dict(self):
+        return {
+            'label': self.label,
+            'total_ms': _elapsed_ms(self._started),
+            'db_ms': round(sum(q['ms'] for q in self.queries), 2),
+            'query_count': len(self.queries),
+            'stages': self.stages,
+            'notes': self.notes,
+            'final': self.final,
+            'queries': self.queries,
+        }
+
+    def summary(self):
+        data = self.as_dict()
+        return (
+            f"queries={data['query_count']}; db_ms={data['db_ms']}; "
+            f"total_ms={data['total_ms']}; stages={len(self.stages)}"
+        )
+
+    def emit(self, response):
+        if not self.enabled:
+            return
+        logger.info(json.dumps(self.as_dict(), default=str))
+        response[RESPONSE_HEADER] = self.summary()
+
+
+NULL_TRACE = QueryTrace('disabled', enabled=False)
+
+
+def tracing_requested(request):
+    if getattr(settings, 'QUERY_TRACE', False):
+        return True
+    if not getattr(settings, 'QUERY_TRACE_ALLOW_HEADER', False):
+        return False
+    return request.META.get(TRACE_HEADER, '').lower() in ('1', 'true', 'yes')
+
+
+class QueryTraceMixin:
+    """
+    ViewSet mixin exposing ``self.query_trace``.
+
+    Views call ``self.query_trace.stage(...)`` while filtering; all of it is
+    a no-op unless tracing was requested.
+    """
+    query_trace = NULL_TRACE
+
+    def dispatch(self, request, *args, **kwargs):
+        trace = QueryTrace.for_request(request, label=type(self).__name__)
+        if not trace.enabled:
+            return super().dispatch(request, *args, **kwargs)
+
+        self.query_trace = trace
+        with connection.execute_wrapper(trace.record_query):
+            response = super().dispatch(request, *args, **kwargs)
+        trace.emit(response)
+        return response
@@ -0,0 +1,368 @@
+# backend/talentlink/search.py
+"""
+Database-backed full-text search indexes.
+
+Each index lives in its own table next to the model it covers:
+- SQLite     -> FTS5 virtual table, ranked with bm25()
+- PostgreSQL -> tsvector table with a GIN index, ranked with ts_rank()
+
+Any other engine (or an SQLite build without FTS5) falls back to plain
+icontains matching so search keeps working, just without the index.
+
+An index may also be *scoped*: every row carries a set of ids (e.g. the
+two participants of a message) and searches restricted to one id are
+answered by the index itself, so a user's search never scans other
+users' rows. SQLite stores the ids as tokens in an extra FTS column,
+PostgreSQL as a GIN-indexed bigint[].
+"""
+import logging
+import re
+
+from django.db import connections, DatabaseError
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.db.models import FloatField, TextField
+from django.utils.html import escape
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+MAX_TERMS = 8
+POSTGRES_CONFIG = 'english'
+POSTGRES_WEIGHTS = ('A', 'B', 'C', 'D')
+SCOPE_TOKEN = 'scope{}'
+
+# Highlight markers emitted by the database; turned into <mark> after escaping
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_STOP = '\x03'
+SNIPPET_ELLIPSIS = '…'
+SNIPPET_WORDS = 16
+
+
+def tokenize(text):
+    """Split user input into safe search terms (no FTS operators survive)."""
+    return TOKEN_RE.findall((text or '').lower())[:MAX_TERMS]
+
+
+def render_highlight(snippet):
+    """HTML-escape a database snippet and wrap matches in <mark>."""
+    if snippet is None:
+        return None
+    return (
+        escape(snippet)
+        .replace(HIGHLIGHT_START, '<mark>')
+        .replace(HIGHLIGHT_STOP, '</mark>')
+    )
+
+
+# ============================================================
+# ENGINE BACKENDS
+# ============================================================
+class _SQLiteEngine:
+    def __init__(self, index):
+        self.index = index
+        self.columns = index.columns + ((index.scope_column,) if index.scope_column else ())
+
+    def create(self, cursor):
+        cols = ', '.join(self.columns)
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.index.table} "
+            f"USING fts5({cols}, tokenize='unicode61 remove_diacritics 2')"
+        )
+
+    def drop(self, cursor):
+        cursor.execute(f"DROP TABLE IF EXISTS {self.index.table}")
+
+    def upsert(self, cursor, pk, values, scope=()):
+        if self.index.scope_column:
+            values = [*values, ' '.join(SCOPE_TOKEN.format(s) for s in scope)]
+        cols = ', '.join(self.columns)
+        marks = ', '.join(['%s'] * len(values))
+        cursor.execute(f"DELETE FROM {self.index.table} WHERE rowid = %s", [pk])
+        cursor.execute(
+            f"INSERT INTO {self.index.table} (rowid, {cols}) VALUES (%s, {marks})",
+            [pk, *values],
+        )
+
+    def remove(self, cursor, pks):
+        marks = ', '.join(['%s'] * len(pks))
+        cursor.execute(f"DELETE FROM {self.index.table} WHERE rowid IN ({marks})", list(pks))
+
+    def query(self, terms, scope=None):
+        query = ' '.join(f'"{t}"*' for t in terms)
+        if not self.index.scope_column:
+            return query
+        # Keep the terms off the scope column, then require the scope token
+        query = f"{{{' '.join(self.index.columns)}}} : ({query})"
+        if scope is not None:
+            query += f' AND {self.index.scope_column} : "{SCOPE_TOKEN.format(int(scope))}"'
+        return query
+
+    def match(self, terms, scope=None):
+        sql = f"SELECT rowid FROM {self.index.table} WHERE {self.index.table} MATCH %s"
+        return sql, [self.query(terms, scope)]
+
+    def rank(self, outer_pk, terms):
+        weights = [float(w) for w in self.index.weights]
+        if self.index.scope_column:
+            weights.append(0.0)
+        # bm25() is "lower is better"; negate so callers always sort descending
+        sql = (
+            f"SELECT -bm25({self.index.table}, {', '.join(map(str, weights))}) FROM {self.index.table} "
+            f"WHERE {self.index.table} MATCH %s AND rowid = {outer_pk}"
+        )
+        return sql, [self.query(terms)]
+
+    def snippet(self, outer_pk, terms, column, source_sql):
+        sql = (
+            f"SELECT snippet({self.index.table}, {self.columns.index(column)}, %s, %s, %s, {SNIPPET_WORDS}) "
+            f"FROM {self.index.table} WHERE {self.index.table} MATCH %s AND rowid = {outer_pk}"
+        )
+        return sql, [HIGHLIGHT_START, HIGHLIGHT_STOP, SNIPPET_ELLIPSIS, self.query(terms)]
+
+
+class _PostgresEngine:
+    def __init__(self, index):
+        self.index = index
+
+    def create(self, cursor):
+        scope = ", scope bigint[] NOT NULL DEFAULT '{}'" if self.index.scope_column else ''
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.index.table} ("
+            f"object_id bigint PRIMARY KEY, document tsvector NOT NULL{scope})"
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.index.table}_document_gin "
+            f"ON {self.index.table} USING GIN (document)"
+        )
+        if self.index.scope_column:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.index.table}_scope_gin "
+                f"ON {self.index.table} USING GIN (scope)"
+            )
+
+    def drop(self, cursor):
+        cursor.execute(f"DROP TABLE IF EXISTS {self.index.table}")
+
+    def _document_sql(self):
+        parts = [
+            f"setweight(to_tsvector('{POSTGRES_CONFIG}', coalesce(%s, '')), '{POSTGRES_WEIGHTS[min(i, 3)]}')"
+            for i, _ in enumerate(self.index.columns)
+        ]
+        return ' || '.join(parts)
+
+    def upsert(self, cursor, pk, values, scope=()):
+        if self.index.scope_column:
+            cursor.execute(
+                f"INSERT INTO {self.index.table} (object_id, document, scope) "
+                f"VALUES (%s, {self._document_sql()}, %s) "
+                f"ON CONFLICT (object_id) DO UPDATE SET document = EXCLUDED.document, scope = EXCLUDED.scope",
+                [pk, *values, list(scope)],
+            )
+            return
+        cursor.execute(
+            f"INSERT INTO {self.index.table} (object_id, document) "
+            f"VALUES (%s, {self._document_sql()}) "
+            f"ON CONFLICT (object_id) DO UPDATE SET document = EXCLUDED.document",
+            [pk, *values],
+        )
+
+    def remove(self, cursor, pks):
+        cursor.execute(f"DELETE FROM {self.index.table} WHERE object_id = ANY(%s)", [list(pks)])
+
+    def query(self, terms):
+        return ' & '.join(f"{t}:*" for t in terms)
+
+    def match(self, terms, scope=None):
+        sql = (
+            f"SELECT object_id FROM {self.index.table} "
+            f"WHERE document @@ to_tsquery('{POSTGRES_CONFIG}', %s)"
+        )
+        params = [self.query(terms)]
+        if scope is not None:
+            sql += " AND scope @> ARRAY[%s]::bigint[]"
+            params.append(int(scope))
+        return sql, params
+
+    def rank(self, outer_pk, terms):
+        sql = (
+            f"SELECT ts_rank(document, to_tsquery('{POSTGRES_CONFIG}', %s)) "
+            f"FROM {self.index.table} WHERE object_id = {outer_pk}"
+        )
+        return sql, [self.query(terms)]
+
+    def snippet(self, outer_pk, terms, column, source_sql):
+        # ts_headline works on the original text, read from the model's own column
+        options = f'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords={SNIPPET_WORDS}, MinWords=6'
+        sql = f"ts_headline('{POSTGRES_CONFIG}', coalesce({source_sql}, ''), to_tsquery('{POSTGRES_CONFIG}', %s), %s)"
+        return sql, [self.query(terms), options]
+
+
+ENGINES = {
+    'sqlite': _SQLiteEngine,
+    'postgresql': _PostgresEngine,
+}
+
+
+# ============================================================
+# SEARCH INDEX
+# ============================================================
+class SearchIndex:
+    """
+    Describe a full-text index over one model.
+
+    Subclasses set ``model``, ``table``, ``columns`` (in weight order),
+    ``weights`` and ``fallback_lookups``, and implement ``get_values``.
+    Scoped indexes also set ``scope_column`` and implement ``get_scope``.
+    """
+    model = None
+    table = None
+    columns = ()
+    weights = ()
+    fallback_lookups = ()
+    scope_column = None
+
+    def __init__(self):
+        self._ready = {}
+
+    def get_values(self, instance):
+        """Return the text for each column of ``columns``, in order."""
+        raise NotImplementedError
+
+    def get_scope(self, instance):
+        """Ids a scoped search for this row may use (e.g. its participants)."""
+        return ()
+
+    def _upsert(self, engine, cursor, instance):
+        values = [v or '' for v in self.get_values(instance)]
+        engine.upsert(cursor, instance.pk, values, scope=self.get_scope(instance))
+
+    def get_engine(self, using='default'):
+        engine_cls = ENGINES.get(connections[using].vendor)
+        return engine_cls(self) if engine_cls else None
+
+    def is_ready(self, using='default'):
+        """True when the index table exists on this database (checked once)."""
+        if using not in self._ready:
+            engine = self.get_engine(using)
+            conn = connections[using]
+            self._ready[using] = bool(engine) and self.table in conn.introspection.table_names()
+        return self._ready[using]
+
+    # ------------------------------
+    # Schema
+    # ------------------------------
+    def ensure_schema(self, using='default'):
+        engine = self.get_engine(using)
+        if engine is None:
+            return False
+        try:
+            with connections[using].cursor() as cursor:
+                engine.create(cursor)
+        except DatabaseError as exc:
+            logger.warning("Search index %s unavailable: %s", self.table, exc)
+            self._ready[using] = False
+            return False
+        self._ready[using] = True
+        return True
+
+    def drop_schema(self, using='default'):
+        engine = self.get_engine(using)
+        if engine is None:
+            return
+        with connections[using].cursor() as cursor:
+            engine.drop(cursor)
+        self._ready.pop(using, None)
+
+    # ------------------------------
+    # Writes
+    # ------------------------------
+    def update(self, instance, using='default'):
+        if not self.is_ready(using):
+            return
+        with connections[using].cursor() as cursor:
+            self._upsert(self.get_engine(using), cursor, instance)
+
+    def remove(self, pks, using='default'):
+        pks = [pk for pk in pks if pk is not None]
+        if not pks or not self.is_ready(using):
+            return
+        with connections[using].cursor() as cursor:
+            self.get_engine(using).remove(cursor, pks)
+
+    def rebuild(self, queryset, using='default', batch_size=500):
+        """Re-index every row of ``queryset``. Returns the number of rows indexed."""
+        if not self.ensure_schema(using):
+            return 0
+        engine = self.get_engine(using)
+        count = 0
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+            for instance in queryset.iterator(chunk_size=batch_size):
+                self._upsert(engine, cursor, instance)
+                count += 1
+        return count
+
+    # ------------------------------
+    # Reads
+    # ------------------------------
+    def _outer_pk(self, queryset):
+        opts = queryset.model._meta
+        return f'"{opts.db_table}"."{opts.pk.column}"'
+
+    def _outer_column(self, queryset, field_name):
+        opts = queryset.model._meta
+        return f'"{opts.db_table}"."{opts.get_field(field_name).column}"'
+
+    def filter(self, queryset, text, scope=None):
+        """
+        Filter ``queryset`` to rows matching ``text``, without ranking.
+        ``scope`` (scoped indexes only) limits the match to rows carrying that id.
+        """
+        terms = tokenize(text)
+        using = queryset.db
+
+        if not terms or not self.is_ready(using):
+            return self.fallback(queryset, text)
+
+        sql, params = self.get_engine(using).match(terms, scope)
+        return queryset.filter(pk__in=RawSQL(sql, params))
+
+    def search(self, queryset, text, scope=None):
+        """
+        Filter ``queryset`` to rows matching ``text``, annotated with
+        ``search_rank`` (higher is more relevant).
+        """
+        queryset = self.filter(queryset, text, scope)
+        terms = tokenize(text)
+        if not terms or not self.is_ready(queryset.db):
+            return queryset
+
+        sql, params = self.get_engine(queryset.db).rank(self._outer_pk(queryset), terms)
+        return queryset.annotate(search_rank=RawSQL(sql, params, output_field=FloatField()))
+
+    def highlight(self, queryset, text, column):
+        """
+        Annotate ``search_snippet``: an excerpt of ``column`` (also a model
+        field) with matches between HIGHLIGHT_START/STOP; see render_highlight.
+        Returns ``queryset`` unchanged when the index can't be used.
+        """
+        terms = tokenize(text)
+        if not terms or not self.is_ready(queryset.db):
+            return queryset
+
+        engine = self.get_engine(queryset.db)
+        sql, params = engine.snippet(
+            self._outer_pk(queryset), terms, column, self._outer_column(queryset, column)
+        )
+        return queryset.annotate(search_snippet=RawSQL(sql, params, output_field=TextField()))
+
+    def fallback(self, queryset, text):
+        text = (text or '').strip()
+        if not text:
+            return queryset
+        q = Q()
+        for lookup in self.fallback_lookups:
+            q |= Q(**{lookup: text})
+        return queryset.filter(q).distinct()
+
@@ -46,6 +46,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'notifications.dispatch.NotificationBatchMiddleware',
 ]
 
 ROOT_URLCONF = 'talentlink.urls'
@@ -109,6 +110,74 @@ REST_FRAMEWORK = {
     ),
 }
 
+# ============= CACHE =============
+# Local memory by default; CACHE_BACKEND=file shares entries between
+# worker processes on one host (CACHE_LOCATION sets the directory).
+if config('CACHE_BACKEND', default='locmem') == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': config('CACHE_LOCATION', default=str(BASE_DIR / '.cache')),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'talentlink',
+        }
+    }
+
+# Anonymous project/job list + detail responses (talentlink/cache.py); 0 disables
+RESPONSE_CACHE_SECONDS = config('RESPONSE_CACHE_SECONDS', default=120, cast=int)
+# Per-user review stats (contracts/ratings.py), dropped when a review changes
+REVIEW_STATS_CACHE_SECONDS = config('REVIEW_STATS_CACHE_SECONDS', default=600, cast=int)
+# Workspace payment_stats timeline (workspaces/stats.py), dropped when a payment changes
+PAYMENT_TIMELINE_CACHE_SECONDS = config('PAYMENT_TIMELINE_CACHE_SECONDS', default=600, cast=int)
+# Per-user workspaces/summary/ totals (workspaces/stats.py), dropped on task/payment/request changes
+WORKSPACE_SUMMARY_CACHE_SECONDS = config('WORKSPACE_SUMMARY_CACHE_SECONDS', default=300, cast=int)
+
+# ============= PUSH (SSE) =============
+# talentlink/broker.py + talentlink/sse.py. LocalBroker only reaches listeners
+# in the same process; point PUSH_BROKER at a shared broker when running
+# more than one worker.
+PUSH_BROKER = config('PUSH_BROKER', default='talentlink.broker.LocalBroker')
+SSE_HEARTBEAT_SECONDS = config('SSE_HEARTBEAT_SECONDS', default=15, cast=int)
+# Streams close after this long; EventSource reconnects with Last-Event-ID
+SSE_MAX_SECONDS = config('SSE_MAX_SECONDS', default=300, cast=int)
+# Lifetime of the single-use tickets from /api/stream-ticket/. Tickets live
+# in the cache, so workers must share it (CACHE_BACKEND=file) to redeem
+# each other's tickets.
+SSE_TICKET_SECONDS = config('SSE_TICKET_SECONDS', default=30, cast=int)
+# Streams need ASGI; under WSGI they get 204 unless this allows a blocking
+# stream that holds a worker (fine for runserver, not for gunicorn sync)
+SSE_WSGI_STREAMS = config('SSE_WSGI_STREAMS', default=False, cast=bool)
+
+# ============= NOTIFICATION RETENTION =============
+# manage.py prune_notifications (notifications/retention.py) deletes read
+# notifications older than this many days
+NOTIFICATION_RETENTION_DAYS = config('NOTIFICATION_RETENTION_DAYS', default=90, cast=int)
+
+# ============= QUERY TRACING =============
+# See talentlink/querytrace.py. Off by default; the X-Query-Trace request
+# header is only honoured when QUERY_TRACE_ALLOW_HEADER is set.
+QUERY_TRACE = config('QUERY_TRACE', default=False, cast=bool)
+QUERY_TRACE_ALLOW_HEADER = config('QUERY_TRACE_ALLOW_HEADER', default=DEBUG, cast=bool)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'talentlink': {
+            'handlers': ['console'],
+            'level': config('TALENTLINK_LOG_LEVEL', default='INFO'),
+        },
+    },
+}
+
 # ============= EMAIL / FRONTEND SETTINGS (added) =============
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = "smtp.gmail.com"
@@ -0,0 +1,199 @@
+# backend/talentlink/sse.py
+"""
+Server-Sent Events responses fed by talentlink/broker.py.
+
+A stream subscribes first, then replays what the client missed (from the
+database, after ``Last-Event-ID``), then forwards live events until
+SSE_MAX_SECONDS pass. EventSource reconnects by itself and resumes from
+the last id it saw. Comment lines go out every SSE_HEARTBEAT_SECONDS so
+proxies keep the connection open.
+
+Streams need ASGI (the Dockerfile runs gunicorn with uvicorn workers):
+the stream is an async generator, so an open tab holds no thread. Under
+WSGI a stream would pin a sync worker for SSE_MAX_SECONDS, so it is
+refused with 204, which tells EventSource to stop and the client to fall
+back to polling. SSE_WSGI_STREAMS=True allows a blocking generator
+instead (runserver, tests). Live payloads are transformed without
+touching the database.
+
+EventSource can't set an Authorization header and a JWT in the query
+string ends up in access logs, so clients POST to /api/stream-ticket/ for
+a short-lived, single-use ``?ticket=``. A used ticket can't reconnect:
+on error the client fetches a new one and resumes with ``?last_id=``.
+"""
+import json
+import secrets
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework import permissions
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from talentlink.broker import get_broker
+
+RETRY_MS = 3000
+HEARTBEAT = ': ping\n\n'
+TICKET_KEY = 'sseticket:{}'
+
+
+# ============================================================
+# AUTHENTICATION
+# ============================================================
+def issue_ticket(user):
+    ticket = secrets.token_urlsafe(32)
+    cache.set(TICKET_KEY.format(ticket), user.pk, settings.SSE_TICKET_SECONDS)
+    return ticket
+
+
+def redeem_ticket(ticket):
+    """User the ticket was issued to, or None. A ticket works once."""
+    key = TICKET_KEY.format(ticket)
+    user_id = cache.get(key)
+    # delete() is True for only one of two concurrent redemptions
+    if user_id is None or not cache.delete(key):
+        return None
+    return get_user_model().objects.filter(pk=user_id, is_active=True).first()
+
+
+def authenticate(request):
+    """User for the ``?ticket=`` or Authorization header JWT, else None."""
+    ticket = request.GET.get('ticket')
+    if ticket:
+        return redeem_ticket(ticket)
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+    return result[0] if result else None
+
+
+class StreamTicketView(APIView):
+    """POST: a ticket for opening one SSE stream."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        return Response({
+            'ticket': issue_ticket(request.user),
+            'expires_in': settings.SSE_TICKET_SECONDS,
+        })
+
+
+# ============================================================
+# STREAMS
+# ============================================================
+def last_event_id(request):
+    raw = request.headers.get('Last-Event-ID') or request.GET.get('last_id')
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def format_event(data, event=None, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    if event:
+        lines.append(f'event: {event}')
+    lines.append('data: ' + json.dumps(data, cls=DjangoJSONEncoder))
+    return '\n'.join(lines) + '\n\n'
+
+
+class EventStream:
+    """
+    One open SSE connection.
+
+    Events are ``(id, event, data)`` tuples. Ids must increase; anything at
+    or below the last id sent is skipped, which de-duplicates the overlap
+    between the backlog and live events. Events with id None always go out.
+    """
+
+    def __init__(self, subscription, backlog=(), transform=None, last_id=None):
+        self.subscription = subscription
+        self.backlog = backlog
+        self.transform = transform or (lambda channel, payload: payload)
+        self.last_id = last_id
+        self.deadline = time.monotonic() + settings.SSE_MAX_SECONDS
+
+    def render(self, event):
+        if event is None:
+            return None
+        event_id, name, data = event
+        if event_id is not None:
+            if self.last_id is not None and event_id <= self.last_id:
+                return None
+            self.last_id = event_id
+        return format_event(data, name, event_id)
+
+    def opening(self):
+        chunks = [f'retry: {RETRY_MS}\n\n']
+        chunks += [c for c in map(self.render, self.backlog) if c]
+        return chunks
+
+    def receive(self, item):
+        if item is None:
+            return HEARTBEAT
+        return self.render(self.transform(*item))
+
+    def wait_time(self):
+        return min(settings.SSE_HEARTBEAT_SECONDS, self.deadline - time.monotonic())
+
+    def __iter__(self):
+        try:
+            yield from self.opening()
+            while self.wait_time() > 0:
+                chunk = self.receive(self.subscription.get(timeout=self.wait_time()))
+                if chunk:
+                    yield chunk
+        finally:
+            self.subscription.close()
+
+    async def __aiter__(self):
+        try:
+            for chunk in self.opening():
+                yield chunk
+            while self.wait_time() > 0:
+                chunk = self.receive(await self.subscription.aget(timeout=self.wait_time()))
+                if chunk:
+                    yield chunk
+        finally:
+            self.subscription.close()
+
+
+def stream_response(request, channels, backlog=None, transform=None):
+    """
+    SSE response listening on ``channels``.
+
+    ``backlog(last_id)`` returns the events missed since ``last_id`` (None on
+    a fresh connection); ``transform(channel, payload)`` maps a published
+    payload to an event, or None to skip it.
+    """
+    is_asgi = isinstance(request, ASGIRequest)
+    if not is_asgi and not settings.SSE_WSGI_STREAMS:
+        # Would hold a sync worker for the whole stream
+        return HttpResponse(status=204)
+
+    subscription = get_broker().subscribe(*channels)
+    last_id = last_event_id(request)
+    try:
+        # Subscribed first, so nothing published during this query is lost
+        missed = list(backlog(last_id)) if backlog else []
+    except Exception:
+        subscription.close()
+        raise
+
+    stream = EventStream(subscription, missed, transform, last_id)
+    content = stream.__aiter__() if is_asgi else iter(stream)
+    response = StreamingHttpResponse(content, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
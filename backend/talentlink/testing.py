@@ -0,0 +1,17 @@
+# backend/talentlink/testing.py
+"""
+Shared test base.
+
+The response cache generations (talentlink/cache.py), the per-user stats
+and summary caches and stream tickets all live in Django's cache, which
+a TestCase rollback doesn't undo. ``TestCase`` starts every test with an
+empty cache so nothing one test cached is served to the next.
+"""
+from django.core.cache import cache
+from django.test import TestCase as DjangoTestCase
+
+
+class TestCase(DjangoTestCase):
+    def _pre_setup(self):
+        super()._pre_setup()
+        cache.clear()
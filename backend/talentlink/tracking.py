@@ -0,0 +1,80 @@
+# backend/talentlink/tracking.py
+"""
+Field change tracking without a read-before-write.
+
+    class Proposal(FieldTrackerMixin, models.Model):
+        tracked_fields = ('status',)
+
+    proposal.status = 'accepted'
+    proposal.has_changed('status')   # True
+    proposal.previous('status')      # 'pending'
+
+Values are snapshotted when an instance is loaded from the database and
+again after each successful save, so ``previous``/``has_changed`` stay
+valid inside pre_save/post_save receivers and cost no queries. New
+(unsaved) instances have no previous value. A tracked field that was
+deferred when the row was loaded is fetched on first use.
+"""
+
+
+class FieldTrackerMixin:
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked()
+        return instance
+
+    def _tracked_attnames(self, names=None):
+        names = self.tracked_fields if names is None else names
+        return [(name, self._meta.get_field(name).attname) for name in names]
+
+    def _snapshot_tracked(self, names=None):
+        snapshot = self.__dict__.setdefault('_tracked_initial', {})
+        for name, attname in self._tracked_attnames(names):
+            if attname in self.__dict__:
+                snapshot[name] = self.__dict__[attname]
+
+    def previous(self, name):
+        """Value of ``name`` when the instance was loaded or last saved."""
+        if name not in self.tracked_fields:
+            raise ValueError(f'{name!r} is not tracked on {type(self).__name__}')
+        if self._is_new():
+            return None
+        snapshot = self.__dict__.setdefault('_tracked_initial', {})
+        if name not in snapshot:
+            attname = self._meta.get_field(name).attname
+            snapshot[name] = (
+                type(self)._base_manager.using(self._state.db)
+                .filter(pk=self.pk).values_list(attname, flat=True).first()
+            )
+        return snapshot[name]
+
+    def has_changed(self, name):
+        if self._is_new():
+            return True
+        return self.previous(name) != getattr(self, self._meta.get_field(name).attname)
+
+    def _tracked_in(self, fields):
+        if fields is None:
+            return None
+        fields = set(fields)
+        return [name for name, attname in self._tracked_attnames() if name in fields or attname in fields]
+
+    def _is_new(self):
+        # _state.adding is already False in post_save; _inserting covers that
+        return self._state.adding or self.__dict__.get('_inserting', False)
+
+    def save(self, *args, **kwargs):
+        self._inserting = self._state.adding
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            self._inserting = False
+        # After post_save, so receivers still see the previous values
+        self._snapshot_tracked(self._tracked_in(kwargs.get('update_fields')))
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self._snapshot_tracked(self._tracked_in(fields))
@@ -18,8 +18,8 @@ from users.views import (
 from projects.views import ProjectViewSet
 from proposals.views import ProposalViewSet
 from contracts.views import ContractViewSet, ReviewViewSet, ReviewStatsView
-from messaging.views import MessageViewSet
-from notifications.views import NotificationViewSet
+from messaging.views import MessageViewSet, message_stream
+from notifications.views import NotificationViewSet, notification_stream
 from jobs.views import JobViewSet, JobApplicationViewSet
 from workspaces.views import (
     WorkspaceViewSet,
@@ -27,6 +27,8 @@ from workspaces.views import (
     PaymentTransactionViewSet,
     PaymentRequestViewSet,
 )
+from talentlink.cache import ResponseCacheStatsView
+from talentlink.sse import StreamTicketView
 
 
 def api_root(request):
@@ -68,6 +70,11 @@ urlpatterns = [
     path("", api_root, name="api-root"),
     path("admin/", admin.site.urls),
 
+    # SSE push (ahead of the router, which would read "stream" as a message id)
+    path("api/messages/stream/", message_stream, name="message-stream"),
+    path("api/notifications/stream/", notification_stream, name="notification-stream"),
+    path("api/stream-ticket/", StreamTicketView.as_view(), name="stream-ticket"),
+
     # Router-based endpoints
     path("api/", include(router.urls)),
 
@@ -81,6 +88,9 @@ urlpatterns = [
     path("api/saved-items/", include("saved_items.urls")),
     path("api/", include("workspaces.urls")),
 
+    # Response cache hit ratio / latency (staff only)
+    path("api/cache-stats/", ResponseCacheStatsView.as_view(), name="cache-stats"),
+
     # Contact form
     path("api/contact/", ContactMessageView.as_view(), name="contact-message"),
 
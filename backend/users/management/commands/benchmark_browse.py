@@ -0,0 +1,226 @@
+# backend/users/management/commands/benchmark_browse.py
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from jobs.models import Job, JobApplication
+from jobs.views import JobViewSet, JobApplicationViewSet
+from messaging.models import Message
+from messaging.views import MessageViewSet
+from notifications.models import Notification
+from notifications.views import NotificationViewSet
+from projects.models import Project
+from projects.views import ProjectViewSet
+from proposals.models import Proposal
+from proposals.views import ProposalViewSet
+
+User = get_user_model()
+
+INDEXED_MODELS = (Project, Job, JobApplication, Proposal, Message, Notification)
+PAGE_SIZE = 20
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def explicit_created_at(*models):
+    """Let bulk_create keep the created_at we set (spread over time, like real data)."""
+    fields = [m._meta.get_field('created_at') for m in models]
+    for f in fields:
+        f.auto_now_add = False
+    try:
+        yield
+    finally:
+        for f in fields:
+            f.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed rows inside a transaction that is rolled back, then show EXPLAIN "
+        "plans and timings of each list endpoint without and with the browse indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100_000, help='Rows per seeded table')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per query (median reported)')
+        parser.add_argument('--no-explain', action='store_true', help='Only print timings')
+
+    def handle(self, *args, **options):
+        self.repeat = options['repeat']
+        self.explain = not options['no_explain']
+
+        try:
+            with transaction.atomic():
+                self.stdout.write(f"Seeding {options['rows']} rows per table (rolled back afterwards)...")
+                users = self.seed(options['rows'])
+                cases = self.cases(*users)
+
+                self.set_indexes(create=False)
+                before = {name: self.measure(build) for name, build in cases}
+                self.set_indexes(create=True)
+                after = {name: self.measure(build) for name, build in cases}
+
+                self.report(before, after)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    # ------------------------------
+    # Seed data
+    # ------------------------------
+    def seed(self, rows):
+        now = timezone.now()
+        freelancer_count = max(rows // 500, 10)
+
+        client = User.objects.create(email='bench-client@example.com', username='bench-client', role='client')
+        freelancers = User.objects.bulk_create(
+            User(email=f'bench-f{i}@example.com', username=f'bench-f{i}', role='freelancer')
+            for i in range(freelancer_count)
+        )
+        others = User.objects.bulk_create(
+            User(email=f'bench-c{i}@example.com', username=f'bench-c{i}', role='client')
+            for i in range(50)
+        )
+        owners = [client] + others
+        statuses = ('open', 'open', 'open', 'in_progress', 'completed', 'cancelled')
+
+        with explicit_created_at(Project, Job, JobApplication, Proposal, Message, Notification):
+            projects = Project.objects.bulk_create((
+                Project(
+                    client=owners[i % len(owners)], title=f'Bench project {i}', description='Seeded',
+                    budget_min=100, budget_max=1000 + i % 50_000, status=statuses[i % len(statuses)],
+                    visibility='private' if i % 10 == 0 else 'public',
+                    created_at=now - timedelta(minutes=i),
+                )
+                for i in range(rows)
+            ), batch_size=2000)
+            jobs = Job.objects.bulk_create((
+                Job(
+                    client=owners[i % len(owners)], title=f'Bench job {i}', description='Seeded',
+                    status=statuses[i % len(statuses)],
+                    visibility='private' if i % 10 == 0 else 'public',
+                    created_at=now - timedelta(minutes=i),
+                )
+                for i in range(rows)
+            ), batch_size=2000)
+            Proposal.objects.bulk_create((
+                Proposal(
+                    project=projects[i % rows], freelancer=freelancers[(i // rows) % freelancer_count],
+                    cover_letter='Seeded', bid_amount=100, estimated_time='1 week',
+                    created_at=now - timedelta(minutes=i),
+                )
+                for i in range(rows)
+            ), batch_size=2000)
+            JobApplication.objects.bulk_create((
+                JobApplication(
+                    job=jobs[i % rows], freelancer=freelancers[(i // rows) % freelancer_count],
+                    cover_letter='Seeded', bid_amount=100,
+                    created_at=now - timedelta(minutes=i),
+                )
+                for i in range(rows)
+            ), batch_size=2000)
+            Message.objects.bulk_create((
+                Message(
+                    sender=freelancers[i % freelancer_count], recipient=owners[i % len(owners)],
+                    content='Seeded', read=i % 4 != 0,
+                    created_at=now - timedelta(minutes=i),
+                )
+                for i in range(rows)
+            ), batch_size=2000)
+            Notification.objects.bulk_create((
+                Notification(
+                    user=owners[i % len(owners)] if i % 2 else freelancers[i % freelancer_count],
+                    type=Notification.TYPE_SYSTEM, title='Seeded', is_read=i % 3 != 0,
+                    created_at=now - timedelta(minutes=i),
+                )
+                for i in range(rows)
+            ), batch_size=2000)
+
+        return client, freelancers[0]
+
+    # ------------------------------
+    # Endpoints (querysets built by the real viewsets)
+    # ------------------------------
+    def view_queryset(self, viewset, user, params=None):
+        factory = APIRequestFactory()
+        request = Request(factory.get('/', params or {}))
+        request.user = user
+        view = viewset(request=request, action='list', format_kwarg=None, args=(), kwargs={})
+        return view.filter_queryset(view.get_queryset())
+
+    def cases(self, client, freelancer):
+        anon = AnonymousUser()
+        vq = self.view_queryset
+        return [
+            ('projects browse', lambda: vq(ProjectViewSet, anon)),
+            ('projects browse status=open', lambda: vq(ProjectViewSet, anon, {'status': 'open'})),
+            ('projects my_projects', lambda: vq(ProjectViewSet, client, {'my_projects': 'true'})),
+            ('jobs browse', lambda: vq(JobViewSet, anon)),
+            ('jobs browse status=open', lambda: vq(JobViewSet, anon, {'status': 'open'})),
+            ('jobs my_jobs', lambda: vq(JobViewSet, client, {'my_jobs': 'true'})),
+            ('proposals (freelancer)', lambda: vq(ProposalViewSet, freelancer)),
+            ('proposals (client)', lambda: vq(ProposalViewSet, client)),
+            ('job-applications (freelancer)', lambda: vq(JobApplicationViewSet, freelancer)),
+            ('messages', lambda: vq(MessageViewSet, client)),
+            ('notifications', lambda: vq(NotificationViewSet, client)),
+            ('notifications unread', lambda: vq(NotificationViewSet, client).filter(is_read=False)),
+        ]
+
+    # ------------------------------
+    # Index toggling
+    # ------------------------------
+    def set_indexes(self, create):
+        editor = connection.schema_editor()
+        with connection.cursor() as cursor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    sql = index.create_sql(model, editor) if create else index.remove_sql(model, editor)
+                    cursor.execute(str(sql))
+            if connection.vendor in ('sqlite', 'postgresql'):
+                cursor.execute('ANALYZE')
+
+    # ------------------------------
+    # Measuring
+    # ------------------------------
+    def _time(self, fn):
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def measure(self, build):
+        qs = build()
+        page = qs[:PAGE_SIZE]
+        return {
+            'count_ms': self._time(qs.count),
+            'page_ms': self._time(lambda: list(page.all())),
+            'plan': page.explain() if self.explain else '',
+        }
+
+    def report(self, before, after):
+        for name in before:
+            b, a = before[name], after[name]
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n== {name}'))
+            self.stdout.write(
+                f"  count: {b['count_ms']:8.2f} ms -> {a['count_ms']:8.2f} ms   "
+                f"page: {b['page_ms']:8.2f} ms -> {a['page_ms']:8.2f} ms"
+            )
+            if self.explain:
+                self.stdout.write('  plan without indexes:')
+                self.stdout.write('    ' + b['plan'].replace('\n', '\n    '))
+                self.stdout.write('  plan with indexes:')
+                self.stdout.write('    ' + a['plan'].replace('\n', '\n    '))
@@ -1,6 +1,6 @@
 # backend/users/tests.py
-from django.test import TestCase
 from django.contrib.auth import get_user_model
+from talentlink.testing import TestCase
 from .models import FreelancerProfile, Skill
 
 User = get_user_model()
@@ -1,7 +1,7 @@
 from django.core.management.base import BaseCommand
 from contracts.models import Contract
 from workspaces.models import Workspace
-from notifications.models import Notification
+from notifications.dispatch import notification_batch, notify
 
 
 class Command(BaseCommand):
@@ -38,44 +38,46 @@ class Command(BaseCommand):
         created_count = 0
         error_count = 0
         
-        for contract in contracts_without_workspace:
-            try:
-                # Create workspace
-                workspace = Workspace.objects.create(contract=contract)
-                created_count += 1
+        # Notifications are written in one bulk insert after the loop
+        with notification_batch():
+            for contract in contracts_without_workspace:
+                try:
+                    # Create workspace
+                    workspace = Workspace.objects.create(contract=contract)
+                    created_count += 1
                 
-                # Get title for notifications
-                if contract.job_application and hasattr(contract.job_application, 'job'):
-                    title = contract.job_application.job.title
-                elif contract.proposal and hasattr(contract.proposal, 'project'):
-                    title = contract.proposal.project.title
-                else:
-                    title = f"Contract #{contract.id}"
+                    # Get title for notifications
+                    if contract.job_application and hasattr(contract.job_application, 'job'):
+                        title = contract.job_application.job.title
+                    elif contract.proposal and hasattr(contract.proposal, 'project'):
+                        title = contract.proposal.project.title
+                    else:
+                        title = f"Contract #{contract.id}"
                 
-                # Notify both parties
-                if contract.client:
-                    Notification.objects.create(
-                        user=contract.client,
-                        type='WORKSPACE',
-                        title='Workspace Created',
-                        message=f'A workspace has been created for "{title}".',
-                        metadata={'workspace_id': workspace.id, 'contract_id': contract.id}
-                    )
+                    # Notify both parties
+                    if contract.client:
+                        notify(
+                            user=contract.client,
+                            type='WORKSPACE',
+                            title='Workspace Created',
+                            message=f'A workspace has been created for "{title}".',
+                            metadata={'workspace_id': workspace.id, 'contract_id': contract.id}
+                        )
                 
-                if contract.freelancer:
-                    Notification.objects.create(
-                        user=contract.freelancer,
-                        type='WORKSPACE',
-                        title='Workspace Created',
-                        message=f'A workspace has been created for "{title}".',
-                        metadata={'workspace_id': workspace.id, 'contract_id': contract.id}
-                    )
+                    if contract.freelancer:
+                        notify(
+                            user=contract.freelancer,
+                            type='WORKSPACE',
+                            title='Workspace Created',
+                            message=f'A workspace has been created for "{title}".',
+                            metadata={'workspace_id': workspace.id, 'contract_id': contract.id}
+                        )
                 
-                self.stdout.write(self.style.SUCCESS(f'  ✅ Created workspace for contract #{contract.id} (Workspace ID: {workspace.id})'))
+                    self.stdout.write(self.style.SUCCESS(f'  ✅ Created workspace for contract #{contract.id} (Workspace ID: {workspace.id})'))
                 
-            except Exception as e:
-                error_count += 1
-                self.stdout.write(self.style.ERROR(f'  ❌ Error creating workspace for contract #{contract.id}: {str(e)}'))
+                except Exception as e:
+                    error_count += 1
+                    self.stdout.write(self.style.ERROR(f'  ❌ Error creating workspace for contract #{contract.id}: {str(e)}'))
         
         # Summary
         self.stdout.write('')
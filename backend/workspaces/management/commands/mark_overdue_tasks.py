@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from workspaces.overdue import BATCH_SIZE, mark_overdue_tasks
+
+
+class Command(BaseCommand):
+    help = 'Mark open workspace tasks past their deadline as overdue (safe to run every minute)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        changed = mark_overdue_tasks(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Marked {changed} task(s) overdue.'))
@@ -2,6 +2,7 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
 from contracts.models import Contract
+from talentlink.tracking import FieldTrackerMixin
 
 User = get_user_model()
 
@@ -89,8 +90,10 @@ class Workspace(models.Model):
 
 
 
-class WorkspaceTask(models.Model):
+class WorkspaceTask(FieldTrackerMixin, models.Model):
     """Individual tasks within a workspace."""
+    tracked_fields = ('status',)
+
     STATUS_CHOICES = (
         ('todo', 'To Do'),
         ('in_progress', 'In Progress'),
@@ -0,0 +1,69 @@
+# backend/workspaces/overdue.py
+"""
+Overdue sweep.
+
+WorkspaceTask.save only flips a task to overdue when someone happens to
+save it after its deadline. ``mark_overdue_tasks`` (run every minute by
+``manage.py mark_overdue_tasks``) catches the rest: it picks open tasks
+past their deadline through the ``deadline`` index, flips each batch with
+one UPDATE and notifies both parties of every newly overdue task in one
+bulk insert. The UPDATE skips signals, so the affected users' dashboard
+summaries are dropped here. Rows are locked with SKIP LOCKED where the
+database supports it, so overlapping runs never notify twice.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from notifications.dispatch import notification_batch, notify
+from .models import WorkspaceTask
+from .stats import invalidate_workspace_summaries
+
+OPEN_STATUSES = ('todo', 'in_progress')
+BATCH_SIZE = 500
+
+
+def _notify_overdue(tasks):
+    for task in tasks:
+        contract = task.workspace.contract
+        for user in {contract.client_id, contract.freelancer_id} - {None}:
+            notify(
+                user=user,
+                type='WORKSPACE',
+                title='Task Overdue',
+                message=f'Task "{task.title}" is past its deadline.',
+                metadata={'task_id': task.id, 'workspace_id': task.workspace_id},
+            )
+
+
+def mark_overdue_tasks(now=None, batch_size=BATCH_SIZE):
+    """Flip open tasks past their deadline to overdue; returns how many changed."""
+    now = now or timezone.now()
+    changed = 0
+    while True:
+        with transaction.atomic(), notification_batch():
+            tasks = list(
+                WorkspaceTask.objects
+                .select_for_update(skip_locked=True, of=('self',))
+                .filter(deadline__lt=now, status__in=OPEN_STATUSES)
+                .select_related('workspace__contract')
+                .only('id', 'title', 'workspace__contract__client', 'workspace__contract__freelancer')
+                .order_by('deadline')[:batch_size]
+            )
+            if not tasks:
+                return changed
+            WorkspaceTask.objects.filter(pk__in=[t.id for t in tasks]).update(
+                status='overdue', updated_at=now
+            )
+            _notify_overdue(tasks)
+            user_ids = {
+                user_id for task in tasks
+                for user_id in (task.workspace.contract.client_id, task.workspace.contract.freelancer_id)
+            }
+            # Bound now: inside an outer transaction every batch's callback
+            # runs after the loop ends
+            transaction.on_commit(
+                lambda ids=frozenset(user_ids): invalidate_workspace_summaries(user_ids=ids)
+            )
+        changed += len(tasks)
+        if len(tasks) < batch_size:
+            return changed
@@ -260,6 +260,7 @@ from .models import (
     PaymentTransaction, PaymentRequest
 )
 from contracts.models import Contract
+from .stats import load_workspace_stats
 
 User = get_user_model()
 
@@ -340,17 +341,23 @@ class WorkspaceSerializer(serializers.ModelSerializer):
             return obj.contract.freelancer.get_full_name() or obj.contract.freelancer.username
         return None
 
+    def _stats(self, obj):
+        # Annotated by WorkspaceViewSet (workspaces/stats.py); one query otherwise
+        if not hasattr(obj, 'paid_total'):
+            load_workspace_stats(obj)
+        return obj
+
     def get_total_tasks(self, obj):
-        return obj.tasks.count()
+        return self._stats(obj).task_count
 
     def get_completed_tasks(self, obj):
-        return obj.tasks.filter(status='completed').count()
+        return self._stats(obj).completed_task_count
 
     def get_pending_tasks(self, obj):
-        return obj.tasks.filter(status__in=['todo', 'in_progress']).count()
+        return self._stats(obj).pending_task_count
 
     def get_overdue_tasks(self, obj):
-        return obj.tasks.filter(status='overdue').count()
+        return self._stats(obj).overdue_task_count
 
     def get_total_amount(self, obj):
         """Get contract total amount"""
@@ -363,8 +370,7 @@ class WorkspaceSerializer(serializers.ModelSerializer):
 
     def get_paid_amount(self, obj):
         """Sum of confirmed payments"""
-        confirmed = obj.payments.filter(status='confirmed')
-        return float(sum(p.amount for p in confirmed))
+        return float(self._stats(obj).paid_total)
 
     def get_remaining_amount(self, obj):
         """Remaining amount to be paid"""
@@ -1,7 +1,9 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from contracts.models import Contract
-from .models import Workspace
+from .models import PaymentRequest, PaymentTransaction, Workspace, WorkspaceTask
+from .stats import invalidate_payment_timeline, invalidate_workspace_summaries
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,10 @@ def create_workspace_on_contract_update(sender, instance, created, **kwargs):
     
     This runs on EVERY contract save, checking if conditions are met.
     """
+    # Only signing or a status change can make a contract need a workspace
+    if not created and not any(instance.has_changed(name) for name in Contract.tracked_fields):
+        return
+
     try:
         # Check if workspace already exists
         if hasattr(instance, 'workspace'):
@@ -35,7 +41,7 @@ def create_workspace_on_contract_update(sender, instance, created, **kwargs):
         logger.info(f"âœ… Workspace created successfully for contract #{instance.id} (ID: {workspace.id})")
         
         # Send notification to both parties
-        from notifications.models import Notification
+        from notifications.dispatch import notify
         
         # Get contract title
         if instance.job_application and hasattr(instance.job_application, 'job'):
@@ -47,7 +53,7 @@ def create_workspace_on_contract_update(sender, instance, created, **kwargs):
         
         # Notify client
         if instance.client:
-            Notification.objects.create(
+            notify(
                 user=instance.client,
                 type='WORKSPACE',
                 title='Workspace Created',
@@ -57,7 +63,7 @@ def create_workspace_on_contract_update(sender, instance, created, **kwargs):
         
         # Notify freelancer
         if instance.freelancer:
-            Notification.objects.create(
+            notify(
                 user=instance.freelancer,
                 type='WORKSPACE',
                 title='Workspace Created',
@@ -66,4 +72,32 @@ def create_workspace_on_contract_update(sender, instance, created, **kwargs):
             )
         
     except Exception as e:
-        logger.error(f"âŒ Error creating workspace for contract #{instance.id}: {str(e)}", exc_info=True)
\ No newline at end of file
+        logger.error(f"âŒ Error creating workspace for contract #{instance.id}: {str(e)}", exc_info=True)
+
+
+@receiver(post_save, sender=PaymentTransaction)
+@receiver(post_delete, sender=PaymentTransaction)
+def invalidate_payment_stats(sender, instance, **kwargs):
+    """Drop the cached payment_stats timeline once the change commits."""
+    workspace_id = instance.workspace_id
+    transaction.on_commit(lambda: invalidate_payment_timeline(workspace_id))
+
+
+@receiver(post_save, sender=WorkspaceTask)
+@receiver(post_delete, sender=WorkspaceTask)
+@receiver(post_save, sender=PaymentTransaction)
+@receiver(post_delete, sender=PaymentTransaction)
+@receiver(post_save, sender=PaymentRequest)
+@receiver(post_delete, sender=PaymentRequest)
+def invalidate_summaries_for_workspace_item(sender, instance, **kwargs):
+    """Drop both parties' cached dashboard summary once the change commits."""
+    workspace_id = instance.workspace_id
+    transaction.on_commit(lambda: invalidate_workspace_summaries(workspace_ids=[workspace_id]))
+
+
+@receiver(post_save, sender=Workspace)
+@receiver(post_delete, sender=Workspace)
+def invalidate_summaries_for_workspace(sender, instance, **kwargs):
+    contract = instance.contract
+    user_ids = [contract.client_id, contract.freelancer_id]
+    transaction.on_commit(lambda: invalidate_workspace_summaries(user_ids=user_ids))
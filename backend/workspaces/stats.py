@@ -0,0 +1,199 @@
+# backend/workspaces/stats.py
+"""
+Per-workspace task and payment figures as queryset annotations.
+
+``with_workspace_stats`` adds task counts by status (conditional Count
+over one join) and the confirmed payment total (a correlated Sum, so the
+payments never multiply the task rows). WorkspaceSerializer reads these
+instead of querying per workspace; ``load_workspace_stats`` fills them
+in for an instance that was fetched without them.
+
+``payment_timeline`` builds the payment_stats chart with a window function
+(running ``SUM() OVER``) in one query, cached per workspace until one of
+its payments changes.
+
+``workspace_summary`` totals a user's figures across all their workspaces
+in four grouped queries however many workspaces they have, cached per
+user until a task, payment or request in one of them changes.
+"""
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, DecimalField, F, OuterRef, Q, Subquery, Sum, Value, Window
+from django.db.models.functions import Coalesce, Greatest, TruncDate, TruncWeek
+
+from .models import PaymentRequest, PaymentTransaction, Workspace, WorkspaceTask
+
+PENDING_TASK_STATUSES = ('todo', 'in_progress')
+TIMELINE_BUCKETS = {'day': TruncDate, 'week': TruncWeek}
+TIMELINE_CACHE_KEY = 'paymenttimeline:{}:{}'
+SUMMARY_CACHE_KEY = 'workspacesummary:{}'
+MONEY = DecimalField(max_digits=12, decimal_places=2)
+STAT_FIELDS = ('task_count', 'completed_task_count', 'pending_task_count', 'overdue_task_count', 'paid_total')
+
+
+def confirmed_total(outer_ref='pk'):
+    """Subquery: confirmed payment total of the workspace at ``outer_ref``."""
+    paid = (
+        PaymentTransaction.objects
+        .filter(workspace=OuterRef(outer_ref), status='confirmed')
+        .order_by()
+        .values('workspace')
+        .annotate(total=Sum('amount'))
+        .values('total')
+    )
+    return Coalesce(Subquery(paid), Value(Decimal('0')), output_field=MONEY)
+
+
+def with_workspace_stats(queryset):
+    return queryset.annotate(
+        task_count=Count('tasks'),
+        completed_task_count=Count('tasks', filter=Q(tasks__status='completed')),
+        pending_task_count=Count('tasks', filter=Q(tasks__status__in=PENDING_TASK_STATUSES)),
+        overdue_task_count=Count('tasks', filter=Q(tasks__status='overdue')),
+        paid_total=confirmed_total(),
+    )
+
+
+def load_workspace_stats(workspace):
+    """Set the stat attributes on ``workspace`` with one query."""
+    values = with_workspace_stats(Workspace.objects.filter(pk=workspace.pk)).values(*STAT_FIELDS).first()
+    for name in STAT_FIELDS:
+        setattr(workspace, name, values[name] if values else 0)
+    return workspace
+
+
+def _confirmed_payments(workspace_id):
+    return PaymentTransaction.objects.filter(workspace_id=workspace_id, status='confirmed').order_by()
+
+
+def _timeline_rows(workspace_id):
+    """One entry per confirmed payment, oldest first."""
+    rows = (
+        _confirmed_payments(workspace_id)
+        .annotate(cumulative=Window(Sum('amount'), order_by=[F('created_at').asc(), F('id').asc()]))
+        .order_by('created_at', 'id')
+        .values('created_at', 'amount', 'cumulative', 'description')
+    )
+    return [
+        {
+            'date': row['created_at'].strftime('%Y-%m-%d'),
+            'amount': float(row['amount']),
+            'cumulative': float(row['cumulative']),
+            'description': row['description'],
+        }
+        for row in rows
+    ]
+
+
+def _timeline_buckets(workspace_id, bucket):
+    """
+    One entry per day/week. Each payment row carries its bucket's total and
+    count (partitioned window) and the running total through the bucket
+    (the default RANGE frame includes peers); DISTINCT keeps one per bucket.
+    """
+    period = TIMELINE_BUCKETS[bucket]('created_at')
+    rows = (
+        _confirmed_payments(workspace_id)
+        .annotate(
+            period=period,
+            bucket_amount=Window(Sum('amount'), partition_by=period),
+            bucket_count=Window(Count('id'), partition_by=period),
+            cumulative=Window(Sum('amount'), order_by=period.asc()),
+        )
+        .values('period', 'bucket_amount', 'bucket_count', 'cumulative')
+        .distinct()
+        .order_by('period')
+    )
+    return [
+        {
+            'date': row['period'].strftime('%Y-%m-%d'),
+            'amount': float(row['bucket_amount']),
+            'cumulative': float(row['cumulative']),
+            'count': row['bucket_count'],
+        }
+        for row in rows
+    ]
+
+
+def payment_timeline(workspace_id, bucket=None):
+    """
+    Cumulative confirmed payments for the payment_stats chart, per payment
+    or per ``bucket`` ('day' / 'week').
+    """
+    key = TIMELINE_CACHE_KEY.format(workspace_id, bucket or 'payment')
+    timeline = cache.get(key)
+    if timeline is None:
+        if bucket:
+            timeline = _timeline_buckets(workspace_id, bucket)
+        else:
+            timeline = _timeline_rows(workspace_id)
+        cache.set(key, timeline, settings.PAYMENT_TIMELINE_CACHE_SECONDS)
+    return timeline
+
+
+def invalidate_payment_timeline(workspace_id):
+    cache.delete_many([
+        TIMELINE_CACHE_KEY.format(workspace_id, bucket) for bucket in ('payment', *TIMELINE_BUCKETS)
+    ])
+
+
+def _user_workspaces(user_id):
+    return Workspace.objects.filter(Q(contract__client_id=user_id) | Q(contract__freelancer_id=user_id))
+
+
+def _compute_summary(user_id):
+    workspaces = _user_workspaces(user_id)
+    tasks = WorkspaceTask.objects.filter(workspace__in=workspaces).aggregate(
+        open_tasks=Count('id', filter=Q(status__in=PENDING_TASK_STATUSES)),
+        overdue_tasks=Count('id', filter=Q(status='overdue')),
+    )
+    requests = PaymentRequest.objects.filter(workspace__in=workspaces).aggregate(
+        pending_payment_requests=Count('id', filter=Q(status='pending')),
+    )
+    payments = PaymentTransaction.objects.filter(workspace__in=workspaces).aggregate(
+        unconfirmed_payments=Count('id', filter=Q(status='pending')),
+        amount_paid=Coalesce(Sum('amount', filter=Q(status='confirmed')), Value(Decimal('0')), output_field=MONEY),
+    )
+    # Contract value less confirmed payments, floored at zero per workspace
+    owed = workspaces.annotate(
+        owed=Greatest(
+            Coalesce(
+                'contract__proposal__bid_amount', 'contract__job_application__bid_amount',
+                Value(Decimal('0')), output_field=MONEY,
+            ) - confirmed_total(),
+            Value(Decimal('0')),
+            output_field=MONEY,
+        ),
+    ).aggregate(workspaces=Count('id'), amount_owed=Sum('owed'))
+
+    return {
+        'workspaces': owed['workspaces'],
+        **tasks,
+        **requests,
+        'unconfirmed_payments': payments['unconfirmed_payments'],
+        'amount_paid': float(payments['amount_paid']),
+        'amount_owed': float(owed['amount_owed'] or 0),
+    }
+
+
+def workspace_summary(user_id):
+    """Totals across every workspace ``user_id`` is a client or freelancer on."""
+    key = SUMMARY_CACHE_KEY.format(user_id)
+    summary = cache.get(key)
+    if summary is None:
+        summary = _compute_summary(user_id)
+        cache.set(key, summary, settings.WORKSPACE_SUMMARY_CACHE_SECONDS)
+    return summary
+
+
+def invalidate_workspace_summaries(user_ids=(), workspace_ids=()):
+    """Drop the cached summaries of ``user_ids`` and of both parties on ``workspace_ids``."""
+    user_ids = set(user_ids)
+    if workspace_ids:
+        for client_id, freelancer_id in Workspace.objects.filter(pk__in=workspace_ids).values_list(
+            'contract__client_id', 'contract__freelancer_id'
+        ):
+            user_ids.update((client_id, freelancer_id))
+    cache.delete_many([SUMMARY_CACHE_KEY.format(user_id) for user_id in user_ids if user_id])
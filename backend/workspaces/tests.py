@@ -1,3 +1,269 @@
-from django.test import TestCase
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.http import http_date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from contracts.models import Contract
+from notifications.models import Notification
+from talentlink.testing import TestCase
+from .models import PaymentRequest, PaymentTransaction, Workspace, WorkspaceTask
+from .overdue import mark_overdue_tasks
+from .stats import SUMMARY_CACHE_KEY, workspace_summary
+
+User = get_user_model()
+
+
+class WorkspaceStatsTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='ws-client@example.com', username='wsclient', password='pass123', role='client'
+        )
+        self.freelancer = User.objects.create_user(
+            email='ws-freelancer@example.com', username='wsfreelancer', password='pass123', role='freelancer'
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.client_user)
+
+    def _workspace(self):
+        contract = Contract.objects.create(
+            client=self.client_user, freelancer=self.freelancer,
+            status='active', client_signed=True, freelancer_signed=True,
+        )
+        workspace = Workspace.objects.get(contract=contract)
+        for task_status in ('todo', 'in_progress', 'completed', 'completed'):
+            WorkspaceTask.objects.create(
+                workspace=workspace, title='Task', created_by=self.client_user, status=task_status
+            )
+        for amount, payment_status in ((Decimal('100.50'), 'confirmed'), (Decimal('40'), 'confirmed'),
+                                       (Decimal('999'), 'pending')):
+            PaymentTransaction.objects.create(
+                workspace=workspace, amount=amount, paid_by=self.client_user, status=payment_status
+            )
+        return workspace
+
+    def _list(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api.get('/api/workspaces/')
+        return response, len(queries)
+
+    def test_list_query_count_does_not_grow_with_workspaces(self):
+        self._workspace()
+        response, single = self._list()
+        row = response.data[0] if isinstance(response.data, list) else response.data['results'][0]
+        self.assertEqual(
+            (row['total_tasks'], row['completed_tasks'], row['pending_tasks'], row['overdue_tasks']),
+            (4, 2, 2, 0),
+        )
+        self.assertEqual(row['paid_amount'], 140.5)
+
+        self._workspace()
+        self._workspace()
+        _, several = self._list()
+        self.assertEqual(several, single)
+
+    def test_validators_do_not_join_tasks_with_payments(self):
+        workspace = self._workspace()
+        first = self.api.get('/api/workspaces/')
+        with CaptureQueriesContext(connection) as queries:
+            again = self.api.get('/api/workspaces/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('JOIN "workspaces_paymenttransaction"', queries[0]['sql'])
+        self.assertNotIn('JOIN "workspaces_workspacetask"', queries[0]['sql'])
+
+        PaymentTransaction.objects.create(workspace=workspace, amount=Decimal('5'), paid_by=self.client_user)
+        changed = self.api.get('/api/workspaces/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+
+    def test_if_modified_since_sees_task_changes(self):
+        workspace = self._workspace()
+        url = f'/api/workspaces/{workspace.id}/'
+        self.assertNotIn('Last-Modified', self.api.get(url))
+
+        task = workspace.tasks.get(status='todo')
+        task.status = 'completed'
+        task.save()
+        # Newer than the workspace row itself, which the task update didn't touch
+        since = http_date((timezone.now() + timedelta(minutes=1)).timestamp())
+        response = self.api.get(url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['completed_tasks'], 3)
+
+
+class PaymentTimelineTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='pay-client@example.com', username='payclient', password='pass123', role='client'
+        )
+        contract = Contract.objects.create(
+            client=self.client_user, status='active', client_signed=True, freelancer_signed=True,
+        )
+        self.workspace = Workspace.objects.get(contract=contract)
+        self.api = APIClient()
+        self.api.force_authenticate(self.client_user)
+        self.url = f'/api/workspaces/{self.workspace.id}/payment_stats/'
+
+    def _pay(self, amount, day, status='confirmed'):
+        payment = PaymentTransaction.objects.create(
+            workspace=self.workspace, amount=Decimal(amount), paid_by=self.client_user, status=status
+        )
+        PaymentTransaction.objects.filter(pk=payment.pk).update(created_at=f'2026-03-{day:02d}T12:00:00Z')
+
+    def test_running_totals_per_payment_and_per_day(self):
+        self._pay('10', 1)
+        self._pay('5', 1)
+        self._pay('20', 3)
+        self._pay('99', 2, status='pending')
+
+        response = self.api.get(self.url)
+        self.assertEqual([e['cumulative'] for e in response.data['timeline']], [10.0, 15.0, 35.0])
+        self.assertEqual(response.data['payment_count'], 3)
+        self.assertEqual(response.data['paid_amount'], 35.0)
+
+        daily = self.api.get(self.url, {'bucket': 'day'}).data['timeline']
+        self.assertEqual(
+            [(e['date'], e['amount'], e['cumulative'], e['count']) for e in daily],
+            [('2026-03-01', 15.0, 15.0, 2), ('2026-03-03', 20.0, 35.0, 1)],
+        )
+        self.assertEqual(self.api.get(self.url, {'bucket': 'year'}).status_code, 400)
+
+    def test_timeline_is_cached_until_a_payment_changes(self):
+        self._pay('10', 1)
+        with self.assertNumQueries(2):
+            self.api.get(self.url)
+        # Cached timeline: only the annotated workspace lookup remains
+        with self.assertNumQueries(1):
+            self.api.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._pay('7', 2)
+        self.assertEqual(self.api.get(self.url).data['timeline'][-1]['cumulative'], 17.0)
+
+
+class OverdueSweepTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='due-client@example.com', username='dueclient', password='pass123', role='client'
+        )
+        self.freelancer = User.objects.create_user(
+            email='due-freelancer@example.com', username='duefreelancer', password='pass123', role='freelancer'
+        )
+        contract = Contract.objects.create(
+            client=self.client_user, freelancer=self.freelancer,
+            status='active', client_signed=True, freelancer_signed=True,
+        )
+        self.workspace = Workspace.objects.get(contract=contract)
+
+    def _task(self, status, days):
+        task = WorkspaceTask.objects.create(
+            workspace=self.workspace, title=f'{status} {days}', created_by=self.client_user, status=status
+        )
+        # Bypass save() so only the sweep can flip it
+        WorkspaceTask.objects.filter(pk=task.pk).update(deadline=timezone.now() + timedelta(days=days))
+        return task
+
+    def test_sweep_flips_open_past_deadline_tasks_once(self):
+        late = [self._task('todo', -2), self._task('in_progress', -1)]
+        self._task('completed', -1)
+        self._task('todo', 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(mark_overdue_tasks(batch_size=1), 2)
+        self.assertEqual(
+            set(WorkspaceTask.objects.filter(status='overdue').values_list('id', flat=True)),
+            {task.id for task in late},
+        )
+        self.assertEqual(Notification.objects.filter(title='Task Overdue').count(), 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(mark_overdue_tasks(), 0)
+        self.assertEqual(Notification.objects.filter(title='Task Overdue').count(), 4)
+
+    def test_every_batch_drops_its_summaries(self):
+        self._task('todo', -2)
+        other_client = User.objects.create_user(
+            email='due-other@example.com', username='dueother', password='pass123', role='client'
+        )
+        contract = Contract.objects.create(
+            client=other_client, freelancer=self.freelancer,
+            status='active', client_signed=True, freelancer_signed=True,
+        )
+        self.workspace = Workspace.objects.get(contract=contract)
+        self._task('todo', -1)
+        users = (self.client_user.id, self.freelancer.id, other_client.id)
+        for user_id in users:
+            workspace_summary(user_id)
+
+        # One batch per task, all committed together at the end
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(mark_overdue_tasks(batch_size=1), 2)
+        self.assertEqual(cache.get_many([SUMMARY_CACHE_KEY.format(user_id) for user_id in users]), {})
+
+
+class WorkspaceSummaryTests(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            email='sum-client@example.com', username='sumclient', password='pass123', role='client'
+        )
+        self.freelancer = User.objects.create_user(
+            email='sum-freelancer@example.com', username='sumfreelancer', password='pass123', role='freelancer'
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(self.freelancer)
+
+    def _workspace(self):
+        contract = Contract.objects.create(
+            client=self.client_user, freelancer=self.freelancer,
+            status='active', client_signed=True, freelancer_signed=True,
+        )
+        workspace = Workspace.objects.get(contract=contract)
+        for task_status in ('todo', 'in_progress', 'overdue', 'completed'):
+            WorkspaceTask.objects.create(
+                workspace=workspace, title='Task', created_by=self.client_user, status=task_status
+            )
+        PaymentTransaction.objects.create(
+            workspace=workspace, amount=Decimal('30'), paid_by=self.client_user, status='confirmed'
+        )
+        PaymentTransaction.objects.create(workspace=workspace, amount=Decimal('5'), paid_by=self.client_user)
+        PaymentRequest.objects.create(workspace=workspace, freelancer=self.freelancer, amount=Decimal('10'))
+        return workspace
+
+    def _summary(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api.get('/api/workspaces/summary/')
+        return response.data, len(queries)
+
+    def test_totals_in_a_fixed_number_of_queries(self):
+        self._workspace()
+        _, single = self._summary()
+        cache.clear()
+        self._workspace()
+        self._workspace()
+        summary, several = self._summary()
+
+        self.assertEqual(several, single)
+        self.assertEqual(summary, {
+            'workspaces': 3,
+            'open_tasks': 6,
+            'overdue_tasks': 3,
+            'pending_payment_requests': 3,
+            'unconfirmed_payments': 3,
+            'amount_paid': 90.0,
+            'amount_owed': 0.0,
+        })
+
+    def test_cached_until_a_task_changes(self):
+        workspace = self._workspace()
+        self._summary()
+        _, cached = self._summary()
+        self.assertEqual(cached, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkspaceTask.objects.create(workspace=workspace, title='New', created_by=self.client_user)
+        self.assertEqual(self._summary()[0]['open_tasks'], 3)
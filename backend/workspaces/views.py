@@ -1,7 +1,8 @@
 # backend/workspaces/views.py
-from django.db.models import Q
+from django.db.models import Q, Count, Max, OuterRef, Subquery, Sum
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from .models import (
@@ -14,24 +15,54 @@ from .serializers import (
     PaymentRequestSerializer, WorkspaceTaskCreateSerializer,
     PaymentTransactionCreateSerializer
 )
-from notifications.models import Notification
+from .stats import TIMELINE_BUCKETS, payment_timeline, with_workspace_stats, workspace_summary
+from notifications.dispatch import notify
+from talentlink.conditional import ConditionalGetMixin
 
 
-class WorkspaceViewSet(viewsets.ModelViewSet):
+class WorkspaceViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Workspace management
     """
     serializer_class = WorkspaceSerializer
     permission_classes = [IsAuthenticated]
+    # Tasks and payments change without moving updated_at (ETag only)
+    conditional_last_modified = False
 
     def get_queryset(self):
-        user = self.request.user
-        return Workspace.objects.filter(
-            Q(contract__client=user) | Q(contract__freelancer=user)
-        ).select_related(
+        # Task/payment figures come from annotations (workspaces/stats.py).
+        # Meta.ordering doesn't apply to grouped queries, so order explicitly.
+        return with_workspace_stats(self.get_base_queryset().select_related(
             'contract', 'contract__client', 'contract__freelancer',
-            'contract__proposal', 'contract__job_application'
-        ).prefetch_related('tasks', 'payments')
+            'contract__proposal__project', 'contract__job_application__job'
+        )).order_by('-created_at')
+
+    def get_base_queryset(self):
+        user = self.request.user
+        return Workspace.objects.filter(Q(contract__client=user) | Q(contract__freelancer=user))
+
+    def get_validator_base_queryset(self):
+        # One correlated subquery per relation; joining tasks and payments
+        # in the same query would multiply their rows
+        tasks = WorkspaceTask.objects.filter(workspace=OuterRef('pk')).order_by().values('workspace')
+        payments = PaymentTransaction.objects.filter(workspace=OuterRef('pk')).order_by().values('workspace')
+        return self.get_base_queryset().annotate(
+            last_task_update=Subquery(tasks.annotate(v=Max('updated_at')).values('v')),
+            task_total=Subquery(tasks.annotate(v=Count('pk')).values('v')),
+            last_payment_confirmed=Subquery(payments.annotate(v=Max('confirmed_at')).values('v')),
+            payment_total=Subquery(payments.annotate(v=Count('pk')).values('v')),
+        )
+
+    def get_conditional_aggregates(self):
+        # Task and payment stats plus contract status/title are part of the body
+        return {
+            **super().get_conditional_aggregates(),
+            'contract_modified': Max('contract__updated_at'),
+            'tasks_modified': Max('last_task_update'),
+            'tasks': Sum('task_total'),
+            'payments_confirmed': Max('last_payment_confirmed'),
+            'payments': Sum('payment_total'),
+        }
 
     @action(detail=True, methods=['post'])
     def mark_complete(self, request, pk=None):
@@ -72,7 +103,7 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
             else workspace.contract.client
         )
 
-        Notification.objects.create(
+        notify(
             user=other_party,
             type='WORKSPACE',
             title='Workspace Completion Confirmation',
@@ -83,7 +114,7 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
         if workspace.is_fully_completed:
             # Notify both parties once engagement is fully done
             for u in [workspace.contract.client, workspace.contract.freelancer]:
-                Notification.objects.create(
+                notify(
                     user=u,
                     type='WORKSPACE',
                     title='Workspace Completed!',
@@ -96,38 +127,41 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
             'workspace': WorkspaceSerializer(workspace, context={'request': request}).data
         })
 
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        """
+        Dashboard totals across all of the user's workspaces: open/overdue
+        tasks, pending payment requests, unconfirmed payments, amounts
+        paid/owed. A fixed handful of grouped queries, cached per user.
+        """
+        return Response(workspace_summary(request.user.id))
+
     @action(detail=True, methods=['get'])
     def payment_stats(self, request, pk=None):
         """
         Get payment statistics for charts.
+        ?bucket=day|week groups the timeline per period.
         """
-        workspace = self.get_object()
+        bucket = request.query_params.get('bucket') or None
+        if bucket is not None and bucket not in TIMELINE_BUCKETS:
+            raise ValidationError({'bucket': f'Expected one of: {", ".join(TIMELINE_BUCKETS)}.'})
 
+        # Totals come from the annotated workspace (workspaces/stats.py)
+        workspace = self.get_object()
         serializer = WorkspaceSerializer(workspace, context={'request': request})
         total = serializer.get_total_amount(workspace)
         paid = serializer.get_paid_amount(workspace)
         remaining = serializer.get_remaining_amount(workspace)
 
-        payments = workspace.payments.filter(status='confirmed').order_by('created_at')
-
-        timeline = []
-        cumulative = 0.0
-        for payment in payments:
-            amount = float(payment.amount)
-            cumulative += amount
-            timeline.append({
-                'date': payment.created_at.strftime('%Y-%m-%d'),
-                'amount': amount,
-                'cumulative': cumulative,
-                'description': payment.description
-            })
+        timeline = payment_timeline(workspace.id, bucket)
+        payment_count = sum(entry['count'] for entry in timeline) if bucket else len(timeline)
 
         return Response({
             'total_amount': total,
             'paid_amount': paid,
             'remaining_amount': remaining,
             'payment_percentage': round((paid / total * 100) if total > 0 else 0, 2),
-            'payment_count': payments.count(),
+            'payment_count': payment_count,
             'timeline': timeline
         })
 
@@ -175,7 +209,7 @@ class WorkspaceTaskViewSet(viewsets.ModelViewSet):
 
         # Notify assigned user (freelancer)
         if task.assigned_to and task.assigned_to != self.request.user:
-            Notification.objects.create(
+            notify(
                 user=task.assigned_to,
                 type='WORKSPACE',
                 title='New Task Assigned',
@@ -206,18 +240,18 @@ class WorkspaceTaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        old_status = task.status
         task.status = new_status
+        completed_now = new_status == 'completed' and task.has_changed('status')
         task.save()
 
-        # Notify relevant party when completed
-        if new_status == 'completed':
+        # Notify relevant party when completed (not again on a repeat request)
+        if completed_now:
             other_user = (
                 task.workspace.contract.client
                 if request.user == task.workspace.contract.freelancer
                 else task.workspace.contract.freelancer
             )
-            Notification.objects.create(
+            notify(
                 user=other_user,
                 type='WORKSPACE',
                 title='Task Completed',
@@ -259,7 +293,7 @@ class WorkspaceTaskViewSet(viewsets.ModelViewSet):
         )
 
         if other_user != request.user:
-            Notification.objects.create(
+            notify(
                 user=other_user,
                 type='WORKSPACE',
                 title='New Comment on Task',
@@ -308,7 +342,7 @@ class PaymentTransactionViewSet(viewsets.ModelViewSet):
         )
 
         # Notify freelancer
-        Notification.objects.create(
+        notify(
             user=workspace.contract.freelancer,
             type='PAYMENT',
             title='Payment Logged',
@@ -338,7 +372,7 @@ class PaymentTransactionViewSet(viewsets.ModelViewSet):
         payment.confirm_payment()
 
         # Notify client
-        Notification.objects.create(
+        notify(
             user=payment.paid_by,
             type='PAYMENT',
             title='Payment Confirmed',
@@ -380,7 +414,7 @@ class PaymentRequestViewSet(viewsets.ModelViewSet):
         serializer.save(freelancer=self.request.user)
 
         # Notify client
-        Notification.objects.create(
+        notify(
             user=workspace.contract.client,
             type='PAYMENT',
             title='Payment Request',
@@ -411,7 +445,7 @@ class PaymentRequestViewSet(viewsets.ModelViewSet):
         payment_request.save()
 
         # Notify freelancer
-        Notification.objects.create(
+        notify(
             user=payment_request.freelancer,
             type='PAYMENT',
             title='Payment Request Approved',
@@ -449,7 +483,7 @@ class PaymentRequestViewSet(viewsets.ModelViewSet):
         reason = request.data.get('reason', '')
 
         # Notify freelancer
-        Notification.objects.create(
+        notify(
             user=payment_request.freelancer,
             type='PAYMENT',
             title='Payment Request Rejected',
@@ -19,8 +19,8 @@ export const messagesAPI = {
   // Get all conversations
   getConversations: () => client.get('/messages/conversations/'),
   
-  // Get messages with a specific user
-  getWithUser: (userId) => client.get(`/messages/with/${userId}/`),
+  // Get messages with a specific user (?after_id / ?before_id / ?limit windows)
+  getWithUser: (userId, params) => client.get(`/messages/with/${userId}/`, { params }),
   
   // Send a message
   send: (data) => client.post('/messages/', data),
@@ -9,6 +9,10 @@ export const reviewsAPI = {
   // Get review statistics
   getStats: (userId) => 
     client.get('/review-stats/for_user/', { params: { user_id: userId } }),
+
+  // Review statistics for many users at once -> { [userId]: stats }
+  getStatsForUsers: (userIds) =>
+    client.get('/review-stats/for_user/', { params: { user_ids: userIds.join(',') } }),
   
   // Create a review
   create: (data) => client.post('/reviews/', data),
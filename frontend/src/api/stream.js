@@ -0,0 +1,64 @@
+// frontend/src/api/stream.js
+import client from './client';
+
+const RECONNECT_DELAY = 3000;
+
+// Open a Server-Sent Events stream (backend talentlink/sse.py).
+//
+// EventSource can't send the Authorization header, so each connection uses a
+// single-use ticket from /stream-ticket/. A used ticket can't reconnect, so on
+// error the stream reopens itself with a fresh ticket and ?last_id= to replay
+// what it missed. If the first connection never opens (the server answers 204
+// when it can't stream, or the ticket request fails) onUnavailable is called
+// and the caller should poll instead.
+//
+// handlers: { eventName: (data) => ... }. Returns a function that closes it.
+export function openEventStream(path, handlers, { onUnavailable } = {}) {
+  let source = null;
+  let timer = null;
+  let closed = false;
+  let opened = false;
+  let lastId = null;
+
+  const connect = async () => {
+    let ticket;
+    try {
+      ticket = (await client.post('/stream-ticket/')).data.ticket;
+    } catch (err) {
+      if (!closed && !opened && onUnavailable) onUnavailable();
+      return;
+    }
+    if (closed) return;
+
+    const params = new URLSearchParams({ ticket });
+    if (lastId) params.set('last_id', lastId);
+    source = new EventSource(`${client.defaults.baseURL}${path}?${params}`);
+
+    source.onopen = () => {
+      opened = true;
+    };
+    Object.entries(handlers).forEach(([name, handler]) => {
+      source.addEventListener(name, (event) => {
+        if (event.lastEventId) lastId = event.lastEventId;
+        handler(JSON.parse(event.data));
+      });
+    });
+    source.onerror = () => {
+      source.close();
+      if (closed) return;
+      if (!opened) {
+        if (onUnavailable) onUnavailable();
+        return;
+      }
+      timer = setTimeout(connect, RECONNECT_DELAY);
+    };
+  };
+
+  connect();
+
+  return () => {
+    closed = true;
+    clearTimeout(timer);
+    if (source) source.close();
+  };
+}
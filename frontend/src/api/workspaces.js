@@ -5,7 +5,8 @@ export const workspacesAPI = {
   list: () => client.get('/workspaces/'),
   get: (id) => client.get(`/workspaces/${id}/`),
   markComplete: (id) => client.post(`/workspaces/${id}/mark_complete/`),
-  getPaymentStats: (id) => client.get(`/workspaces/${id}/payment_stats/`),
+  getPaymentStats: (id, params = {}) => client.get(`/workspaces/${id}/payment_stats/`, { params }),
+  getSummary: () => client.get('/workspaces/summary/'),
   
   // Tasks
   getTasks: (workspaceId) => client.get('/tasks/', { params: { workspace: workspaceId } }),
@@ -2,6 +2,7 @@
 import { useState, useEffect, useRef } from 'react';
 import { Send } from 'lucide-react';
 import { messagesAPI } from '../api/messages';
+import { openEventStream } from '../api/stream';
 
 export default function ChatWindow({ user, recipientId, recipientName }) {
   const [messages, setMessages] = useState([]);
@@ -11,8 +12,35 @@ export default function ChatWindow({ user, recipientId, recipientName }) {
   useEffect(() => {
     if (recipientId) {
       loadMessages();
-      const interval = setInterval(loadMessages, 3000); // Poll every 3 seconds
-      return () => clearInterval(interval);
+
+      // Pushed over SSE; poll every 3 seconds only if the server can't stream
+      let interval = null;
+      const closeStream = openEventStream(
+        '/messages/stream/',
+        {
+          message: (message) => {
+            const other = Number(recipientId);
+            if (message.sender !== other && message.recipient !== other) return;
+            setMessages((prev) =>
+              prev.some((m) => m.id === message.id) ? prev : [...prev, message]
+            );
+            if (message.sender === other) {
+              // Fetching the thread marks it read; after_id keeps the response empty
+              messagesAPI.getWithUser(recipientId, { after_id: message.id });
+            }
+          },
+        },
+        {
+          onUnavailable: () => {
+            if (!interval) interval = setInterval(loadMessages, 3000);
+          },
+        }
+      );
+
+      return () => {
+        closeStream();
+        clearInterval(interval);
+      };
     }
   }, [recipientId]);
 
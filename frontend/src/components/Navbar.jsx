@@ -16,6 +16,7 @@ import {
 import { useState, useRef, useEffect } from 'react';
 import { notificationsAPI } from '../api/notifications';
 import { messagesAPI } from '../api/messages';
+import { openEventStream } from '../api/stream';
 import { Star, Bookmark } from 'lucide-react';
 
 export default function Navbar({ user, setUser, loading }) {
@@ -99,8 +100,31 @@ export default function Navbar({ user, setUser, loading }) {
     };
 
     fetchNotifications();
-    const interval = setInterval(fetchNotifications, 5000);
-    return () => clearInterval(interval);
+
+    // Pushed over SSE; poll every 5s only if the server can't stream
+    let interval = null;
+    const closeStream = openEventStream(
+      '/notifications/stream/',
+      {
+        notification: ({ notification, unread_count }) => {
+          setNotifications((prev) =>
+            prev.some((n) => n.id === notification.id) ? prev : [notification, ...prev]
+          );
+          setUnreadCount(unread_count);
+        },
+        unread: ({ unread_count }) => setUnreadCount(unread_count),
+      },
+      {
+        onUnavailable: () => {
+          if (!interval) interval = setInterval(fetchNotifications, 5000);
+        },
+      }
+    );
+
+    return () => {
+      closeStream();
+      clearInterval(interval);
+    };
   }, [user]);
 
   const handleMarkAllRead = async () => {
@@ -352,6 +376,7 @@ export default function Navbar({ user, setUser, loading }) {
                           >
                             <p className="text-sm text-gray-900 font-medium">
                               {notif.title || notif.text}
+                              {notif.metadata?.count > 1 && ` (×${notif.metadata.count})`}
                             </p>
                             {notif.message && (
                               <p className="text-xs text-gray-600 mt-0.5">{notif.message}</p>
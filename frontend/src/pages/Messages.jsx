@@ -2,6 +2,7 @@ import { useState, useEffect, useRef } from 'react';
 import { useSearchParams } from 'react-router-dom';
 import { Search, Upload, X, Send, Paperclip, Download } from 'lucide-react';
 import { messagesAPI } from '../api/messages';
+import { openEventStream } from '../api/stream';
 import client from '../api/client';
 
 export default function Messages({ user }) {
@@ -17,6 +18,9 @@ export default function Messages({ user }) {
   const messagesEndRef = useRef(null);
   const messagesContainerRef = useRef(null);
   const justOpenedRef = useRef(false);
+  const selectedUserRef = useRef(null);
+  // False once the server says it can't stream; then we poll instead
+  const [streaming, setStreaming] = useState(true);
   
   const [searchParams] = useSearchParams();
 
@@ -27,8 +31,26 @@ export default function Messages({ user }) {
 
   useEffect(() => {
     loadConversations();
-    const conversationInterval = setInterval(loadConversations, 5000);
-    return () => clearInterval(conversationInterval);
+
+    // New messages are pushed over SSE; poll only if the server can't stream
+    let conversationInterval = null;
+    const closeStream = openEventStream(
+      '/messages/stream/',
+      { message: handleStreamedMessage },
+      {
+        onUnavailable: () => {
+          setStreaming(false);
+          if (!conversationInterval) {
+            conversationInterval = setInterval(loadConversations, 5000);
+          }
+        },
+      }
+    );
+
+    return () => {
+      closeStream();
+      clearInterval(conversationInterval);
+    };
   }, []);
 
   // Handle URL parameter to auto-select conversation
@@ -68,6 +90,7 @@ export default function Messages({ user }) {
   };
 
   useEffect(() => {
+    selectedUserRef.current = selectedUser;
     if (selectedUser) {
       justOpenedRef.current = true;
       loadMessages();
@@ -77,10 +100,12 @@ export default function Messages({ user }) {
         if (el) el.scrollTo({ top: el.scrollHeight, behavior: 'auto' });
       }, 100);
 
-      const interval = setInterval(loadMessages, 3000);
-      return () => clearInterval(interval);
+      if (!streaming) {
+        const interval = setInterval(loadMessages, 3000);
+        return () => clearInterval(interval);
+      }
     }
-  }, [selectedUser]);
+  }, [selectedUser, streaming]);
 
   useEffect(() => {
     const el = messagesContainerRef.current;
@@ -132,6 +157,24 @@ export default function Messages({ user }) {
     }
   };
 
+  const handleStreamedMessage = (message) => {
+    const open = selectedUserRef.current;
+    if (open && (message.sender === open.id || message.recipient === open.id)) {
+      setMessages((prev) =>
+        prev.some((m) => m.id === message.id) ? prev : [...prev, message]
+      );
+      if (message.sender === open.id) {
+        // Fetching the thread marks it read; after_id keeps the response empty
+        messagesAPI
+          .getWithUser(open.id, { after_id: message.id })
+          .then(loadConversations)
+          .catch((err) => console.error('Failed to mark messages read:', err));
+        return;
+      }
+    }
+    loadConversations();
+  };
+
   const searchUsers = async () => {
     try {
       const response = await client.get('/messages/search_users/', {
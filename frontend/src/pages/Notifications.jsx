@@ -213,6 +213,7 @@ export default function Notifications() {
                     <div>
                       <p className="text-sm font-semibold text-gray-900">
                         {n.title || 'Notification'}
+                        {n.metadata?.count > 1 && ` (×${n.metadata.count})`}
                       </p>
                       {n.message && (
                         <p className="text-xs text-gray-700 mt-1">